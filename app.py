@@ -19,6 +19,8 @@ from dharma_sindhu_saga import chapter_0_syllabus as dharma_syllabus
 from dharma_sindhu_saga import chapter_1 as dharma_chapter_1
 from dharma_sindhu_saga import chapter_2 as dharma_chapter_2
 
+from utils import metrics, profiler, recorder, search
+
 
 # --- MANDATORY HELPER FUNCTION (from LESSON_DESIGN_GUIDE.md) ---
 # This should ideally be in a utils/plotting.py file, but is included here for simplicity.
@@ -36,16 +38,29 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Opt-in rerun profiler (enable with ?profile=1 or LESSON_PROFILE=1); see utils/profiler.py.
+profiler.start_run()
+# Opt-in interaction recorder (enable with ?record=1 or LESSON_RECORD=1); see utils/recorder.py.
+recorder.start_run()
+# Process-wide metrics (enable with LESSON_METRICS_PORT or LESSON_METRICS_FILE); see utils/metrics.py.
+metrics.start_run()
+
 # --- SIDEBAR - TOP LEVEL NAVIGATION ---
 st.sidebar.title("🌌 The Grand Library")
 st.sidebar.markdown("Select your learning saga below.")
 
+# Deep links from search results (?chapter=<module>#<section>); see utils/search.py.
+linked_chapter = search.open_deep_link()
+
 # Top-level navigation to choose the learning path (Saga)
 learning_path = st.sidebar.radio(
     "Choose your Saga:",
-    ("Eigen-Verse Explorer", "The Streamlit Saga", "The Dharma-Kshetra Saga")
+    ("Eigen-Verse Explorer", "The Streamlit Saga", "The Dharma-Kshetra Saga"),
+    key=search.SAGA_KEY
 )
 
+search.search_box()
+
 st.sidebar.markdown("---")
 
 
@@ -67,6 +82,7 @@ if learning_path == "Eigen-Verse Explorer":
         "Chapter 6: Inverse of a Matrix": chapter_6.render
     }
 
+    search.select_linked_chapter(linked_chapter, chapters, "eigen_verse_chapters")
     selected_chapter_name = st.sidebar.radio(
         "Select a Chapter:",
         chapters.keys(),
@@ -107,6 +123,7 @@ elif learning_path == "The Streamlit Saga":
         # Future Streamlit chapters will be added here
     }
 
+    search.select_linked_chapter(linked_chapter, streamlit_chapters, "streamlit_saga_chapters")
     selected_chapter_name = st.sidebar.radio(
         "Select a Chapter:",
         streamlit_chapters.keys(),
@@ -134,6 +151,7 @@ elif learning_path == "The Dharma-Kshetra Saga":
         #"Chapter 6: The Land of Destiny": dharma_chapter_6.render
     }
 
+    search.select_linked_chapter(linked_chapter, dharma_chapters, "dharma_saga_chapters")
     selected_chapter_name = st.sidebar.radio(
         "Select a Chapter:",
         dharma_chapters.keys(),
@@ -147,4 +165,7 @@ elif learning_path == "The Dharma-Kshetra Saga":
 
 # --- COMMON SIDEBAR FOOTER ---
 st.sidebar.markdown("---")
-st.sidebar.info("Created by an AI with a passion for visual learning.")
\ No newline at end of file
+st.sidebar.info("Created by an AI with a passion for visual learning.")
+
+metrics.finish_run(learning_path, selected_chapter_name)
+profiler.finish_run(page=f"{learning_path} / {selected_chapter_name}")
\ No newline at end of file
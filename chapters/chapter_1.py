@@ -4,6 +4,13 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 from utils.plotting import plot_vectors, setup_plot
+from utils.controls import control_panel
+from utils.lesson import lesson_part, rerun_part
+from utils.static import static_figure
+from utils.randomness import generator
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
 
 def render():
     """
@@ -13,6 +20,28 @@ def render():
 
     st.header("Chapter 1: A Map, A Bridge, and a Shortcut 🧭")
 
+    part_analogy()
+    part_mechanism()
+    part_formalization()
+    part_games()
+    part_horizon()
+    part_pariksha()
+
+
+# The Treasure Map never changes, so it is drawn once per server (see utils/static.py).
+@static_figure
+def treasure_map():
+    fig, ax = plt.subplots()
+    ax.quiver(0, 0, 4, 3, angles='xy', scale_units='xy', scale=1, color='brown', label='The Pirate\'s Instruction')
+    ax.scatter(0, 0, color='green', s=150, zorder=3, marker='P', label='Old Oak Tree')
+    ax.scatter(4, 3, color='gold', s=150, zorder=3, marker='X', label='Treasure!')
+    setup_plot(ax, "The Treasure Map", xlim=(-1, 6), ylim=(-1, 6))
+    ax.legend()
+    return fig
+
+
+@lesson_part("Analogy")
+def part_analogy():
     # --- 1. THE CORE IDEA (A TREASURE MAP) ---
     st.markdown("""
     Forget everything you *think* you know about vectors. Let's start with something simpler: a treasure map.
@@ -23,51 +52,40 @@ def render():
     col1, col2 = st.columns([1, 1.2])
 
     with col1:
-        st.markdown("""
-        That single instruction—which has both a **distance** and a **direction**—is the secret behind our first big idea. It's a complete package. It tells you exactly where to go.
-        
-        That's it. That's the core concept.
-        
-        Mathematicians, being fans of fancy words, call this special type of instruction a **vector**.
-        
-        So, a vector isn't a scary thing. It's just a pirate's instruction.
-        """)
+        prose("analogy", "intro")
         st.info("💡 **Aha! Moment:** A vector is just an instruction with a magnitude (how far) and a direction (which way).")
 
     with col2:
-        fig, ax = plt.subplots()
-        ax.quiver(0, 0, 4, 3, angles='xy', scale_units='xy', scale=1, color='brown', label='The Pirate\'s Instruction')
-        ax.scatter(0, 0, color='green', s=150, zorder=3, marker='P', label='Old Oak Tree')
-        ax.scatter(4, 3, color='gold', s=150, zorder=3, marker='X', label='Treasure!')
-        setup_plot(ax, "The Treasure Map", xlim=(-1, 6), ylim=(-1, 6))
-        ax.legend()
-        st.pyplot(fig)
+        treasure_map()
     
     st.divider()
 
+
+@lesson_part("Mechanism")
+def part_mechanism():
     # --- 2. A COMPLICATION (THE WOBBLY BRIDGE) ---
     st.subheader("The Adventure Gets Complicated...")
-    st.markdown("""
-    Okay, you follow the instruction. But to get there, you have to cross a wobbly rope bridge over a river. As you walk across, the bridge itself is being pushed sideways by a strong wind!
-
-    So now you have **two instructions** happening at the same time:
-    1.  **Your walking instruction** (where you *try* to go).
-    2.  **The wind's push instruction** (where the bridge *drags* you).
-
-    Where do you actually end up? Let's find out! Use the sliders to change your walk and the wind's push. The green arrow shows your **actual path**—the shortcut from start to finish.
-    """)
+    prose("mechanism", "wobbly-bridge")
 
     col3, col4 = st.columns([1, 1.2])
 
     with col3:
-        st.markdown("##### Your Controls")
-        walk_x = st.slider("Your Walk (East/West)", -5.0, 5.0, 4.0, 0.1, key="c1_walk_x")
-        walk_y = st.slider("Your Walk (North/South)", -5.0, 5.0, 3.0, 0.1, key="c1_walk_y")
-        wind_x = st.slider("Wind's Push (East/West)", -5.0, 5.0, 1.0, 0.1, key="c1_wind_x")
-        wind_y = st.slider("Wind's Push (North/South)", -5.0, 5.0, -2.0, 0.1, key="c1_wind_y")
-
-        v_walk = np.array([walk_x, walk_y])
-        v_wind = np.array([wind_x, wind_y])
+        # A live panel inside this isolated part: a change reruns only the Mechanism part.
+        controls = control_panel(
+            "c1_bridge_panel",
+            [
+                dict(label="Your Walk (East/West)", min_value=-5.0, max_value=5.0, value=4.0, step=0.1, key="c1_walk_x"),
+                dict(label="Your Walk (North/South)", min_value=-5.0, max_value=5.0, value=3.0, step=0.1, key="c1_walk_y"),
+                dict(label="Wind's Push (East/West)", min_value=-5.0, max_value=5.0, value=1.0, step=0.1, key="c1_wind_x"),
+                dict(label="Wind's Push (North/South)", min_value=-5.0, max_value=5.0, value=-2.0, step=0.1, key="c1_wind_y"),
+            ],
+            mode="live",
+            title="##### Your Controls",
+            border=False,
+        )
+
+        v_walk = np.array([controls["c1_walk_x"], controls["c1_walk_y"]])
+        v_wind = np.array([controls["c1_wind_x"], controls["c1_wind_y"]])
         v_result = v_walk + v_wind
 
         st.success(f"**Your final path (the 'shortcut' vector):** `[{v_result[0]:.1f}, {v_result[1]:.1f}]`")
@@ -89,22 +107,12 @@ def render():
 
     st.divider()
 
+
+@lesson_part("Formalization")
+def part_formalization():
     # --- 3. FROM PICTURES TO NUMBERS ---
     st.subheader("Talking to the Machine: The Language of Vectors")
-    st.markdown("""
-    Drawing arrows is great for our brains, but computers prefer numbers. So, we translate our pirate instructions into a simple code: `[East/West, North/South]`.
-
-    - `Your Walk: [4, 3]` means "4 East, 3 North."
-    - `Wind's Push: [1, -2]` means "1 East, 2 South."
-
-    And here’s the most beautiful part. To find the final path, you just add the numbers!
-    
-    - **East/West parts:** `4 + 1 = 5`
-    - **North/South parts:** `3 + (-2) = 1`
-    - **Resulting Path:** `[5, 1]`
-
-    This is called **vector addition**. You just add the corresponding components. Try it yourself with the calculator below!
-    """)
+    prose("formalization", "vector-notation")
     
     col5, col6 = st.columns(2)
     with col5:
@@ -122,29 +130,28 @@ def render():
 
     st.divider()
 
+
+@lesson_part("Games")
+def part_games():
     # --- 4. THE GAME (VECTOR LANDER) ---
     st.subheader("Game Time: Vector Lander 🚀")
-    st.markdown("""
-    You're the pilot of a spaceship. Your mission is to land on the red target planet.
-    
-    **The Catch:** You're flying through an asteroid field that constantly pushes your ship (the **blue vector**). You only control your engine's **boost** (the **orange vector**).
-    
-    Your ship's final path will be the **SUM** of the asteroid push and your engine boost. Can you choose the right boost to land on the target?
-    """)
+    prose("games", "vector-lander")
     
     # Initialize game state
     if 'vl_target' not in st.session_state:
-        st.session_state.vl_target = np.random.uniform(-4, 4, 2)
-        st.session_state.vl_asteroid = np.random.uniform(-2, 2, 2)
+        rng = generator(f"{__name__}/vector_lander")
+        st.session_state.vl_target = rng.uniform(-4, 4, 2)
+        st.session_state.vl_asteroid = rng.uniform(-2, 2, 2)
         st.session_state.vl_attempts = 0
         st.session_state.vl_won = False
 
     if st.button("Generate New Target & Asteroid Field"):
-        st.session_state.vl_target = np.random.uniform(-4, 4, 2)
-        st.session_state.vl_asteroid = np.random.uniform(-2, 2, 2)
+        rng = generator(f"{__name__}/vector_lander")
+        st.session_state.vl_target = rng.uniform(-4, 4, 2)
+        st.session_state.vl_asteroid = rng.uniform(-2, 2, 2)
         st.session_state.vl_attempts = 0
         st.session_state.vl_won = False
-        st.rerun()
+        rerun_part()
 
     game_col1, game_col2 = st.columns([1, 1.2])
 
@@ -190,25 +197,18 @@ def render():
 
     st.divider()
 
+
+@lesson_part("Horizon")
+def part_horizon():
     # --- 5. WHAT'S NEXT? (NEW SECTION) ---
     st.subheader("Your Journey Has Just Begun... ✨")
-    st.markdown("""
-    Congratulations, Explorer! You've mastered the first fundamental secret of this universe: **any number of 'instructions' can be combined into a single, final instruction.** This is the essence of vector addition.
-    
-    You might be thinking, "Cool, I can add arrows. So what?"
-    
-    Well, you've just unlocked the language to describe...
-    - 🎮 **Physics in Video Games:** How does a character jump while moving forward? It's a `jump_vector + move_vector`! How does a rocket steer in space? `thrust_vector + gravity_vector`.
-    - 🎨 **Computer Graphics:** How does a 3D model get rotated or scaled on your screen? Every point (vertex) on the model is a vector, and these vectors are being manipulated.
-    - 🤖 **Machine Learning:** How does an algorithm group similar data points? It often treats data as vectors in a high-dimensional space and measures the "distance" and "direction" between them.
-
-    The next question is even more exciting: What if we could build a *machine* that transforms **every single vector** in the universe all at once, in a predictable way? A machine that could stretch, shrink, or rotate the very fabric of space?
-    
-    Such a machine exists. It's called a **Matrix**, and it's what we'll explore in **Chapter 2**.
-    """)
+    prose("horizon", "summary")
 
     st.divider()
-    
+
+
+@lesson_part("Pariksha")
+def part_pariksha():
     # --- 6. KNOWLEDGE CHECK ---
     st.subheader("Check Your Bearings 🧠")
     
@@ -226,4 +226,4 @@ def render():
         if q2_ans == "`[4, 3]`":
             st.success("Exactly! The Eastward movement (4) is the first component, and the Northward movement (3) is the second.")
         else:
-            st.error("Not quite. Remember the format is `[East/West, North/South]`. The wind is the East component.")
\ No newline at end of file
+            st.error("Not quite. Remember the format is `[East/West, North/South]`. The wind is the East component.")
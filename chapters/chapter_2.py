@@ -4,7 +4,14 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 from utils.plotting import setup_plot
+from utils.controls import control_panel
+from utils.lesson import lesson_part
+from utils.lazy import lazy_tabs
+from utils.randomness import choice
 import urllib.parse
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
 
 # --- HELPER FUNCTIONS ---
 
@@ -23,11 +30,29 @@ def plot_warped_grid(ax, T, grid_range=10):
         p1 = T @ np.array([-grid_range, i]); p2 = T @ np.array([grid_range, i])
         ax.plot([p1[0], p2[0]], [p1[1], p2[1]], color='gray', linestyle='--', linewidth=0.5, zorder=0)
 
+# The little house that every transformation in this chapter is applied to.
+HOUSE_POINTS = np.array([[0,0], [0,2], [1.5, 3], [3,2], [3,0], [0,0], [1,0], [1,1], [2,1], [2,0]]).T
+
 # --- MAIN RENDER FUNCTION ---
 
 def render():
     st.header("Chapter 2: The Cosmic Warp Field 🌀")
 
+    part_analogy()
+    T = part_mechanism()
+    part_gallery()
+    part_formalization(T)
+    part_games(T)
+
+    # --- 6. & 7. HORIZON & QUIZ ---
+    lazy_tabs("c2_final_tabs", {
+        "What's Next? ✨": part_horizon,
+        "Knowledge Check 🧠": part_pariksha,
+    }, keep={"Knowledge Check 🧠": ("c2_q1", "c2_q2")})
+
+
+@lesson_part("Analogy")
+def part_analogy():
     # --- 1. THE CORE IDEA (THE ANALOGY) ---
     st.markdown("""
     In the last chapter, we learned that vectors are like instructions. Now, imagine we stumble upon a strange cosmic anomaly: a **Warp Field**. This field distorts the very fabric of space itself. Everything changes in a consistent, predictable way.
@@ -35,38 +60,39 @@ def render():
     st.info("💡 **Aha! Moment:** Instead of changing one vector, what if we could apply a rule that changes *all* vectors in the universe at once?")
     st.divider()
 
+
+@lesson_part("Mechanism", isolated=False)
+def part_mechanism():
     # --- 2. THE MECHANISM (INTERACTIVE DISCOVERY) ---
     st.subheader("Interactive Discovery: Steering the Universe")
-    st.markdown("""
-    To control the Warp Field, we only need to "steer" the two fundamental directions of space: **East** (`[1, 0]`) and **North** (`[0, 1]`).
-    
-    Instead of sliders, let's use a more intuitive control panel. For each fundamental direction, you will set its new **Angle** and **Magnitude (Length)**.
-    """)
+    prose("mechanism", "basis-steering")
 
-    # Initialize session state for our new controls
-    if 'c2_ang_i' not in st.session_state:
-        st.session_state.c2_ang_i = 0.0
-        st.session_state.c2_mag_i = 1.0
-        st.session_state.c2_ang_j = 90.0
-        st.session_state.c2_mag_j = 1.0
+    # Initialize session state for our new controls (the slider keys themselves, so presets can move them)
+    if 'c2_sl_ang_i' not in st.session_state:
+        st.session_state.c2_sl_ang_i = 0.0
+        st.session_state.c2_sl_mag_i = 1.0
+        st.session_state.c2_sl_ang_j = 90.0
+        st.session_state.c2_sl_mag_j = 1.0
 
     col1, col2 = st.columns([1, 1.5])
     
     with col1:
-        st.markdown("##### Warp Control Panel")
-        with st.container(border=True):
-            st.markdown("**1. New 'East' Vector Controls**")
-            # We get the value from session state, which allows buttons to update it
-            ang_i = st.slider("Angle (degrees)", 0.0, 360.0, st.session_state.c2_ang_i, 1.0, key="c2_sl_ang_i")
-            mag_i = st.slider("Magnitude (Length)", 0.0, 2.5, st.session_state.c2_mag_i, 0.1, key="c2_sl_mag_i")
-            # Update session state with the latest slider values
-            st.session_state.c2_ang_i, st.session_state.c2_mag_i = ang_i, mag_i
-
-        with st.container(border=True):
-            st.markdown("**2. New 'North' Vector Controls**")
-            ang_j = st.slider("Angle (degrees)", 0.0, 360.0, st.session_state.c2_ang_j, 1.0, key="c2_sl_ang_j")
-            mag_j = st.slider("Magnitude (Length)", 0.0, 2.5, st.session_state.c2_mag_j, 0.1, key="c2_sl_mag_j")
-            st.session_state.c2_ang_j, st.session_state.c2_mag_j = ang_j, mag_j
+        # A live panel: the warp reshapes as you drag, but the page reruns at a capped rate.
+        warp = control_panel(
+            "c2_warp_panel",
+            [
+                "**1. New 'East' Vector Controls**",
+                dict(label="Angle (degrees)", min_value=0.0, max_value=360.0, step=1.0, key="c2_sl_ang_i"),
+                dict(label="Magnitude (Length)", min_value=0.0, max_value=2.5, step=0.1, key="c2_sl_mag_i"),
+                "**2. New 'North' Vector Controls**",
+                dict(label="Angle (degrees)", min_value=0.0, max_value=360.0, step=1.0, key="c2_sl_ang_j"),
+                dict(label="Magnitude (Length)", min_value=0.0, max_value=2.5, step=0.1, key="c2_sl_mag_j"),
+            ],
+            mode="live",
+            title="##### Warp Control Panel",
+        )
+        ang_i, mag_i = warp["c2_sl_ang_i"], warp["c2_sl_mag_i"]
+        ang_j, mag_j = warp["c2_sl_ang_j"], warp["c2_sl_mag_j"]
 
     # Convert our intuitive Angle/Magnitude controls to Cartesian (x,y) coordinates for the matrix
     rad_i = np.deg2rad(ang_i)
@@ -78,13 +104,12 @@ def render():
     T = np.array([new_i, new_j]).T # Each vector is a column
 
     with col2:
-        house_points = np.array([[0,0], [0,2], [1.5, 3], [3,2], [3,0], [0,0], [1,0], [1,1], [2,1], [2,0]]).T
-        transformed_house = T @ house_points
+        transformed_house = T @ HOUSE_POINTS
         fig, ax = plt.subplots(figsize=(8, 8))
         
         plot_warped_grid(ax, T)
-        ax.plot(house_points[0, :6], house_points[1, :6], 'b-', label='Original House', alpha=0.3)
-        ax.plot(house_points[0, 6:], house_points[1, 6:], 'b-', alpha=0.3)
+        ax.plot(HOUSE_POINTS[0, :6], HOUSE_POINTS[1, :6], 'b-', label='Original House', alpha=0.3)
+        ax.plot(HOUSE_POINTS[0, 6:], HOUSE_POINTS[1, 6:], 'b-', alpha=0.3)
         ax.plot(transformed_house[0, :6], transformed_house[1, :6], 'r-', label='Warped House', linewidth=2)
         ax.plot(transformed_house[0, 6:], transformed_house[1, 6:], 'r-', linewidth=2)
         
@@ -98,17 +123,21 @@ def render():
         ax.legend()
         st.pyplot(fig)
     st.divider()
+    return T
 
+
+@lesson_part("Gallery", isolated=False)
+def part_gallery():
     # --- 3. THE GALLERY (PRESETS & EXPLORATION) ---
     st.subheader("Gallery of Famous Transformations")
     st.markdown("See standard transformations in action! Click a preset button to configure the Warp Field, then see what happens. You can also search for more examples.")
     
     # Define Preset Callbacks
     def set_preset(mag_i, ang_i, mag_j, ang_j):
-        st.session_state.c2_mag_i = mag_i
-        st.session_state.c2_ang_i = ang_i
-        st.session_state.c2_mag_j = mag_j
-        st.session_state.c2_ang_j = ang_j
+        st.session_state.c2_sl_mag_i = mag_i
+        st.session_state.c2_sl_ang_i = ang_i
+        st.session_state.c2_sl_mag_j = mag_j
+        st.session_state.c2_sl_ang_j = ang_j
 
     g_col1, g_col2, g_col3, g_col4 = st.columns(4)
     with g_col1:
@@ -124,13 +153,19 @@ def render():
         st.button("Reflect Y-Axis", on_click=set_preset, args=(1.0, 180.0, 1.0, 90.0), use_container_width=True)
         image_search_button("Reflection", "reflection matrix transformation")
     st.divider()
-    
+
+
+@lesson_part("Formalization")
+def part_formalization(T):
     # --- 4. THE FORMALIZATION ---
     st.subheader("The Machine's Secret Code: The Matrix")
     st.markdown(f"The 'settings' for the Warp Field are stored in a **Matrix**. A matrix simply stores the destination vectors for 'East' and 'North' as its columns:")
     st.latex(f"T = \\begin{{bmatrix}} {T[0,0]:.2f} & {T[0,1]:.2f} \\\\ {T[1,0]:.2f} & {T[1,1]:.2f} \\end{{bmatrix}}")
     st.divider()
 
+
+@lesson_part("Games")
+def part_games(T):
     # --- 5. THE APPLICATION (THE GAME) ---
     st.subheader("Game Time: Shape Shifter 👽")
     # (The rest of the chapter from the previous version remains largely the same and fits well)
@@ -145,7 +180,7 @@ def render():
     def new_challenge():
         current_name = st.session_state.c2_target_name
         possible_names = [name for name in targets if name != current_name]
-        new_name = np.random.choice(possible_names)
+        new_name = choice(possible_names, f"{__name__}/shape_shifter")
         st.session_state.c2_target_name = new_name
         st.session_state.c2_target_matrix = targets[new_name]
 
@@ -153,7 +188,8 @@ def render():
     st.info(f"Current Challenge: **{st.session_state.c2_target_name}**")
     
     target_matrix = st.session_state.c2_target_matrix
-    target_house = target_matrix @ house_points
+    target_house = target_matrix @ HOUSE_POINTS
+    transformed_house = T @ HOUSE_POINTS
 
     fig_game, ax_game = plt.subplots()
     ax_game.plot(transformed_house[0, :6], transformed_house[1, :6], 'r-', label='Your Warped House', linewidth=3)
@@ -168,17 +204,20 @@ def render():
         st.balloons(); st.success("Perfect Match! The client is pleased!")
     st.divider()
 
-    # --- 6. & 7. HORIZON & QUIZ ---
-    final_tab1, final_tab2 = st.tabs(["What's Next? ✨", "Knowledge Check 🧠"])
-    with final_tab1:
-        st.subheader("A Puzzling Question... 🤔")
-        st.markdown("""Some transformations make the house **bigger**, while others make it **smaller**. Is there a single "magic number" that tells us *how much a matrix scales area*? There is. It's called the **Determinant**, and it's the secret we'll uncover in **Chapter 3**.""")
-    with final_tab2:
-        st.subheader("Check Your Bearings")
-        st.markdown("**Question 1:** The most fundamental way to define a 2x2 matrix transformation is by knowing...")
-        q1_ans = st.radio("", ["Its four numbers: a, b, c, and d.", "Where the vectors `[1,0]` and `[0,1]` land after the transformation.", "Whether it rotates or stretches things."], key="c2_q1", index=None)
-        if "Where the vectors" in str(q1_ans): st.write("✅ Correct! The four numbers just store that essential information.")
-
-        st.markdown("**Question 2:** A matrix is defined as `T = [[2, 0], [0, 2]]`. What effect will this have?")
-        q2_ans = st.radio("", ["Rotation", "Shear", "Scale twice as large", "No effect"], key="c2_q2", index=None)
-        if "Scale twice as large" in str(q2_ans): st.write("✅ Correct! The 'East' vector `[1,0]` goes to `[2,0]`, and 'North' `[0,1]` goes to `[0,2]`.")
\ No newline at end of file
+
+@lesson_part("Horizon")
+def part_horizon():
+    st.subheader("A Puzzling Question... 🤔")
+    st.markdown("""Some transformations make the house **bigger**, while others make it **smaller**. Is there a single "magic number" that tells us *how much a matrix scales area*? There is. It's called the **Determinant**, and it's the secret we'll uncover in **Chapter 3**.""")
+
+
+@lesson_part("Pariksha")
+def part_pariksha():
+    st.subheader("Check Your Bearings")
+    st.markdown("**Question 1:** The most fundamental way to define a 2x2 matrix transformation is by knowing...")
+    q1_ans = st.radio("", ["Its four numbers: a, b, c, and d.", "Where the vectors `[1,0]` and `[0,1]` land after the transformation.", "Whether it rotates or stretches things."], key="c2_q1", index=None)
+    if "Where the vectors" in str(q1_ans): st.write("✅ Correct! The four numbers just store that essential information.")
+
+    st.markdown("**Question 2:** A matrix is defined as `T = [[2, 0], [0, 2]]`. What effect will this have?")
+    q2_ans = st.radio("", ["Rotation", "Shear", "Scale twice as large", "No effect"], key="c2_q2", index=None)
+    if "Scale twice as large" in str(q2_ans): st.write("✅ Correct! The 'East' vector `[1,0]` goes to `[2,0]`, and 'North' `[0,1]` goes to `[0,2]`.")
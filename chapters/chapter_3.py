@@ -5,6 +5,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon, FancyArrowPatch
 from utils.plotting import setup_plot, image_search_button # Assumes both are in plotting.py
+from utils.controls import control_panel
+from utils.lesson import lesson_part
+from utils.assets import asset_image
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
 
 def render():
     """
@@ -16,61 +22,51 @@ def render():
     st.title("Chapter 3: The Atma of the Matrix (The Determinant)")
     st.markdown("---")
 
+    part_analogy()
+    T, det_T = part_mechanism()
+    part_gallery()
+    part_formalization(T, det_T)
+    part_games(det_T)
+    part_horizon()
+    part_pariksha()
+
+
+@lesson_part("Analogy")
+def part_analogy():
     # ==============================================================================
     # PART 1: THE CORE IDEA (THE ANALOGY)
     # ==============================================================================
     st.header("Part 1: The Secret of the Rangoli ✨")
-    st.markdown("""
-    Namaste! Let's begin not with dry numbers, but with something beautiful and familiar. Imagine you are in your family's courtyard during Diwali. Your mother or grandmother is creating a *Rangoli* or a *Kolam*. She starts with a simple chalk grid on the floor. On this grid, she decides to draw a beautiful square pattern, let's say one that covers a certain area—one square meter.
-
-    Now, imagine a mischievous god (like a friendly *Asura* who loves mathematics) comes along and casts a spell on the very fabric of the courtyard. This spell is a **Transformation**. The grid lines of the courtyard stretch and skew. The east-west lines might get closer, while the north-south lines might stretch and tilt.
-
-    The chalk of the Rangoli is magically bound to the grid lines. So, as the courtyard's grid shifts, the beautiful square pattern is also forced to stretch, skew, and morph into a new shape—a parallelogram.
-
-    The most important question is: **How much has the *area* of our Rangoli pattern changed?**
-
-    Did the spell double the space it takes up, making it grander? Did it squish it to half its size, making it more intricate? Did it, perhaps, flip the pattern over as if we are seeing its reflection in a pond?
-
-    Every magical spell—every *transformation*—has a secret number, a unique essence or *'Atma'*, that tells us exactly this. This number is its **Determinant**.
-
-    - If the new Rangoli covers **twice** the area, the determinant of the spell is **2**.
-    - If it's squished to **half** the area, the determinant is **0.5**.
-    - If the spell somehow **flips the orientation** of the Rangoli (imagine the pattern's top-right corner is now its top-left), the determinant becomes **negative**. A determinant of **-1** means it flipped but kept the same area.
-    - And here is the most profound part: What if the spell is so powerful that it squishes the entire two-dimensional Rangoli into a single, straight line? The pattern is ruined! It has **zero area**. In this case, the determinant of the spell is **0**. This is a special, irreversible kind of magic.
-
-    The Determinant isn't just a number. It is the measure of the transformation's power to scale area. It is the soul, the *Atma*, of the matrix. Let's build a machine to explore this magic.
-    """)
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Kolam_in_Tamil_Nadu.JPG/1280px-Kolam_in_Tamil_Nadu.JPG", caption="A traditional Kolam, whose area we can imagine transforming. The geometry is the key.")
+    prose("analogy", "rangoli")
+    asset_image("https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Kolam_in_Tamil_Nadu.JPG/1280px-Kolam_in_Tamil_Nadu.JPG", caption="A traditional Kolam, whose area we can imagine transforming. The geometry is the key.")
 
 
+@lesson_part("Mechanism", isolated=False)
+def part_mechanism():
     # ==============================================================================
     # PART 2: THE MECHANISM (THE TRANSFORMATION ENGINE)
     # ==============================================================================
     st.header("Part 2: The Yantra of Transformation")
-    st.markdown("""
-    Let's build a machine, a *Yantra*, to control this space-bending magic ourselves. This machine is controlled by a **Matrix**. Think of the matrix as the four magic numbers that define the entire spell.
-
-    Below, you have a visualization.
-    - The **Blue Square** is our original Rangoli pattern. It sits on the original, perfect grid. Its area is exactly 1.
-    - The **Red Shape** is the transformed Rangoli after the spell. Notice how it's now a parallelogram.
-    - On the left, you have four sliders. These are the controls for our Yantra, the four numbers in our 2x2 matrix.
-
-    **Your Mission:** Don't worry about the math yet. Just *play*. Be a curious child. Slide the controls and observe. Build an intuition for the cause and effect.
-
-    - What happens to the red area when you increase 'a' or 'd'?
-    - What do 'b' and 'c' do? They seem to introduce a 'tilt' or 'shear'.
-    - Watch the **Determinant** value. How does it correspond to the red area? See if you can intuitively feel when it's about to become positive, negative, or zero.
-    """)
+    prose("mechanism", "yantra")
 
     col1, col2 = st.columns([1, 2], gap="large")
 
     with col1:
         st.subheader("The Four Levers of the Yantra")
         st.latex("T = \\begin{bmatrix} a & b \\\\ c & d \\end{bmatrix}")
-        a = st.slider("Matrix element 'a' (Horizontal stretch of î)", -2.5, 2.5, 1.0, 0.1, key="c3_a")
-        b = st.slider("Matrix element 'b' (Horizontal stretch of ĵ)", -2.5, 2.5, 0.0, 0.1, key="c3_b")
-        c = st.slider("Matrix element 'c' (Vertical stretch of î)", -2.5, 2.5, 0.0, 0.1, key="c3_c")
-        d = st.slider("Matrix element 'd' (Vertical stretch of ĵ)", -2.5, 2.5, 1.0, 0.1, key="c3_d")
+        # A batched panel: set all four levers, then cast the spell once with a single rerun.
+        levers = control_panel(
+            "c3_yantra_panel",
+            [
+                dict(label="Matrix element 'a' (Horizontal stretch of î)", min_value=-2.5, max_value=2.5, value=1.0, step=0.1, key="c3_a"),
+                dict(label="Matrix element 'b' (Horizontal stretch of ĵ)", min_value=-2.5, max_value=2.5, value=0.0, step=0.1, key="c3_b"),
+                dict(label="Matrix element 'c' (Vertical stretch of î)", min_value=-2.5, max_value=2.5, value=0.0, step=0.1, key="c3_c"),
+                dict(label="Matrix element 'd' (Vertical stretch of ĵ)", min_value=-2.5, max_value=2.5, value=1.0, step=0.1, key="c3_d"),
+            ],
+            mode="batched",
+            submit_label="✨ Cast the Spell",
+        )
+        a, b, c, d = levers["c3_a"], levers["c3_b"], levers["c3_c"], levers["c3_d"]
 
         T = np.array([[a, b], [c, d]])
         det_T = np.linalg.det(T)
@@ -106,16 +102,13 @@ def render():
         ax.legend()
         st.pyplot(fig)
 
-    st.markdown("""
-    **A Deeper Intuition:** Look at the colored arrows, the **basis vectors**.
-    - The matrix column `[a, c]` is simply the new landing spot for the original blue vector `î`.
-    - The matrix column `[b, d]` is the new landing spot for the original green vector `ĵ`.
-    
-    The entire transformation, all the stretching and squishing of infinite space, is completely defined by just telling those two original vectors where to go! The area of the parallelogram formed by these two new vectors is *exactly* the determinant. The determinant is the area of the parallelogram spanned by the transformed basis vectors.
-    """)
+    prose("mechanism", "basis-intuition")
     st.markdown("---")
+    return T, det_T
 
 
+@lesson_part("Gallery")
+def part_gallery():
     # ==============================================================================
     # PART 3: THE GALLERY (SHOWCASING VARIETY)
     # ==============================================================================
@@ -130,32 +123,20 @@ def render():
 
     with tab1:
         st.subheader("The Identity Matrix: The 'Shanti' Mantra")
-        st.markdown("""
-        This is the spell of no change. It leaves everything as it is. It's the equivalent of chanting a mantra for peace, "Shanti, Shanti, Shanti." The original blue square and the red transformed one are perfectly on top of each other.
-        - The `î` vector `[1, 0]` stays at `[1, 0]`.
-        - The `ĵ` vector `[0, 1]` stays at `[0, 1]`.
-        The area doesn't change, so the determinant is **1**.
-        """)
+        prose("gallery", "identity")
         st.latex("I = \\begin{bmatrix} 1 & 0 \\\\ 0 & 1 \\end{bmatrix} \implies \\det(I) = 1")
         image_search_button("Sacred Geometry Yantra", "sri yantra sacred geometry")
 
     with tab2:
         st.subheader("The Scaling Matrix: The 'Vistar' Spell")
-        st.markdown("""
-        This spell, *Vistar* (meaning 'to expand'), uniformly grows or shrinks everything. If you make the diagonal elements 2, the area becomes 4 times larger! Think of zooming into a beautiful pattern on a pashmina shawl.
-        - The `î` vector `[1, 0]` goes to `[k, 0]`.
-        - The `ĵ` vector `[0, 1]` goes to `[0, k]`.
-        The area scales by the product of the diagonal elements.
-        """)
+        prose("gallery", "scaling")
         s = st.slider("Scaling factor 'k'", 0.0, 3.0, 1.5, 0.1, key='scale_k')
         st.latex(f"S = \\begin{{bmatrix}} {s} & 0 \\\\ 0 & {s} \\end{{bmatrix}} \implies \\det(S) = {s*s:.2f}")
         image_search_button("Jaipur Block Printing", "jaipur block printing patterns")
 
     with tab3:
         st.subheader("The Rotation Matrix: The 'Chakra' Spell")
-        st.markdown("""
-        This spell rotates the entire courtyard, like a spinning *Chakra* or a dancer performing a pirouette. Notice that no matter how much you rotate, the *area* of the Rangoli never changes. That's why the determinant of a pure rotation is always **1**. The orientation doesn't flip, so it's not -1.
-        """)
+        prose("gallery", "rotation")
         angle_deg = st.slider("Rotation angle 'θ' (in degrees)", -180.0, 180.0, 45.0, 1.0, key='rot_angle')
         angle_rad = np.deg2rad(angle_deg)
         cos_t, sin_t = np.cos(angle_rad), np.sin(angle_rad)
@@ -164,24 +145,22 @@ def render():
 
     with tab4:
         st.subheader("The Shear Matrix: The 'Tircha' Spell")
-        st.markdown("""
-        This spell, *Tircha* (meaning 'tilted' or 'askew'), pushes layers of space across each other, like a deck of cards being pushed from the side. Look at the designs in old Mughal architecture or some woven textiles; you'll see this shearing effect. It's fascinating that even though the shape is distorted, its area is preserved! The determinant remains **1**.
-        """)
+        prose("gallery", "shear")
         m = st.slider("Shearing factor 'm'", -2.0, 2.0, 1.0, 0.1, key='shear_m')
         st.latex(f"H = \\begin{{bmatrix}} 1 & {m} \\\\ 0 & 1 \\end{{bmatrix}} \implies \\det(H) = 1")
         image_search_button("Woven Ikat Patterns", "ikat textile patterns india")
 
     with tab5:
         st.subheader("The Singular Matrix: The 'Brahma's Arrow' Spell")
-        st.markdown("""
-        This is the most extreme spell. In the Mahabharata, a powerful weapon, a *Brahmastra*, could cause total devastation. A singular matrix is the mathematical equivalent: it takes all of two-dimensional space and collapses it onto a single line or even a single point. All area is annihilated.
-        The determinant is **0**. This is the mark of collapse. There is no going back from this; you cannot "un-collapse" a line back into a plane. The magic is irreversible.
-        """)
+        prose("gallery", "collapse")
         st.latex(f"Z = \\begin{{bmatrix}} 2 & 1 \\\\ 2 & 1 \\end{{bmatrix}} \implies \\det(Z) = (2)(1) - (1)(2) = 0")
         image_search_button("Line drawings", "one line drawing art")
 
     st.markdown("---")
 
+
+@lesson_part("Formalization")
+def part_formalization(T, det_T):
     # ==============================================================================
     # PART 4: THE FORMALIZATION (THE GANITA SHASTRA)
     # ==============================================================================
@@ -206,22 +185,18 @@ def render():
 
     Let's check with the matrix from our Yantra:
     """)
+    (a, b), (c, d) = T
     st.latex(f"T = \\begin{{bmatrix}} {a:.1f} & {b:.1f} \\\\ {c:.1f} & {d:.1f} \\end{{bmatrix}}")
     st.latex(f"\\det(T) = ({a:.1f} \\times {d:.1f}) - ({b:.1f} \\times {c:.1f}) = {a*d:.2f} - {b*c:.2f} = {det_T:.2f}")
     st.success(f"The formula matches our observed value: **{det_T:.2f}**")
 
     st.subheader("4.2. Expanding Our Universe: The 3x3 Determinant")
-    st.markdown("""
-    Our world isn't flat like a Rangoli. We live in three dimensions! We need a way to measure how a transformation scales **volume**. Imagine transforming a clay cube into some new 3D shape (a parallelepiped). The 3x3 determinant tells us the scaling factor for its volume.
-
-    One common method is the **Rule of Sarrus**, a visual mnemonic.
-    Given a matrix:
-    """)
+    prose("formalization", "three-dimensions")
     st.latex("M = \\begin{bmatrix} a & b & c \\\\ d & e & f \\\\ g & h & i \\end{bmatrix}")
     st.markdown("""
     To calculate its determinant, we write down the first two columns again to the right of the matrix:
     """)
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Sarrus_rule_v2.svg/300px-Sarrus_rule_v2.svg.png", caption="The Rule of Sarrus for 3x3 determinants.")
+    asset_image("https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Sarrus_rule_v2.svg/300px-Sarrus_rule_v2.svg.png", caption="The Rule of Sarrus for 3x3 determinants.", width=300)
     st.markdown("""
     Then we add the products of the 'downward' diagonals and subtract the products of the 'upward' diagonals.
     """)
@@ -229,21 +204,12 @@ def render():
     st.warning("This visual trick ONLY works for 3x3 matrices! For anything larger, we need a more powerful method, like cofactor expansion.")
 
     st.subheader("4.3. Fundamental Properties of Determinants (The Dharma)")
-    st.markdown("""
-    Determinants follow certain fundamental laws, a *Dharma*, that are universally true. Understanding these is key to mastery.
-
-    1.  **Identity Dharma (`det(I) = 1`):** The determinant of an identity matrix is always 1. This makes sense; an identity transformation doesn't change anything, so the area/volume scaling factor is 1.
-
-    2.  **Transpose Dharma (`det(Aᵀ) = det(A)`):** The determinant of a matrix is the same as its transpose. Swapping rows and columns doesn't change the underlying scaling behavior.
-        
-    3.  **Multiplication Dharma (`det(AB) = det(A)det(B)`):** This is the most magical! If you apply one transformation (B) and then another (A), the total scaling factor is just the product of their individual scaling factors. A spell that doubles area followed by one that triples it results in a total scaling of 2 * 3 = 6.
-
-    4.  **Row Swap Dharma:** If you swap two rows in a matrix, the determinant's sign flips (`det(B) = -det(A)`). This corresponds to flipping the orientation of space. Imagine swapping the places of the transformed `î` and `ĵ` vectors—it's like looking at the resulting parallelogram from the back.
-    
-    5.  **Scalar Multiple Dharma:** If you multiply one row by a scalar `k`, the determinant is multiplied by `k`. This is because you are stretching the resulting shape in one direction by that factor. If you multiply the *entire* n x n matrix by `k`, then `det(kA) = kⁿdet(A)`.
-    """)
+    prose("formalization", "properties")
     st.markdown("---")
 
+
+@lesson_part("Games")
+def part_games(det_T):
     # ==============================================================================
     # PART 5: THE APPLICATION (THE KHEL AND KASRAT)
     # ==============================================================================
@@ -254,11 +220,7 @@ def render():
 
     with game_tabs[0]:
         st.subheader("🚀 Game 1: The ISRO Launch Pad")
-        st.markdown("""
-        You are a scientist at ISRO, preparing to launch the next Mangalyaan mission. The launch requires a final transformation to orient the probe. If this transformation is **singular** (determinant = 0), the probe's coordinate system will collapse into a line, and the mission will fail catastrophically!
-
-        **Your Task:** Use the main Yantra controls in Part 2. Can you create **three different non-singular matrices**? One that expands the area, one that shrinks it, and one that flips it. The key is to avoid a determinant of 0 at all costs!
-        """)
+        prose("games", "isro-launch")
         if abs(det_T) < 0.01:
             st.error("🚨 LAUNCH ABORT! Determinant is zero! The coordinate space has collapsed. Try again!")
         elif det_T > 1:
@@ -270,11 +232,7 @@ def render():
 
     with game_tabs[1]:
         st.subheader("🎨 Game 2: The Jaipur Textile Artisan")
-        st.markdown("""
-        You are an artisan block-printing a beautiful saree. You have a square block of wood (area 1). The client wants a new parallelogram design that has a specific area.
-
-        **Your Task:** Use the main Yantra controls in Part 2 to create a transformation matrix whose determinant **exactly matches the target area** given below.
-        """)
+        prose("games", "saree-print")
         target_det = st.select_slider("Select a target design area (determinant):", options=[-2.0, -0.5, 1.5, 2.5], value=1.5)
         st.write(f"Your current determinant is: **{det_T:.2f}**")
         if abs(det_T - target_det) < 0.05:
@@ -285,11 +243,7 @@ def render():
 
     with game_tabs[2]:
         st.subheader(" ज्योतिष Game 3: The Astrologer's Puzzle")
-        st.markdown("""
-        An ancient astrologer has left behind a cryptic matrix. He says that for the stars to align, the determinant of his matrix must be zero. A crucial number, 'x', has been lost to time.
-
-        **Your Task:** Find the value of 'x' that makes the determinant of the following matrix equal to zero.
-        """)
+        prose("games", "astrologer")
         st.latex(r"A = \begin{bmatrix} 2 & 4 \\ 3 & x \end{bmatrix}")
         st.markdown(r"We need `det(A) = 0`, which means `(2)(x) - (4)(3) = 0`.")
         st.markdown(r"So, `2x - 12 = 0`. What must `x` be?")
@@ -318,43 +272,18 @@ def render():
     st.markdown("---")
 
 
+@lesson_part("Horizon")
+def part_horizon():
     # ==============================================================================
     # PART 6: THE HORIZON (THE JNANA-CHAKSHU)
     # ==============================================================================
     st.header("Part 6: The Eye of Knowledge (What's Next?)")
-    st.markdown("""
-    The determinant is not just an academic curiosity. It is a *Jnana-Chakshu*, an eye of knowledge, that helps us see deeper into the nature of systems. Its applications are vast and touch many aspects of modern Indian science and technology.
-
-    ### **Invertibility: Can We Reverse the Spell?**
-    This is the single most important application. A transformation can only be reversed if its determinant is **non-zero**.
-    - If `det(A) ≠ 0`, the matrix `A` has an **inverse**, written `A⁻¹`. This inverse is the "undo" spell. If you stretched the Rangoli, the inverse squishes it back perfectly.
-    - If `det(A) = 0`, the spell is irreversible. You've squashed the world into a line. There is no information on how to 'un-squash' it. This is why a determinant of zero is also called **singular**—it's a point of no return.
-
-    This concept is the bedrock of solving systems of linear equations. If the determinant of the coefficient matrix is non-zero, we know there is a unique solution.
-
-    ### **Cramer's Rule: A Formula for Solutions**
-    Named after Gabriel Cramer, this rule uses determinants to directly solve for the variables in a system of linear equations, like those used to model economic policies or circuit diagrams. While computationally expensive for large systems, it's a beautiful theoretical result. For a system `Ax = b`:
-    
-    `xᵢ = det(Aᵢ) / det(A)`
-    
-    where `Aᵢ` is the matrix `A` with the i-th column replaced by the vector `b`.
-
-    ### **Eigenvalues and Eigenvectors: The Soul's True Directions**
-    This is where it gets truly profound. For any given transformation, there are special vectors that do not change their direction—they only stretch. These are the *Eigenvectors* (the 'self-vectors'), and the amount they stretch by is the *Eigenvalue*. To find them, we must solve this characteristic equation:
-
-    `det(A - λI) = 0`
-
-    Here, `λ` is the eigenvalue we are looking for. We are literally searching for a value `λ` that makes the matrix `A - λI` singular! This is a cornerstone of modern data science, used in everything from **Google's PageRank** to analyzing stock market trends for an investment firm in Mumbai.
-
-    ### **Real-World Indian Applications:**
-    - **ISRO, Bengaluru**: When launching a satellite, its orientation in 3D space is controlled by rotation matrices. Calculating determinants ensures the orientation commands are valid and non-collapsing.
-    - **Bollywood VFX, Mumbai**: When a CGI artist creates a 3D model of a spaceship for a movie like *Brahmāstra*, every stretch, rotation, and movement is a matrix transformation. The determinant is used in the background rendering engine to calculate surface areas and volumes correctly for lighting and physics simulations.
-    - **Data Science, Hyderabad/Bengaluru**: Data scientists analyzing customer behavior use a tool called a **Covariance Matrix**. The determinant of this matrix, related to the "Generalized Variance," tells them how spread out the data is. A small determinant might imply strong correlation between variables (e.g., people who buy *samosas* also tend to buy *chai*).
-
-    The determinant tells us if a system has a unique, reversible state. This naturally leads us to our next chapter: **Inverse and Transpose of Matrices**, where we will learn how to actually compute the "undo" spell.
-    """)
+    prose("horizon", "invertibility")
     st.markdown("---")
 
+
+@lesson_part("Pariksha")
+def part_pariksha():
     # ==============================================================================
     # PART 7: THE CHECK-UP (THE PARIKSHA)
     # ==============================================================================
@@ -446,4 +375,4 @@ def render():
         if q5 == '10':
             st.success("Q5: Correct! You've mastered the Multiplication Dharma: `det(AB) = det(A)det(B)`. So, `2 * 5 = 10`.")
         else:
-            st.error("Q5: Revisit the 'Dharma' of multiplication. How do sequential spells combine their power?")
\ No newline at end of file
+            st.error("Q5: Revisit the 'Dharma' of multiplication. How do sequential spells combine their power?")
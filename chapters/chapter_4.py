@@ -4,7 +4,13 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import urllib.parse
-from scipy.linalg import schur
+from utils.lesson import lesson_part
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
+
+# The satellite's inertia tensor in the ISRO Stability Test.
+ISRO_INERTIA_TENSOR = np.array([[2, 0, 0], [0, 5, 0], [0, 0, 9]])
 
 # --- Mandatory Helper Function (as per guide) ---
 # This would typically be in utils/plotting.py but is included here for completeness.
@@ -21,34 +27,29 @@ def render():
     """
     st.title("Chapter 4: The Unchanging Path — Eigenvectors & Eigenvalues")
 
-    # --- Part 1: The Core Idea (The Analogy) ---
-    st.header("Part 1: The Core Idea — The Path of Dharma", divider="rainbow")
-    st.markdown("""
-    Imagine a great warrior-prince in the midst of the epic Kurukshetra war. The world around him is a storm of chaos—a swirling, twisting battlefield. Chariots clash, arrows fly, and the very ground seems to warp and shift with the strategies of the opposing army. This battlefield is our **linear transformation**—a force that changes the position of every warrior, every rock, and every grain of dust.
-
-    The prince, however, is bound by his **Dharma**. His Dharma is not a physical location, but a sacred duty, an intrinsic path or principle that he must follow. No matter how the battlefield shifts, his core purpose remains steadfast.
-
-    - If the army charges east (a 'shear' transformation), knocking everyone sideways, the prince, following his Dharma, might move forward along his designated path, but he does so without deviating from his core direction.
-    - If the enemy lines expand (a 'scale' transformation), pushing everything outwards, his path remains true, though he may find himself covering more ground, his influence magnified.
+    part_analogy()
+    part_mechanism()
+    part_gallery()
+    part_formalization()
+    part_games()
+    part_horizon()
+    part_pariksha()
 
-    In this storm of transformation, most vectors (representing the paths of ordinary soldiers) are knocked off their original course. They point in new, unexpected directions after the transformation is applied. But there exists a special, almost magical direction—the prince's path of Dharma.
 
-    This path is the **Eigenvector**.
-    
-    When the transformation of the battlefield acts on the prince who is on this path, his direction does not change. He stays true to his line. He might be pushed further down that path (stretched) or find his advance shortened (shrunk), but his direction is unaltered. The amount by which he is stretched or shrunk is his **Eigenvalue**. It is the measure of the transformation's impact *along* his sacred path.
-
-    So, an Eigenvector is a special direction in space that is left unchanged by a transformation. An Eigenvalue is the scalar factor by which that vector is stretched or shrunk. Our mission in this chapter is not merely to find a mathematical curiosity, but to find the very soul of a transformation—its inherent, unchanging paths of Dharma.
-    """)
+@lesson_part("Analogy")
+def part_analogy():
+    # --- Part 1: The Core Idea (The Analogy) ---
+    st.header("Part 1: The Core Idea — The Path of Dharma", divider="rainbow")
+    prose("analogy", "warrior-prince")
     image_search_button("Kurukshetra Battlefield", "Kurukshetra war painting")
     image_search_button("Arjuna's Path of Dharma", "Arjuna chariot Krishna Mahabharata")
 
+
+@lesson_part("Mechanism")
+def part_mechanism():
     # --- Part 2: The Mechanism (Interactive Discovery) ---
     st.header("Part 2: The Mechanism — Finding the Path of Dharma", divider="rainbow")
-    st.markdown("""
-    Let's step onto the battlefield ourselves. Below is an interactive simulation. We have a transformation matrix `T`, which represents the 'rules of the battlefield'. We also have a blue vector `v`, which you control. When we apply the transformation, we get the red vector, `T*v`.
-
-    Your quest is to rotate the blue vector `v` and find the precise angle where it lines up perfectly with the red transformed vector `T*v`. When they are aligned, you have found an Eigenvector—a path of Dharma. The grid itself is also transformed to show you how the entire 'space' of the battlefield is being warped.
-    """)
+    prose("mechanism", "battlefield")
 
     col1, col2 = st.columns([1, 2])
     
@@ -108,6 +109,9 @@ def render():
     else:
         st.info("Keep searching! The red and blue arrows are not yet aligned. The path of Dharma awaits.")
 
+
+@lesson_part("Gallery")
+def part_gallery():
     # --- Part 3: The Gallery (Showcasing Variety) ---
     st.header("Part 3: The Gallery of Transformations", divider="rainbow")
     st.markdown("Not all transformations are the same. Each has its own unique 'unchanging paths'. Let's explore a gallery of different transformations and their corresponding Eigenvectors.")
@@ -142,6 +146,9 @@ def render():
         st.markdown("Any object already lying flat on the ground (a vector on the x-axis) casts a shadow that is exactly itself. It's an Eigenvector with Eigenvalue 1. A vertical object (a vector on the y-axis) is crushed into a single point at the origin. It's also an Eigenvector, but its Eigenvalue is 0!")
         image_search_button("Konark Sun Temple Sundial", "Konark Sun Temple wheel")
 
+
+@lesson_part("Formalization")
+def part_formalization():
     # --- Part 4: The Formalization (The Ganita Shastra) ---
     st.header("Part 4: The Ganita Shastra — The Mathematics of Dharma", divider="rainbow")
     st.markdown("""
@@ -150,33 +157,7 @@ def render():
     The entire concept is captured in one profound equation:
     """)
     st.latex("T \\vec{v} = \\lambda \\vec{v}")
-    st.markdown("""
-    Where:
-    - **T** is the transformation matrix (the battlefield's rules).
-    - **v** is the Eigenvector (the path of Dharma).
-    - **λ** (lambda) is the Eigenvalue (the scalar impact factor).
-
-    This equation states that applying the transformation **T** to the vector **v** results in the *exact same vector*, just scaled by a number **λ**.
-
-    ### How do we find these sacred paths?
-
-    We can't just guess and check forever. We need a system. Let's rearrange the equation.
-    
-    1.  Start with the core equation: `T*v = λ*v`
-    2.  Bring everything to one side: `T*v - λ*v = 0`
-    3.  To subtract these terms, we must express `λ*v` as a matrix-vector product. We use the Identity matrix `I`: `λ*I*v = λ*v`.
-    4.  Substitute it back: `T*v - λ*I*v = 0`
-    5.  Factor out the vector `v`: `(T - λI)v = 0`
-
-    This final equation is the key! It says that there is some matrix `(T - λI)` which, when applied to our special vector `v`, crushes it to the zero vector. For this to happen with a non-zero vector `v`, the matrix `(T - λI)` must be "collapsible". In linear algebra, this means its **determinant must be zero**.
-
-    `det(T - λI) = 0`
-
-    Solving this equation for `λ` gives us the Eigenvalues! Once we have the Eigenvalues, we can plug them back into `(T - λI)v = 0` to find the corresponding Eigenvectors `v`.
-
-    #### Worked Example (from Part 2)
-    Let's find the Dharma of `T = [[3, 1], [0, 2]]` formally.
-    """)
+    prose("formalization", "eigen-equation")
     st.code(f"""
     # Using Python and NumPy to find Eigenvalues and Eigenvectors
     import numpy as np
@@ -196,6 +177,9 @@ def render():
 
     st.markdown("As the code shows, the Eigenvalues are **λ=3** and **λ=2**. This means this transformation has two 'dharmic paths'. One stretches vectors by a factor of 3, and the other by a factor of 2. These are the values you found in the interactive demo!")
 
+
+@lesson_part("Games")
+def part_games():
     # --- Part 5: The Application (The Games & Puzzles) ---
     st.header("Part 5: The Application — Puzzles of the Eigen-Verse", divider="rainbow")
     st.markdown("Knowledge becomes wisdom only when it is applied. Let's test your understanding with a few challenges.")
@@ -206,7 +190,7 @@ def render():
         st.markdown("You are an engineer at ISRO analyzing a satellite's spin. An object spins stably only when it rotates around one of its principal axes, which are the Eigenvectors of its inertia tensor. Your job is to find a stable axis for the given tensor.")
         st.info("For a 3x3 matrix, finding this by hand is tough! This puzzle is about understanding the *concept*. Which of the following vectors remains unchanged in direction when transformed by T?")
         
-        T_isro = np.array([[2, 0, 0], [0, 5, 0], [0, 0, 9]])
+        T_isro = ISRO_INERTIA_TENSOR
         st.latex("T_{inertia} = \\begin{bmatrix} 2 & 0 & 0 \\\\ 0 & 5 & 0 \\\\ 0 & 0 & 9 \\end{bmatrix}")
 
         options = ["v = [1, 1, 1]", "v = [0, 1, 0]", "v = [1, 2, 3]"]
@@ -249,26 +233,17 @@ def render():
         elif st.session_state.market_answer == "B":
             st.error("Incorrect. A portfolio of only Stock 1 ([1, 0]) becomes [1.1, 0.1] after one month, which is now a 91.6%/8.4% mix. The balance changed!")
 
+
+@lesson_part("Horizon")
+def part_horizon():
     # --- Part 6: The Horizon (The Jnana-Chakshu - Eye of Knowledge) ---
     st.header("Part 6: The Horizon — The Jnana-Chakshu (Eye of Knowledge)", divider="rainbow")
-    st.markdown("""
-    We have found the path of Dharma. We have seen that within every transformation, there are fundamental, unshakable directions. This is not just a mathematical party trick; it is one of the most profound concepts in applied mathematics.
-
-    Eigenvectors and Eigenvalues are the **soul of a matrix**. They reveal its fundamental properties and behavior.
-
-    - **In Engineering (Civil & Mechanical):** When building a bridge in Mumbai or a new aircraft for the IAF, engineers use Eigenvalue analysis to find the natural frequencies of vibration. If an external force matches these frequencies, the structure can resonate and collapse. Finding the Eigenvalues means finding and avoiding catastrophe.
-    
-    - **In Data Science (The heart of Bengaluru's Tech Scene):** The most powerful dimensionality reduction technique, Principal Component Analysis (PCA), is nothing but finding the Eigenvectors of a dataset's covariance matrix. These Eigenvectors are the "principal components"—the directions of greatest variance. It's how we find the most important patterns in massive datasets, from customer behavior to financial markets. It finds the "Dharma of the Data".
-
-    - **In Quantum Mechanics:** The entire universe at its most fundamental level is described by Eigenvalues. The Schrödinger equation is an Eigenvalue equation. Its Eigenvectors are the quantum states (like orbitals of an electron), and its Eigenvalues are the observable, quantized energy levels.
-
-    The key takeaway is this: **Eigenvectors reveal the stable, intrinsic properties of any linear system, while Eigenvalues tell you the magnitude of the effect along those stable lines.**
-
-    We have learned to see the hidden paths that give a transformation its character. But there's another, more fundamental property we must understand. Beyond how a matrix stretches specific vectors, how does it stretch or shrink *space itself*? What is the total impact of the transformation on area or volume? To understand that, we must venture forward and uncover the secret of the **Determinant**.
-    """)
+    prose("horizon", "summary")
     image_search_button("Principal Component Analysis (PCA)", "PCA data visualization")
 
 
+@lesson_part("Pariksha")
+def part_pariksha():
     # --- Part 7: The Check-up (The Pariksha) ---
     st.header("Part 7: The Check-up (The Pariksha)", divider="rainbow")
     st.markdown("Let's test the knowledge you have gained on this journey.")
@@ -309,4 +284,4 @@ def render():
                 st.success(data["feedback"])
             else:
                 st.error(f"Not quite. The correct answer is: **{data['correct']}**. {data['feedback']}")
-        st.markdown("---")
\ No newline at end of file
+        st.markdown("---")
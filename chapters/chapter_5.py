@@ -5,6 +5,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 import urllib.parse
 import time
+from utils.controls import control_panel
+from utils.lesson import lesson_part
+from utils.lazy import lazy_tabs
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
 
 # ======================================================================================
 # 3.3. Mandatory Helper Function & Best Practices
@@ -28,37 +34,36 @@ def render():
     """
     st.title("Chapter 5: Eigen-Destiny — The Oracle of Population 🔮")
 
+    part_analogy()
+    L = part_mechanism()
+    part_gallery()
+    part_formalization(L)
+    part_games()
+    part_horizon()
+    part_pariksha()
+
+
+@lesson_part("Analogy")
+def part_analogy():
     # ==================================================================================
     # Part 1: The Core Idea (The Analogy)
     # Goal: Build profound, culturally-grounded intuition using a powerful analogy.
     # ==================================================================================
     st.header("Part 1: The Analogy — Dharma and the Karmic Matrix", divider="rainbow")
-    st.markdown("""
-    In the grand theatre of the universe, every entity, from the smallest firefly to the largest star, follows a certain path, a certain law of being. The ancient seers of India called this **Dharma** (धर्म) — the intrinsic nature or the fundamental principle that governs existence. A population of living beings also has a Dharma: a natural, stable structure it tends to settle into. This is its **stable age distribution**.
-
-    But what shapes this destiny? It is **Karma** (कर्म) — the law of cause and effect, the sum of actions that lead to future consequences. For a population, Karma is the set of rules that governs its life: birth rates, survival rates, the harshness of the environment. These rules, when applied year after year, determine the population's fate.
-
-    In this chapter, we will see that the language of Linear Algebra provides a breathtakingly precise way to model this cosmic dance.
-    
-    *   The population's **Dharma**, its stable structure, is perfectly described by an **Eigenvector**.
-    *   The laws of **Karma**, the rules of life and death, are encapsulated in a special **Matrix**.
-    *   The ultimate outcome, the long-term growth or decline, is revealed by the **Eigenvalue**.
-
-    Imagine the majestic tigers of the Ranthambore forest. Their population has an inherent rhythm. There is a natural balance of cubs, juveniles, and adults. This balance is their Dharma. The 'rules' of the forest—how many cubs are born to each tigress, how many cubs survive to adulthood, and how long adults live—are the Karma. By understanding these rules as a matrix, we can predict the future of the tiger population. We can become oracles, using the power of eigenvectors to foresee their destiny.
-    """)
+    prose("analogy", "intro")
     image_search_button("Ranthambore Tigers", "ranthambore tigers")
     st.markdown("Let us now build the Karmic engine that drives this destiny.")
     st.info("💡 **Analogy Recap:**\n\n*   **The Matrix:** The rules of life (birth/survival rates). The *Karma*.\n*   **The Eigenvector:** The stable population structure. The *Dharma*.\n*   **The Eigenvalue:** The long-term growth/decay rate. The *Fruit of Karma*.")
 
 
+@lesson_part("Mechanism", isolated=False)
+def part_mechanism():
     # ==================================================================================
     # Part 2: The Mechanism (Interactive Discovery)
     # Goal: Allow the user to "feel" the cause-and-effect relationship.
     # ==================================================================================
     st.header("Part 2: The Karmic Engine — An Interactive Simulation", divider="rainbow")
-    st.markdown("""
-    Here is our oracle. We will model a simple population of 'Young' and 'Adult' creatures. You control the laws of their universe. You set their Karma. Observe how the population evolves and, more importantly, watch as its internal structure (**the ratio of young to old**) magically converges to the predicted Dharma (the eigenvector).
-    """)
+    prose("mechanism", "oracle")
 
     # Initialize session state for the simulation
     if 'c5_pop_history' not in st.session_state:
@@ -151,13 +156,12 @@ def render():
             plt.tight_layout()
             st.pyplot(fig)
             
-    st.markdown("""
-    **Experiment and Observe:**
-    1.  **Convergence:** Notice how even if you start with a very unbalanced population, the *ratio* of young to adults (the bottom graph) quickly converges to the red dotted line—the Dharma predicted by the eigenvector. The raw numbers may grow or shrink, but the *structure* stabilizes.
-    2.  **The Growth Rate:** If the dominant eigenvalue (λ) is 1.1, the total population will eventually grow by about 10% each year. Test this!
-    3.  **The Tipping Point:** Find the settings that make the eigenvalue exactly 1.0. This is the sacred point of balance where the population neither grows nor shrinks. It has achieved perfect sustainability.
-    """)
+    prose("mechanism", "observations")
+    return L
 
+
+@lesson_part("Gallery")
+def part_gallery():
     # ==================================================================================
     # Part 3: The Gallery (Showcasing Variety)
     # Goal: Demonstrate the breadth and different "flavors" of the concept.
@@ -169,35 +173,25 @@ def render():
 
     with tab1:
         st.subheader("The Thriving Metropolis: A Story of Growth")
-        st.markdown("""
-        Imagine a booming city like Bengaluru, attracting talent from all over. The 'birth rate' (new people arriving or being born) is high, and the 'survival rate' (people staying) is also high. This creates a powerful Karmic Matrix where the dominant eigenvalue is significantly greater than 1.
-        
-        This is the signature of exponential growth. The city's population and economy expand relentlessly year after year. The eigenvector, in this case, would describe the stable ratio of students, young professionals, and established families that the city's structure supports.
-        """)
+        prose("gallery", "growth")
         image_search_button("Bengaluru Skyline at Night", "bengaluru skyline night")
         st.latex(r"L_{growth} = \begin{bmatrix} 0 & 2.0 \\ 0.6 & 0.95 \end{bmatrix} \implies \lambda_{dominant} \approx 1.48 > 1")
 
     with tab2:
         st.subheader("The Ancient Forest: A Story of Balance")
-        st.markdown("""
-        Consider a self-sustaining ecosystem, like the sacred groves of Meghalaya, undisturbed for centuries. Here, the cycle of life and death is in perfect harmony. For every ancient tree that falls, a sapling rises to take its place. The number of births is finely tuned to the number of deaths.
-        
-        This is a system where the dominant eigenvalue is almost exactly 1. The total population remains constant. The Dharma, or eigenvector, represents the perfect, stable balance of seedlings, young trees, and ancient giants, a structure that has proven resilient for generations. This is ecological equilibrium.
-        """)
+        prose("gallery", "stable")
         image_search_button("Sacred Groves of Meghalaya", "sacred groves of meghalaya")
         st.latex(r"L_{balance} = \begin{bmatrix} 0 & 0.5 \\ 0.8 & 0.8 \end{bmatrix} \implies \lambda_{dominant} = 1.0")
 
     with tab3:
         st.subheader("The Ghost Village: A Story of Decline")
-        st.markdown("""
-        Think of a remote village facing depopulation. The young generation moves to the cities for work (low young survival rate in the village context), and the birth rate is low. Even if the adults have a high survival rate, the lack of new blood creates a Karmic Matrix of decay.
-        
-        The dominant eigenvalue is less than 1, signaling a slow, inevitable decline. Each year, the total population shrinks by a fixed percentage. The stable age distribution (eigenvector) would likely be skewed heavily towards the elderly, the last witnesses to the village's former life.
-        """)
+        prose("gallery", "decline")
         image_search_button("Abandoned Indian Village", "abandoned indian village")
         st.latex(r"L_{decline} = \begin{bmatrix} 0 & 0.4 \\ 0.3 & 0.9 \end{bmatrix} \implies \lambda_{dominant} \approx 0.97 < 1")
 
 
+@lesson_part("Formalization")
+def part_formalization(L):
     # ==================================================================================
     # Part 4: The Formalization (The Ganita Shastra)
     # Goal: Bridge intuitive understanding to formal mathematical language.
@@ -208,48 +202,14 @@ def render():
     """)
     
     with st.expander("📜 Defining the Leslie Matrix"):
-        st.markdown("""
-        The 'Karmic Matrix' we've been using is a specific type called a **Leslie Matrix**. For a population divided into *n* age classes, it's an *n x n* matrix that describes the transitions between them. In our 2x2 case (Young, Adult):
-
-        $L = \\begin{bmatrix} f_1 & f_2 \\ s_1 & p_2 \\end{bmatrix}$
-
-        *   $f_1$ and $f_2$ are **fecundity** rates. $f_1$ is the birth rate from the 'Young' class, and $f_2$ is from the 'Adult' class. In our simple model, we assumed only adults give birth, so $f_1=0$.
-        *   $s_1$ is the **survival rate** of the 'Young' class to become members of the 'Adult' class in the next time step.
-        *   $p_2$ is the **survival rate** of the 'Adult' class to remain in the 'Adult' class.
-
-        If our population vector at time *t* is $P_t = \\begin{bmatrix} \text{Young}_t \\ \text{Adult}_t \\end{bmatrix}$, then the population at time *t+1* is simply:
-
-        $P_{t+1} = L \cdot P_t$
-
-        Applying the matrix is like turning the wheel of Karma one full cycle.
-        """)
+        prose("formalization", "leslie-matrix")
 
     with st.expander("🔮 The Eigen-Equation of Population"):
-        st.markdown(r"""
-        The core of our entire chapter lies in the fundamental eigenvector equation:
-
-        $L \cdot v = \lambda \cdot v$
-        
-        Let's translate this from pure math into the language of life:
-        
-        *   "When the Karmic Matrix ($L$) acts upon a very special population structure—the Dharma vector ($v$)..."
-        *   "...the resulting population ($L \cdot v$) is not a chaotic mess. It is an exact copy of the original Dharma vector ($v$), just scaled by a single number, $\lambda$."
-
-        This is profound. It means that once a population reaches this 'Dharma' state (the eigenvector's proportions), it has found its destiny. From then on, the structure will never change. The entire population will just grow or shrink as a whole, governed by the scaling factor $\lambda$, the dominant eigenvalue.
-
-        This is why the ratio on our interactive chart becomes a flat line. It has locked onto the eigenvector.
-        """)
+        prose("formalization", "eigen-equation")
 
     with st.expander("💡 The Perron-Frobenius Theorem: The Oracle's Guarantee"):
-        st.markdown("""
-        How do we know there will always be one, unique, positive eigenvalue that is larger than all others and dictates the long-term behavior? Can we be sure our oracle isn't lying?
-
-        For matrices with all non-negative entries, like our Leslie Matrix, a powerful result called the **Perron-Frobenius Theorem** guarantees it. It states that there will be a unique, real, and positive eigenvalue which is the largest in magnitude. This is our dominant eigenvalue. Furthermore, the corresponding eigenvector will have all positive components.
-
-        This is the mathematical guarantee that a single "growth rate" and a single "stable age distribution" will always emerge in such systems. The Dharma is not a matter of chance; it is a mathematical certainty.
-        
-        Let's see it in code. No matter the inputs, `numpy` will find this dominant value for us:
-        """)
+        prose("formalization", "perron-frobenius")
+        birth_rate, survival_y, survival_a = L[0, 1], L[1, 0], L[1, 1]
         st.code(f"""
 import numpy as np
 
@@ -276,6 +236,8 @@ print(f"Stable Distribution (Dharma): {{stable_distribution_vector}}")
         """, language="python")
 
 
+@lesson_part("Games")
+def part_games():
     # ==================================================================================
     # Part 5: The Application (The Games & Puzzles)
     # Goal: Solidify understanding through active, goal-oriented problem-solving.
@@ -283,134 +245,125 @@ print(f"Stable Distribution (Dharma): {{stable_distribution_vector}}")
     st.header("Part 5: The Puzzles of the Oracle", divider="rainbow")
     st.markdown("Knowledge must be tested to become wisdom. Here are three challenges to prove your mastery over the oracle's secrets.")
 
-    game1, game2, game3 = st.tabs(["🐅 The ISRO Tiger Project", "🎣 The Fisherman's Dilemma", "🏺 The Archaeologist's Riddle"])
-
-    with game1:
-        st.subheader("Challenge 1: The ISRO Satellite-Aided Tiger Conservation Project")
-        st.markdown("""
-        You are a conservation officer using ISRO satellite data to monitor a new tiger reserve. Your goal is to ensure the tiger population thrives. The target is a stable growth rate of **5% per year** (an eigenvalue of **1.05**).
-        
-        You cannot change the adult tigers' natural lifespan (survival is fixed at 92%), but you *can* run conservation programs that affect cub survival.
-        
-        **Your task: Adjust the 'Cub Survival Rate' until you achieve the target growth rate of 1.05.**
-        """)
-        
-        adult_survival_game1 = 0.92
-        birth_rate_game1 = 0.6 # Low birth rate for tigers
-        
-        cub_survival_game1 = st.slider("Cub Survival Rate", 0.0, 1.0, 0.4, 0.01, key="game1_slider")
-        
-        L_game1 = np.array([[0, birth_rate_game1], [cub_survival_game1, adult_survival_game1]])
-        eigvals_g1, _ = np.linalg.eig(L_game1)
-        current_growth = np.max(np.real(eigvals_g1))
-        
-        st.metric("Current Population Growth Rate (λ)", f"{current_growth:.4f}")
-        
-        if np.isclose(current_growth, 1.05, atol=0.005):
-            st.balloons()
-            st.success("🎯 Target Achieved! The tiger population is now on a stable 5% growth path. Your conservation efforts have paid off!")
-        elif current_growth > 1.05:
-            st.warning("Overshot! Growth is too high, which might strain the ecosystem. Lower the survival rate slightly.")
-        else:
-            st.info("Keep trying! The population isn't growing fast enough. You need to improve the cub survival rate.")
+    lazy_tabs("c5_game_tabs", {
+        "🐅 The ISRO Tiger Project": game_tiger_project,
+        "🎣 The Fisherman's Dilemma": game_fishermans_dilemma,
+        "🏺 The Archaeologist's Riddle": game_archaeologists_riddle,
+    }, keep={
+        "🐅 The ISRO Tiger Project": ("game1_slider",),
+        "🎣 The Fisherman's Dilemma": ("g2_hy", "g2_ha"),
+        "🏺 The Archaeologist's Riddle": ("g3_choice",),
+    })
+
+
+def game_tiger_project():
+    """Challenge 1: tune the cub survival rate to reach a growth rate of 1.05."""
+    st.subheader("Challenge 1: The ISRO Satellite-Aided Tiger Conservation Project")
+    prose("game_tiger_project", "intro")
+
+    adult_survival_game1 = 0.92
+    birth_rate_game1 = 0.6 # Low birth rate for tigers
+
+    cub_survival_game1 = st.slider("Cub Survival Rate", 0.0, 1.0, 0.4, 0.01, key="game1_slider")
+
+    L_game1 = np.array([[0, birth_rate_game1], [cub_survival_game1, adult_survival_game1]])
+    eigvals_g1, _ = np.linalg.eig(L_game1)
+    current_growth = np.max(np.real(eigvals_g1))
+
+    st.metric("Current Population Growth Rate (λ)", f"{current_growth:.4f}")
+
+    if np.isclose(current_growth, 1.05, atol=0.005):
+        st.balloons()
+        st.success("🎯 Target Achieved! The tiger population is now on a stable 5% growth path. Your conservation efforts have paid off!")
+    elif current_growth > 1.05:
+        st.warning("Overshot! Growth is too high, which might strain the ecosystem. Lower the survival rate slightly.")
+    else:
+        st.info("Keep trying! The population isn't growing fast enough. You need to improve the cub survival rate.")
+
+
+def game_fishermans_dilemma():
+    """Challenge 2: find the largest sustainable harvest of the Chilika Lake fishery."""
+    st.subheader("Challenge 2: The Chilika Lake Fisherman's Dilemma")
+    prose("game_fishermans_dilemma", "intro")
+    image_search_button("Chilika Lake fishing boats", "chilika lake fishing boats")
+
+    # A batched panel: the fisherman sets both quotas before the season is simulated.
+    quotas = control_panel(
+        "g2_harvest_panel",
+        [
+            dict(label="Harvest Rate of Young (%)", min_value=0, max_value=100, value=10, key="g2_hy"),
+            dict(label="Harvest Rate of Adults (%)", min_value=0, max_value=100, value=10, key="g2_ha"),
+        ],
+        mode="batched",
+        submit_label="🎣 Set Harvest Quotas",
+    )
+    harvest_y, harvest_a = quotas["g2_hy"], quotas["g2_ha"]
+
+    base_survival_y, base_survival_a = 0.4, 0.8
+
+    final_survival_y = base_survival_y * (1 - harvest_y/100)
+    final_survival_a = base_survival_a * (1 - harvest_a/100)
+
+    L_game2 = np.array([[0, 1.2], [final_survival_y, final_survival_a]])
+    eigvals_g2, _ = np.linalg.eig(L_game2)
+    current_growth_g2 = np.max(np.real(eigvals_g2))
+
+    st.metric("Resulting Population Growth Rate (λ)", f"{current_growth_g2:.4f}")
+    total_harvest = harvest_y + harvest_a
+    st.metric("Your Total Harvest Score", f"{total_harvest}%")
+
+    if current_growth_g2 < 1.0:
+        st.error(" unsustainable! The fish population will collapse over time. Reduce your harvest.", icon="💔")
+    else:
+        st.success("Sustainable! The fishery will survive. Can you increase your harvest score further?", icon="✅")
+
+
+def game_archaeologists_riddle():
+    """Challenge 3: pick the Leslie matrix whose Dharma vector matches the 7:10 ratio."""
+    st.subheader("Challenge 3: The Harappan Archaeologist's Riddle")
+    prose("game_archaeologists_riddle", "intro")
+
+    # The target ratio of young is 7 / (7+10) = 7/17 ≈ 0.4117
+    st.info("Hint: Calculate the dominant eigenvector for each matrix and see which one matches the ratio.")
+
+    options = {
+        "Matrix A": np.array([[0, 1.0], [0.8, 0.6]]),
+        "Matrix B": np.array([[0, 0.9], [0.7, 0.7]]),
+        "Matrix C": np.array([[0, 1.2], [0.5, 0.8]])
+    }
 
-    with game2:
-        st.subheader("Challenge 2: The Chilika Lake Fisherman's Dilemma")
-        st.markdown("""
-        You are managing the fish population in the magnificent Chilika Lake. The natural system is stable, with a birth rate of 1.2 and survival rates of 40% for young and 80% for adults.
-        
-        You need to harvest fish to support the local community, which reduces the survival rates. Your goal is to **maximize your total harvest percentage** while ensuring the fishery remains **sustainable** (i.e., the growth rate λ must be ≥ 1.0).
-        
-        **Your task: Adjust the harvest sliders to find the maximum possible harvest that doesn't doom the population.**
-        """)
-        image_search_button("Chilika Lake fishing boats", "chilika lake fishing boats")
-        
-        col_g2_1, col_g2_2 = st.columns(2)
-        with col_g2_1:
-            harvest_y = st.slider("Harvest Rate of Young (%)", 0, 100, 10, key="g2_hy")
-        with col_g2_2:
-            harvest_a = st.slider("Harvest Rate of Adults (%)", 0, 100, 10, key="g2_ha")
-            
-        base_survival_y, base_survival_a = 0.4, 0.8
-        
-        final_survival_y = base_survival_y * (1 - harvest_y/100)
-        final_survival_a = base_survival_a * (1 - harvest_a/100)
-        
-        L_game2 = np.array([[0, 1.2], [final_survival_y, final_survival_a]])
-        eigvals_g2, _ = np.linalg.eig(L_game2)
-        current_growth_g2 = np.max(np.real(eigvals_g2))
-        
-        st.metric("Resulting Population Growth Rate (λ)", f"{current_growth_g2:.4f}")
-        total_harvest = harvest_y + harvest_a
-        st.metric("Your Total Harvest Score", f"{total_harvest}%")
+    choice = st.radio("Which matrix governed the Harappan cattle?", options.keys(), index=None, key="g3_choice")
 
-        if current_growth_g2 < 1.0:
-            st.error(" unsustainable! The fish population will collapse over time. Reduce your harvest.", icon="💔")
-        else:
-            st.success("Sustainable! The fishery will survive. Can you increase your harvest score further?", icon="✅")
+    if choice:
+        chosen_matrix = options[choice]
+        eigvals, eigvecs = np.linalg.eig(chosen_matrix)
+        dom_idx = np.argmax(np.real(eigvals))
+        vec = np.abs(np.real(eigvecs[:, dom_idx]))
+        ratio = vec[0] / vec[1] # young / adult ratio
 
-    with game3:
-        st.subheader("Challenge 3: The Harappan Archaeologist's Riddle")
-        st.markdown(r"""
-        You are an archaeologist excavating a site from the Indus Valley Civilization. You've found ancient texts describing the 'Dharma' of their sacred cattle population. The texts state that, at equilibrium, **for every 10 adult cattle, there were exactly 7 young calves.**
-        
-        This means the stable age distribution (the Dharma vector) was proportional to $\begin{bmatrix} 7 \\ 10 \end{bmatrix}$.
+        st.write(f"You chose {choice}. Let's analyze it:")
+        st.latex(f"L = {str(chosen_matrix).replace(' [', '[').replace('[ ', '[')}")
+        st.write(f"The calculated Young:Adult ratio for this matrix is approximately **{ratio:.2f} : 1**, which is {vec[0]:.2f} : {vec[1]:.2f}.")
 
-        Your team has narrowed down the possible 'Karmic laws' (Leslie Matrices) to three options based on climate models.
-        
-        **Your task: Identify which of the following three matrices would produce the sacred 7:10 ratio.**
-        """)
-
-        # The target ratio of young is 7 / (7+10) = 7/17 ≈ 0.4117
-        st.info("Hint: Calculate the dominant eigenvector for each matrix and see which one matches the ratio.")
-        
-        options = {
-            "Matrix A": np.array([[0, 1.0], [0.8, 0.6]]),
-            "Matrix B": np.array([[0, 0.9], [0.7, 0.7]]),
-            "Matrix C": np.array([[0, 1.2], [0.5, 0.8]])
-        }
-        
-        choice = st.radio("Which matrix governed the Harappan cattle?", options.keys(), index=None)
-
-        if choice:
-            chosen_matrix = options[choice]
-            eigvals, eigvecs = np.linalg.eig(chosen_matrix)
-            dom_idx = np.argmax(np.real(eigvals))
-            vec = np.abs(np.real(eigvecs[:, dom_idx]))
-            ratio = vec[0] / vec[1] # young / adult ratio
-            
-            st.write(f"You chose {choice}. Let's analyze it:")
-            st.latex(f"L = {str(chosen_matrix).replace(' [', '[').replace('[ ', '[')}")
-            st.write(f"The calculated Young:Adult ratio for this matrix is approximately **{ratio:.2f} : 1**, which is {vec[0]:.2f} : {vec[1]:.2f}.")
-            
-            if choice == "Matrix B":
-                st.balloons()
-                st.success(f"Correct! The ratio for Matrix B is {ratio:.2f}, which is very close to the sacred 7:10 (0.7) ratio. You've solved the riddle!")
-            else:
-                st.error("Incorrect. This matrix does not produce the 7:10 Dharma. The ratio is wrong. Please try another.")
+        if choice == "Matrix B":
+            st.balloons()
+            st.success(f"Correct! The ratio for Matrix B is {ratio:.2f}, which is very close to the sacred 7:10 (0.7) ratio. You've solved the riddle!")
+        else:
+            st.error("Incorrect. This matrix does not produce the 7:10 Dharma. The ratio is wrong. Please try another.")
 
 
+@lesson_part("Horizon")
+def part_horizon():
     # ==================================================================================
     # Part 6: The Horizon (The Jnana-Chakshu - Eye of Knowledge)
     # Goal: Motivate the user by revealing the concept's true power.
     # ==================================================================================
     st.header("Part 6: The Jnana-Chakshu — The Eye of Knowledge", divider="rainbow")
-    st.markdown("""
-    The oracle of population is but one application of this profound idea. The principle of finding the 'stable state' or 'most important feature' of a system governed by a matrix is one of the most powerful in all of science and technology.
-
-    *   **Google's PageRank:** In the beginning, Google didn't rank pages by keywords alone. It modeled the entire internet as a giant matrix, where a link from page A to page B was a 'vote'. The eigenvector of this colossal matrix gave a 'rank' to every page on the internet. The pages with the highest values in the eigenvector were, by 'Dharma', the most important. You used an eigenvector every time you searched the web.
-    
-    *   **Vibrational Analysis:** When engineers at ISRO design a rocket, they model it as a structural system. The eigenvalues of this system's matrix represent the natural frequencies at which the rocket will vibrate. To avoid catastrophic failure, they must ensure the engine's vibrations do not match these eigenvalues.
-    
-    *   **Economics (Leontief Model):** An entire national economy can be modeled with an input-output matrix, showing how industries rely on each other. The eigenvector of this matrix reveals a stable state of economic equilibrium, for which the government can solve to set production targets.
-    
-    *   **Quantum Mechanics:** In the quantum world, every observable property (like energy or momentum) is represented by an operator (a matrix). The eigenvalues of that matrix are the only possible values that can be measured. The universe itself is governed by eigen-logic!
+    prose("horizon", "summary")
 
-    **The Grand Takeaway:** Eigenvectors and eigenvalues reveal the hidden, stable soul of a system that undergoes repeated transformation. They are the 'Dharma' within the 'Karma'.
-
-    **Teaser for the Next Chapter:** We have seen how a matrix transforms a vector and what its stable states are. But what if the matrix isn't square? What if it represents a transformation between completely different worlds, like from a high-dimensional space of movie ratings to a low-dimensional space of movie genres? For this, we need a tool even more powerful, a 'universal decomposition' that can handle any matrix. Prepare to meet the master of all matrix transformations: the **Singular Value Decomposition (SVD)**.
-    """)
 
+@lesson_part("Pariksha")
+def part_pariksha():
     # ==================================================================================
     # Part 7: The Check-up (The Pariksha)
     # Goal: Provide a robust self-assessment.
@@ -455,4 +408,4 @@ print(f"Stable Distribution (Dharma): {{stable_distribution_vector}}")
                 st.success(data["feedback"])
             else:
                 st.error(f"Not quite. The correct answer is: **{data['options'][data['correct']]}**. \n\n*Why:* {data['feedback']}")
-        st.markdown("---")
\ No newline at end of file
+        st.markdown("---")
@@ -1,7 +1,25 @@
 # In dharma_sindhu_saga/chapter_1.py
 import streamlit as st
 import time
+from functools import partial
+import numpy as np
 from utils.plotting import image_search_button
+from utils.lesson import lesson_part, rerun_part
+from utils.lazy import lazy_expander
+from utils.content import lesson_content
+from utils.deferred import deferred_import
+
+go = deferred_import("plotly.graph_objects")
+
+prose = lesson_content(__name__)
+
+# The Monte Carlo view of the karma simulator. Its seed is fixed, so a setting always
+# gives the same picture and one cached simulation serves every learner.
+SIMULATION_SEED = 108
+# How much a soul's actions vary from life to life: the shape of the gamma
+# distribution its action rates are drawn from (smaller varies more).
+VARIABILITY = {"Steady": 8.0, "Varied": 2.0, "Turbulent": 0.5}
+QUANTILES = (5, 25, 50, 75, 95)
 
 def render():
     """
@@ -15,7 +33,17 @@ def render():
     st.title("Chapter 1: The Seed of Dharma & The Land of Beginnings")
     st.markdown("---")
 
+    part_analogy()
+    part_mechanism()
+    part_gallery()
+    part_formalization()
+    part_games()
+    part_horizon()
+    part_pariksha()
+
 
+@lesson_part("Analogy")
+def part_analogy():
     # =================================================================================================
     # PART 1: THE CORE IDEA (THE ANALOGY)
     # Goal: Build profound, culturally-grounded intuition for Sanatana Dharma.
@@ -23,32 +51,16 @@ def render():
     # =================================================================================================
 
     st.header("Part 1: The Great Banyan Tree of Being")
-    st.markdown("""
-    Before we speak of kings, battles, or even gods, we must first sit in the shade of a very old tree. It is not just any tree. Imagine a colossal Banyan, a *Vata Vriksha*, so vast its branches seem to kiss the clouds and so ancient its roots have burrowed into the very memory of the Earth. This tree has no single trunk, no simple origin you can point to and say, "Here, this is where it began." Instead, it sends down new roots from its branches, which then become trunks themselves, creating a living, breathing forest that is a single, interconnected organism.
-
-    This Great Banyan is our analogy for **Sanatana Dharma**.
-    """)
+    prose("analogy", "banyan-tree")
 
     image_search_button("The Great Banyan Tree (Vata Vriksha)", "Great Banyan Tree India")
 
-    st.markdown("""
-    The term ‘religion’ is too small, too contained for what this tree represents. Think of it not as a structure built by human hands, but as a natural law of the universe, like gravity or the rising of the sun. ‘Sanatana’ means eternal, perennial, that which has no beginning and no end. ‘Dharma’ is a word so rich it defies a single translation; it is righteousness, duty, cosmic law, virtue, the very 'way of being' of a thing. The Dharma of fire is to burn; the Dharma of water is to flow. What, then, is the Dharma of a human being? Our entire saga is an attempt to answer this question.
-
-    Let's explore our Great Banyan, this tree of Sanatana Dharma:
-
-    *   **The Unseen Roots (The Core Principles):** Deep beneath the soil, anchoring this entire universe, are the foundational truths. These are concepts like *Brahman* (the ultimate, formless reality), the oneness of existence, and the eternal nature of the soul (*Atman*). You don't see them every day, but the entire tree—the entire cosmos—draws its nourishment from them. They are the source code of reality.
-
-    *   **The Trunks & Branches (The Many Paths):** Look at the Banyan. Which one is the 'main' trunk? It's impossible to tell. Some are thick and ancient, others are young and vigorous. Each trunk is a valid path to the same core nourishment. These represent the diverse traditions within Dharma—Shaivism, Vaishnavism, Shaktism, and countless other schools of thought and regional practices. They may look different, use different names and forms for the divine, but they are all part of the same tree, sharing the same roots. There is no single "correct" path up the tree; there is only *your* path.
-
-    *   **The Leaves (Individual Lives):** Every single leaf on this colossal tree is a life, a soul on its journey. Each leaf is unique—some are large, some small, some in the bright sun, some in the shade. Each one performs its duty: engaging in photosynthesis, sustaining the branch, and playing its part in the life of the whole. The leaf's personal dharma (*Svadharma*) is to be the best leaf it can be, right where it is. It doesn't envy the leaf on the higher branch or pity the one below. It simply *is*, contributing to the whole and fulfilling its purpose.
-
-    *   **The Cycle of Seasons (Karma and Samsara):** The leaves sprout, live, and eventually wither and fall, returning to the earth to nourish the roots. This is the cycle of life, death, and rebirth—**Samsara**. The quality of a leaf's life—how well it absorbed sunlight, how much it contributed—influences the soil. This is **Karma**, the law of cause and effect. Actions in one season (one life) determine the conditions for the next. The soil becomes richer or poorer based on the collective actions of the leaves.
-
-    This tree is not a static monument. It is alive, growing, and ever-changing, yet its core principles—its roots—are eternal. It provides shade and shelter for all, regardless of who they are. This is the grand, open, and profound idea we begin with. Before we can understand the history of Haryana, the Land of Dharma, we must first understand the Dharma itself: not as a set of rules, but as this sprawling, life-giving, eternal Banyan of Being.
-    """)
+    prose("analogy", "beyond-religion")
     st.markdown("---")
 
 
+@lesson_part("Mechanism")
+def part_mechanism():
     # =================================================================================================
     # PART 2: THE MECHANISM (INTERACTIVE DISCOVERY)
     # Goal: Allow the user to "feel" the cause-and-effect of Karma and Samsara.
@@ -56,11 +68,7 @@ def render():
     # =================================================================================================
 
     st.header("Part 2: The Cosmic Account Book - A Karma Simulator")
-    st.markdown("""
-    The ideas of Karma and Samsara can feel abstract. Let's make them tangible. Karma is not a reward/punishment system from a celestial judge; it is a universal, impersonal law of cause and effect, like a cosmic ledger. Every action, thought, and intention is a transaction that shifts your balance. Samsara is the grand cycle of existence this ledger is part of.
-
-    Here is a simple interactive simulator. Imagine you are guiding a soul through several lifetimes. Your goal isn't to 'win', but to observe how different types of actions shape the soul's journey and the conditions of its next birth.
-    """)
+    prose("mechanism", "karma-simulator")
 
     st.info("💡 **How to Use:** Adjust the sliders to represent the dominant actions in a lifetime. Then click 'Live a Lifetime' to see the effect. Observe how the 'Karmic Balance' and 'Conditions for Next Life' change. Do this for several lifetimes to see the long-term trend.")
 
@@ -109,28 +117,128 @@ def render():
         st.markdown("**Conditions for Next Life:**")
         st.success(conditions) if balance > 0 else st.warning(conditions)
 
-        with st.expander("Show Karmic Ledger"):
-            if not st.session_state.log:
-                st.write("Your journey has not yet begun. Live a lifetime to see the log.")
-            for entry in st.session_state.log:
-                st.markdown(entry)
+        lazy_expander("d1_karmic_ledger", "Show Karmic Ledger", show_karmic_ledger)
 
         if st.button("Reset Journey"):
             st.session_state.karmic_balance = 0
             st.session_state.lifetime_number = 1
             st.session_state.log = []
-            st.rerun()
+            rerun_part()
 
-    st.markdown("""
-    **Guiding Questions for Your Discovery:**
-    1.  What happens if you only perform 'Good Actions' but also many 'Selfish Actions'? Does one cancel the other out perfectly?
-    2.  Notice the impact of 'Selfless Actions'. Why do you think they have a slightly higher weight in our model?
-    3.  Try to drive your balance as low as possible. Then, see how many lifetimes of positive action it takes to recover. What does this tell you about the journey of a soul?
-    4.  This is a vast oversimplification. In reality, Karma is not a simple score. It's more like a complex web of tendencies, opportunities, and psychological patterns. How would you improve this model to make it more realistic?
-    """)
+    lazy_expander("d1_many_souls", "🌌 Many Souls, Many Lifetimes (Monte Carlo)",
+                  partial(show_many_souls, selfless_actions, good_actions, selfish_actions))
+
+    prose("mechanism", "guiding-questions")
     st.markdown("---")
 
 
+def show_karmic_ledger():
+    """Lists the most recent lifetimes of the karma simulator."""
+    if not st.session_state.log:
+        st.write("Your journey has not yet begun. Live a lifetime to see the log.")
+    for entry in st.session_state.log:
+        st.markdown(entry)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def simulate_souls(selfless, good, selfish, start, souls, lifetimes, shape):
+    """
+    Simulates many souls over many lifetimes at once, in one vectorized pass.
+
+    In every lifetime, each soul's numbers of selfless, good and selfish actions are
+    drawn from a gamma-Poisson distribution whose mean is the slider's setting; a
+    smaller shape makes lives vary more around it. A lifetime changes the balance
+    by the same formula as "Live a Lifetime".
+
+    Returns:
+        dict: The percentile bands of the balance per lifetime, the histogram of
+            final balances, how many souls first reach a positive balance in each
+            lifetime, and the share that never does.
+    """
+    rng = np.random.default_rng(SIMULATION_SEED)
+    # One row per lifetime, one column per soul: the percentiles of a lifetime then
+    # read one contiguous row.
+    change = np.zeros((lifetimes, souls), dtype=np.float32)
+    for mean, weight in ((selfless, 1.5), (good, 1.0), (selfish, -1.2)):
+        if mean:
+            rates = rng.standard_gamma(shape, size=change.shape, dtype=np.float32) * np.float32(mean / shape)
+            change += np.float32(weight) * rng.poisson(rates).astype(np.float32)
+    balances = start + np.cumsum(change, axis=0)
+
+    recovered = balances > 0
+    ever = recovered.any(axis=0)
+    # The first lifetime (from 1) that ends with a positive balance, for the souls that get there.
+    recovery = recovered.argmax(axis=0)[ever] + 1
+    final = balances[-1]
+    final_counts, final_edges = np.histogram(final, bins=40)
+    return {
+        "bands": np.percentile(balances, QUANTILES, axis=1),
+        "final_counts": final_counts,
+        "final_edges": final_edges,
+        "final_median": float(np.median(final)),
+        "favorable": float(np.mean(final > 30)),
+        "recovery_counts": np.bincount(recovery, minlength=lifetimes + 1)[1:],
+        "recovery_median": float(np.median(recovery)) if len(recovery) else None,
+        "never": float(1 - ever.mean()),
+    }
+
+
+def show_many_souls(selfless, good, selfish):
+    """Shows the Monte Carlo view of the simulator for the action sliders' settings."""
+    st.markdown("One soul's journey is a story; thousands of them are a law. Here every soul lives with the actions set by the sliders above *on average*, but each life draws its own actions around them, as real lives do. All souls start in the same karmic debt (*Prarabdha*).")
+    col1, col2 = st.columns(2)
+    with col1:
+        souls = st.select_slider("Souls", [500, 1000, 2000], value=2000, key="d1_mc_souls")
+        lifetimes = st.slider("Lifetimes", 50, 300, 200, 50, key="d1_mc_lifetimes")
+    with col2:
+        start = st.slider("Starting balance (Prarabdha)", -100, 0, -30, 5, key="d1_mc_start")
+        variability = st.select_slider("How much lives vary", list(VARIABILITY), value="Varied", key="d1_mc_variability")
+
+    result = simulate_souls(selfless, good, selfish, start, souls, lifetimes, VARIABILITY[variability])
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Median final balance", f"{result['final_median']:.0f}")
+    m2.metric("Souls in favorable conditions", f"{result['favorable']:.0%}")
+    if result["recovery_median"] is None:
+        m3.metric("Median lifetimes to recover", "Never")
+    else:
+        m3.metric("Median lifetimes to recover", f"{result['recovery_median']:.0f}")
+
+    bands = result["bands"]
+    x = np.arange(1, lifetimes + 1)
+    fig = go.Figure()
+    for low, high, name, alpha in ((0, 4, "5th to 95th percentile", 0.15), (1, 3, "25th to 75th percentile", 0.35)):
+        fig.add_trace(go.Scatter(x=x, y=bands[high], mode="lines", line=dict(width=0), showlegend=False, hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=x, y=bands[low], mode="lines", line=dict(width=0), fill="tonexty",
+                                 fillcolor=f"rgba(255, 153, 51, {alpha})", name=name, hoverinfo="skip"))
+    fig.add_trace(go.Scatter(x=x, y=bands[2], mode="lines", line=dict(color="darkorange", width=3), name="Median soul"))
+    fig.add_hline(y=0, line=dict(color="gray", dash="dash"))
+    fig.update_layout(title="Karmic balance of all souls, lifetime by lifetime", xaxis_title="Lifetime",
+                      yaxis_title="Karmic balance", height=380, margin=dict(l=10, r=10, t=50, b=10),
+                      legend=dict(orientation="h", y=-0.2))
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        edges = result["final_edges"]
+        fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=result["final_counts"], width=edges[1] - edges[0],
+                               marker_color="darkorange"))
+        fig.update_layout(title=f"Balance after {lifetimes} lifetimes", xaxis_title="Karmic balance",
+                          yaxis_title="Souls", height=320, margin=dict(l=10, r=10, t=50, b=10))
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        counts = result["recovery_counts"]
+        last = int(np.flatnonzero(counts)[-1]) + 1 if counts.any() else 1
+        fig = go.Figure(go.Bar(x=np.arange(1, last + 1), y=counts[:last], marker_color="seagreen"))
+        fig.update_layout(title="Lifetimes until the debt is repaid", xaxis_title="Lifetime",
+                          yaxis_title="Souls", height=320, margin=dict(l=10, r=10, t=50, b=10))
+        st.plotly_chart(fig, use_container_width=True)
+    if result["never"] > 0:
+        st.caption(f"{result['never']:.1%} of the souls never repay their debt within {lifetimes} lifetimes.")
+
+
+@lesson_part("Gallery")
+def part_gallery():
     # =================================================================================================
     # PART 3: THE GALLERY (SHOWCASING VARIETY)
     # Goal: Demonstrate the breadth of "Dharma".
@@ -138,50 +246,29 @@ def render():
     # =================================================================================================
 
     st.header("Part 3: The Flavors of Dharma - A Gallery of Duties")
-    st.markdown("""
-    Dharma is not a one-size-fits-all instruction manual. Remember our Banyan tree? The duty of a leaf is different from the duty of a root. The concept is multi-layered, adapting to the person, their stage in life, their society, and their time. Let's explore some of these essential "flavors."
-    """)
+    prose("gallery", "intro")
 
     tab1, tab2, tab3 = st.tabs(["**Svadharma** (Personal Duty)", "**Samaja Dharma** (Societal Duty)", "**Rashtra Dharma** (National Duty)"])
 
     with tab1:
         st.subheader("Svadharma: Your Unique Melody")
-        st.markdown("""
-        *Sva* means 'own' or 'self'. *Svadharma* is one's own unique, personal duty and nature. It is the path that aligns with your innate tendencies, talents, and stage in life. It's the role you were born to play in the cosmic drama.
-
-        **Sub-Analogy: The Orchestra**
-        Imagine a grand orchestra. There is a violinist, a drummer, a flutist. The Dharma of the violinist is to play the violin beautifully. If the violinist, yearning to be the drummer, drops their bow and tries to bang the drums, they create chaos. They not only fail at being a good drummer but also neglect their own unique gift. Svadharma is about discovering your instrument and playing it with all your heart for the harmony of the whole orchestra. It is better to perform your own Dharma imperfectly than to perform another's Dharma perfectly.
-
-        This is the message Arjuna receives in the Bhagavad Gita, on the battlefield of Kurukshetra. He, a warrior (*Kshatriya*), is overcome with doubt about fighting his own kin. Krishna reminds him of his Svadharma: as a warrior, his duty is to fight for righteousness and protect order, however painful it may be.
-        """)
+        prose("gallery", "svadharma")
         image_search_button("Arjuna and Krishna on the battlefield", "Arjuna Krishna chariot Bhagavad Gita")
 
     with tab2:
         st.subheader("Samaja Dharma: The Web of Society")
-        st.markdown("""
-        *Samaja* means 'society'. *Samaja Dharma* refers to the duties and ethics that govern a community. It's the collective code of conduct that allows people to live together in harmony, trust, and mutual prosperity.
-
-        **Sub-Analogy: Traffic Rules**
-        Think about the traffic in a busy Indian city. It can seem chaotic, but underlying it is a shared understanding—a Samaja Dharma. We agree to (mostly) stop at red lights, drive on one side of the road, and give way to ambulances. These aren't profound spiritual laws, but they are a form of Dharma. Without this shared code, the system would collapse into gridlock and accidents.
-
-        Samaja Dharma includes traditions, ethics, laws, and customs that maintain social order. It is the Dharma of a doctor to heal, the Dharma of a teacher to educate, and the Dharma of a citizen to be responsible. It's the ethical web that holds the community together, ensuring its health and continuity.
-        """)
+        prose("gallery", "samaja-dharma")
         image_search_button("Busy Indian city street traffic", "Mumbai street traffic")
 
     with tab3:
         st.subheader("Rashtra Dharma: The Soul of the Nation")
-        st.markdown("""
-        *Rashtra* means 'nation' or 'state'. *Rashtra Dharma* is the highest duty to protect the integrity, culture, and well-being of the nation. It transcends personal and even community interests when the nation itself is at stake.
-
-        **Sub-Analogy: The Ship of State**
-        A nation is like a great ship sailing through the ocean of time. Every citizen is a member of the crew. When a mighty storm threatens to sink the ship, the personal preferences of the crew become secondary. The cook, the navigator, the engineer—all must work together with a single purpose: to save the ship. This unified, selfless duty to the collective vessel is Rashtra Dharma.
-
-        Throughout Indian history, this concept has been invoked. From Chanakya's teachings on statecraft in the *Arthashastra* to the sacrifices of freedom fighters, the idea that the nation's Dharma is a sacred responsibility has been a powerful force. In the context of Haryana, the land that has so often been the guardian of the throne of Delhi, this concept is particularly resonant.
-        """)
+        prose("gallery", "rashtra-dharma")
         image_search_button("Indian Parliament building (Sansad Bhavan)", "New Parliament of India")
     st.markdown("---")
 
 
+@lesson_part("Formalization")
+def part_formalization():
     # =================================================================================================
     # PART 4: THE FORMALIZATION (THE GANITA SHASTRA)
     # Goal: Bridge intuition to formal language, providing significant depth.
@@ -189,73 +276,39 @@ def render():
     # =================================================================================================
 
     st.header("Part 4: The Ganita Shastra - Naming What We Now Know")
-    st.markdown("""
-    We have felt the rhythm of Karma and explored the many flavors of Dharma through analogies. Now, let us do what the ancient Indian sages, the *Rishis*, did. Let us give these concepts their proper names and examine them with rigor. This section is our 'Ganita Shastra' (Science of Calculation/Formalization), where we transition from intuition to formal knowledge.
-    """)
+    prose("formalization", "intro")
 
     with st.expander("📜 The Lexicon of Being: Dharma, Karma, Samsara, Moksha", expanded=True):
         st.subheader("Dharma (धर्म)")
-        st.markdown("""
-        *   **Etymology:** From the Sanskrit root *'dhri'*, which means 'to hold', 'to maintain', or 'to support'.
-        *   **Deep Meaning:** Dharma is literally that which 'upholds' reality. It is the foundational law that prevents the cosmos from collapsing into chaos. It is the intrinsic nature of a thing. The Dharma of sugar is to be sweet. The Dharma of a human is far more complex, encompassing duty, ethics, law, and purpose, all aimed at upholding both personal and cosmic order. It is not a command from a god, but a principle woven into the fabric of existence.
-        """)
+        prose("formalization", "dharma-definition")
 
         st.subheader("Karma (कर्म)")
-        st.markdown("""
-        *   **Etymology:** From the Sanskrit root *'kri'*, which means 'to do' or 'to act'.
-        *   **Deep Meaning:** Karma literally means 'action'. The law of Karma states that every action has a corresponding reaction. It is a universal law of cause and effect. It's crucial to understand that Karma is not 'fate'. Fate implies a predetermined destiny you cannot escape. Karma implies a destiny you are *currently creating* through your actions, thoughts, and words. You are the architect of your own experience. There are three types:
-            1.  **Sanchita Karma:** The total sum of all past karmas from previous lives that have yet to bear fruit. It's like a vast storehouse of seeds.
-            2.  **Prarabdha Karma:** The portion of Sanchita Karma that has 'sprouted' and is shaping your current life. It's the hand of cards you've been dealt in this lifetime (your body, family, innate talents, and major life events). You cannot change this portion.
-            3.  **Kriyamana Karma:** The new Karma you are creating right now, in this moment. This is where your free will lies. The actions you take now will determine your future experiences and become part of your Sanchita Karma.
-        """)
+        prose("formalization", "karma-definition")
 
         st.subheader("Samsara (संसार)")
-        st.markdown("""
-        *   **Etymology:** From Sanskrit, meaning 'to flow on', 'to wander through', or 'a passing through'.
-        *   **Deep Meaning:** Samsara is the cycle of birth, death, and rebirth to which all beings are subject as long as they are bound by Karma. It is often visualized as a wheel or a river. It is not seen as inherently good or bad, but as a state of perpetual wandering driven by desire, attachment, and ignorance of one's true nature (the *Atman*). The goal is not to get a 'better' birth within the cycle, but to break free from the cycle altogether.
-        """)
+        prose("formalization", "samsara-definition")
 
         st.subheader("Moksha (मोक्ष)")
-        st.markdown("""
-        *   **Etymology:** From the Sanskrit root *'muc'*, which means 'to liberate', 'to free', 'to release'.
-        *   **Deep Meaning:** Moksha is the ultimate goal of the Dharmic paths: liberation. It is the release from the cycle of Samsara. It is the state where one's individual consciousness (*Atman*) realizes its oneness with the ultimate reality (*Brahman*). It is the end of striving, the extinguishing of the karmic ledger, and the attainment of a state of absolute freedom, peace, and bliss. It is the final destination of the soul's long journey home.
-        """)
+        prose("formalization", "moksha-definition")
 
     with st.expander("🌏 The Land of Beginnings: Ancient Haryana and the Sarasvati River", expanded=False):
         st.subheader("The Cradle of Civilization: Sapta Sindhu")
-        st.markdown("""
-        To understand Haryana's title as 'Dharma-Kshetra', we must travel back in time, to an era when the geography of North India was vastly different. The most ancient Hindu scriptures, the Vedas, don't speak of the Ganga as their most sacred river. They sing praises of a mighty, life-giving river called the **Sarasvati**. The land they describe, the heartland of early Vedic culture, was called **Sapta Sindhu**—the land of seven rivers.
-
-        This region, located in the Punjab and its surroundings, was a fertile, green paradise. Along with the Indus (Sindhu) and its tributaries, the Sarasvati was the central artery of this civilization. It was on the banks of this river that the Rishis are said to have composed the Vedas, contemplating the very concepts of Dharma and Karma we have just discussed.
-        """)
+        prose("formalization", "sarasvati-basin")
         image_search_button("Map of the Sapta Sindhu region", "Sapta Sindhu map vedic")
 
         st.subheader("The Lost River: The Sarasvati")
-        st.markdown("""
-        For centuries, the Sarasvati was considered a myth, a poetic imagination. But modern science—satellite imagery, geological surveys, and archaeology—has confirmed its existence. What is today the seasonal Ghaggar-Hakra riverbed, flowing through parts of Haryana, Rajasthan, and into Pakistan, is the remnant of that once-mighty Sarasvati. Tectonic shifts and climate change caused its tributaries to be captured by other river systems (the Yamuna and Sutlej), and the great river dried up around 1900 BCE.
-
-        The drying of the Sarasvati was a catastrophic ecological event that likely led to the eastward migration of populations, contributing to the decline of the urban phase of the Indus Valley Civilization and the shift of Indian civilization's center of gravity towards the Gangetic plain.
-        """)
+        prose("formalization", "sarasvati-evidence")
 
         st.subheader("The Legacy: The Indus-Sarasvati Civilization")
-        st.markdown("""
-        The civilization that flourished in this basin from roughly 3300 BCE to 1900 BCE is known as the Indus Valley Civilization (IVC), or more accurately, the Indus-Sarasvati Civilization, as a majority of its sites have been found along the paleochannel of the Sarasvati.
-
-        Haryana is home to some of the most significant sites of this ancient culture. The largest known city of the entire civilization, **Rakhigarhi**, is located in Hisar district, Haryana. It is even larger than the famous sites of Harappa and Mohenjo-daro.
-        """)
+        prose("formalization", "indus-valley")
         image_search_button("Rakhigarhi archaeological site", "Rakhigarhi excavation")
 
-        st.markdown("""
-        What does the legacy of Rakhigarhi and other sites like Banawali and Kunal (also in Haryana) tell us?
-        *   **Advanced Urban Planning:** They had grid-like street layouts, sophisticated drainage and water management systems, and multi-story brick houses.
-        *   **Trade and Commerce:** Seals found from these sites indicate a vast trade network extending to Mesopotamia (modern Iraq).
-        *   **Early Culture:** While we cannot decipher their script, their art, pottery, and ritual objects (like 'fire altars' found at Kalibangan, nearby in Rajasthan) suggest a culture deeply concerned with order, cleanliness, and ritual—early forms of what would evolve into Dharmic practices.
-
-        Therefore, when we say Haryana is the 'Land of Beginnings', it is no exaggeration. It is the soil where the seeds of Indian civilization were first sown, where urban life flourished, and where the foundational concepts of Dharma were first contemplated along the banks of a now-lost sacred river.
-        """)
+        prose("formalization", "rakhigarhi")
     st.markdown("---")
 
 
+@lesson_part("Games")
+def part_games():
     # =================================================================================================
     # PART 5: THE APPLICATION (THE GAMES & PUZZLES)
     # Goal: Solidify understanding through active, goal-oriented problem-solving.
@@ -271,9 +324,7 @@ def render():
 
     with game_tab1:
         st.subheader("The Farmer's Dilemma: A Test of Dharma")
-        st.markdown("""
-        **Scenario:** You are a poor farmer in ancient Haryana. A severe drought has ruined your crops. Your family is hungry. One night, you discover that your neighbor, who is also your cousin, has managed to save a small portion of his harvest and has stored it in his shed. He has refused to share it with anyone, saying he must protect his own family first. What is the most 'Dharmic' action to take?
-        """)
+        prose("games", "drought-dilemma")
         st.markdown("Read the options and choose the one that best reflects the complex nature of Dharma. There is no single 'perfect' answer, but one choice reflects a deeper understanding.")
 
         dharma_choice = st.radio(
@@ -335,6 +386,8 @@ def render():
     st.markdown("---")
 
 
+@lesson_part("Horizon")
+def part_horizon():
     # =================================================================================================
     # PART 6: THE HORIZON (THE JNANA-CHAKSHU - EYE OF KNOWLEDGE)
     # Goal: Motivate by revealing the concept's true power and its role in future lessons.
@@ -342,31 +395,17 @@ def render():
     # =================================================================================================
 
     st.header("Part 6: The Horizon - The Field of Dharma")
-    st.markdown("""
-    You have now sat under the Great Banyan Tree, simulated the cosmic ledger of Karma, and walked the ancient banks of the Sarasvati. You have begun to grasp the foundational principles that underpin not just a religion, but a whole worldview.
-
-    **So where does this lead? Why is this the *first* chapter?**
-
-    Because what we have discussed—Dharma, Karma, Svadharma—are not just abstract philosophical ideas. They are the operating system for the epic story that comes next. They are the very questions that drive the greatest heroes and villains of Indian lore to their destinies.
-
-    The concepts you've learned are the **rules of the game**. Now, you are ready to watch the players.
-    """)
+    prose("horizon", "summary")
     st.success("""
     **Key Takeaway (The Jnana-Chakshu - Eye of Knowledge):**
     Sanatana Dharma is not a set of commands, but a framework for understanding your place in the cosmos. Your life is a constant interplay between your unchangeable past (*Prarabdha Karma*), your present choices (*Kriyamana Karma*), and your unique purpose (*Svadharma*). Understanding this is the first step to navigating life with wisdom.
     """)
-    st.markdown("""
-    **The Next Chapter Awaits...**
-
-    The land of Haryana, this ancient cradle, is not just a place of quiet beginnings. It is destined to become a stage for the most profound and terrible conflict imaginable. A conflict where families will be torn apart, where the greatest warriors of an age will assemble, and where the very meaning of Dharma will be questioned, tested, and ultimately defined in a baptism of fire.
-
-    We are heading to **Kurukshetra**. We are heading to the **Mahabharata**.
-
-    In the next chapter, we will leave the age of myth and memory and enter the age of the epic. We will see how these principles of Dharma become the central conflict in a war that will shape the destiny of India forever. The questions will no longer be theoretical. They will be matters of life and death on the grandest scale.
-    """)
+    prose("horizon", "next-chapter")
     st.markdown("---")
 
 
+@lesson_part("Pariksha")
+def part_pariksha():
     # =================================================================================================
     # PART 7: THE CHECK-UP (THE PARIKSHA)
     # Goal: Provide a robust self-assessment.
@@ -412,4 +451,4 @@ def render():
                 st.success(f"**Correct:** {details['feedback']}")
             else:
                 st.error(f"**Not quite.** The correct answer is '{details['correct']}'. {details['feedback']}")
-            st.markdown("---")
\ No newline at end of file
+            st.markdown("---")
@@ -8,9 +8,21 @@
 #    `"Chapter 2: Echoes of the Mahabharata": dharma_chapter_2.render,`
 # ---
 
+import os
+
 import streamlit as st
 from utils.plotting import image_search_button
-import time
+from utils.reveal import start_reveal, staged_reveal
+from utils.lesson import lesson_part
+from utils.content import chapter_dir, lesson_content
+from utils.diagrams import graphviz_diagram
+from utils.genealogy import load_family
+from utils.randomness import shuffled
+from utils.retrieval import get_index
+
+prose = lesson_content(__name__)
+FAMILY_PATH = os.path.join(chapter_dir(__name__), "kuru_dynasty.json")
+TEACHINGS_PATH = os.path.join(chapter_dir(__name__), "gita_teachings.corpus.json")
 
 def render():
     """
@@ -18,36 +30,30 @@ def render():
     This chapter is a deep-dive, narrative-driven exploration following the 7-part guide.
     """
 
+    part_analogy()
+    part_mechanism()
+    part_gallery()
+    part_formalization()
+    part_games()
+    part_horizon()
+    part_pariksha()
+
+
+@lesson_part("Analogy")
+def part_analogy():
     # --- PART 1: THE CORE IDEA (THE ANALOGY) ---
     st.title("Chapter 2: Echoes of the Mahabharata")
     st.header("The Cosmic Family Feud on Sacred Ground")
-    st.markdown("""
-    ---
-    Before we speak of armies, of divine weapons, or of kings and crowns, let us begin with something far more universal and relatable: a family dispute over ancestral property.
-
-    Imagine a grand, sprawling ancestral home, built by revered forefathers, standing on the most fertile land in the entire region. This isn't just any home; it is the heart of the family's identity, a source of prosperity, and a symbol of their honour. For generations, it has been the silent witness to their shared joys and sorrows.
-
-    Now, imagine the family has grown. Two branches of cousins now lay claim to this legacy. One branch, the elder, believes the entire estate is theirs by right of birth, even if that right is built on a foundation of moral blindness and greed. The other, younger branch, having been denied their rightful share through deceit and malice, asks for a just and fair division. They don't even ask for half; they plead for just five villages, a symbolic token of their heritage, a place to live with dignity.
-
-    The elders refuse. Greed, like a cataract, has clouded their vision. They declare that they will not part with enough land to fit on the point of a needle without a fight.
-
-    This simple, tragic story of a family breaking apart over inheritance is the seed of the Mahabharata. But here, the family is the Kuru clan. The ancestral property is the throne of Hastinapura, the very heart of the Indian subcontinent. And the conflict is not merely a legal or familial squabble; it is a **Dharma Sankat**—a crisis of righteousness so profound that it draws in gods, sages, and kings from every corner of the land.
-
-    The battlefield, Kurukshetra in modern-day Haryana, transforms from a mere piece of land into a **Dharma-Kshetra**, a 'field of righteousness'. It becomes a cosmic stage where every action, every choice, and every arrow-loosed is weighed on the scales of Dharma. This is not just a war for a kingdom; it is a war to decide the very meaning of right and wrong for an entire epoch. The story of the Mahabharata, unfolding on Haryana's soil, is the ultimate exploration of human duty, sacrifice, grief, and the search for divine truth in the face of overwhelming despair. It’s the story of how a family feud became the bedrock of a civilization's moral philosophy.
-    """)
+    prose("analogy", "intro")
     image_search_button("A symbolic representation of the Kuru Family Tree", "Kuru family tree abstract art")
     st.markdown("---")
 
 
+@lesson_part("Mechanism")
+def part_mechanism():
     # --- PART 2: THE MECHANISM (INTERACTIVE DISCOVERY) ---
     st.header("The Mechanism: The Dharma Sankat Simulator")
-    st.markdown("""
-    The heart of the Mahabharata, the moment that elevates it from a mere war story to a timeless philosophical guide, is Arjuna's dilemma. On the brink of war, he sees his grand-uncles, his teachers, and his cousins arrayed against him. His warrior spirit collapses under the weight of his love and grief. Why must he kill his own kin for a kingdom?
-
-    This is the **Dharma Sankat**, the crisis of duty. Krishna's answer to this crisis forms the **Bhagavad Gita**.
-
-    Let's not just read about it. Let's *feel* the weight of this decision. Use the sliders below to experience the conflicting pulls of Dharma that tore Arjuna apart. As you adjust each one, the arguments presented to Arjuna will change, reflecting your chosen priorities.
-    """)
+    prose("mechanism", "gita-intro")
 
     st.subheader("Arjuna's Dilemma: Adjust the Scales of Duty")
 
@@ -108,6 +114,8 @@ def render():
     st.markdown("---")
 
 
+@lesson_part("Gallery")
+def part_gallery():
     # --- PART 3: THE GALLERY (SHOWCASING VARIETY) ---
     st.header("The Gallery: Sacred Sites of the Saga")
     st.markdown("""
@@ -118,34 +126,28 @@ def render():
 
     with tab1:
         st.subheader("Kurukshetra: The Field of Righteousness")
-        st.markdown("""
-        This is the grand stage. The name itself, `Dharma-Kshetra`, given in the very first verse of the Bhagavad Gita, defines its purpose. It was chosen, the stories say, because the soil of this land had a unique property: it would not let hatred and sin take root permanently, making it the perfect crucible to test Dharma. It was vast enough to hold the 18 `Akshauhini` (a battle formation) armies of the Kuru clan. Today, the city of Kurukshetra is a sprawling complex of temples, sacred water tanks, and memorials dedicated to the epic. It is a place where one can stand and imagine the thundering chariots and the great dilemma that faced Arjuna.
-        """)
+        prose("gallery", "kurukshetra")
         image_search_button("The plains of Kurukshetra today", "Kurukshetra field")
 
     with tab2:
         st.subheader("Jyotisar: The Fount of Divine Wisdom")
-        st.markdown("""
-        If Kurukshetra is the stage, Jyotisar is the sacred spot where the divine script was revealed. It is revered as the exact place where Lord Krishna paused the chariot in the middle of the two armies and delivered the celestial sermon of the Bhagavad Gita to a despondent Arjuna. The name 'Jyotisar' means 'the essence of light' or 'the essence of knowledge'. A single, ancient Banyan tree stands here, believed to be a direct descendant of the silent, eternal witness to that profound moment of divine revelation. To visit Jyotisar is to seek the very source of the Gita's wisdom.
-        """)
+        prose("gallery", "jyotisar")
         image_search_button("The Banyan Tree at Jyotisar", "Jyotisar Kurukshetra")
 
     with tab3:
         st.subheader("Brahma Sarovar: The Waters of Creation and Liberation")
-        st.markdown("""
-        This vast, sacred water tank is one of the most breathtaking sites in Kurukshetra. Its origins are believed to predate the Mahabharata itself, linked to Lord Brahma, the creator of the universe. During the war, it served as a vital water source. Legend holds that on the final day of the war, the defeated Duryodhana, in a last, desperate act, used his mystical powers to hide in the depths of this Sarovar. It is a place deeply associated with both creation and the final, tragic end of the Kauravas. A dip in its waters during a solar eclipse is considered to be of immense spiritual merit.
-        """)
+        prose("gallery", "brahma-sarovar")
         image_search_button("The sprawling Brahma Sarovar", "Brahma Sarovar Kurukshetra")
 
     with tab4:
         st.subheader("Thanesar: The Capital of a Preceding Era")
-        st.markdown("""
-        While Hastinapura was the Kuru capital, the city of Sthanishvara (modern Thanesar), was the capital of the preceding empire of Harsha Vardhana, and its history is deeply intertwined with Kurukshetra. The famous Shiva temple of Sthaneshwar Mahadev was a major pilgrimage site even during the Mahabharata era. It represents the continuity of Dharma in this region, a sacredness that existed before the great war and continued long after. It reminds us that the Mahabharata, while a pivotal event, was one chapter in the long spiritual history of this land.
-        """)
+        prose("gallery", "thanesar")
         image_search_button("Sthaneshwar Mahadev Temple", "Sthaneshwar Mahadev Temple Thanesar")
     st.markdown("---")
 
 
+@lesson_part("Formalization")
+def part_formalization():
     # --- PART 4: THE FORMALIZATION (THE GANITA SHASTRA) ---
     st.header("The Ganita Shastra: Deconstructing the Epic")
     st.markdown("""
@@ -153,13 +155,8 @@ def render():
     """)
 
     st.subheader("The Kuru Family Tree: A House Divided")
-    st.markdown("""
-    At its core, the conflict was between two sets of cousins, the Pandavas and the Kauravas. Understanding this family tree is crucial to grasping the personal stakes of the war. Below is a simplified diagram of the central figures.
-
-    *   **Pandavas:** The five sons of Pandu, guided by righteousness. Yudhishthira, Bhima, Arjuna, Nakula, and Sahadeva.
-    *   **Kauravas:** The one hundred sons of the blind king Dhritarashtra, led by the eldest, the arrogant Duryodhana.
-    """)
-    st.graphviz_chart('''
+    prose("formalization", "family-tree")
+    graphviz_diagram('''
     digraph kuru_family {
         rankdir=TB;
         node [shape=box, style=rounded];
@@ -197,13 +194,36 @@ def render():
         Drona -> {Pandavas, Kauravas} [style=dotted, label=" Fights for Kauravas"];
 
     }
-    ''')
+    ''', height=560)
 
-
-    st.subheader("The Dharma of the Gita: Three Paths to the Divine")
+    st.markdown("#### The Relationship Finder")
     st.markdown("""
-    The Bhagavad Gita, delivered amidst the chaos, is not just one teaching, but a synthesis of spiritual paths. It lays down three primary margas (paths) that an individual can take to achieve moksha (liberation), tailored to different human temperaments. These are the core 'laws' or 'dharma' of the philosophy that emerged from the war.
+    The tree above is only the trunk. The full family is tangled: sons born to sages and gods, half-brothers who fought on opposite sides, cousins across kingdoms. Pick any two people to see exactly how they are related, and through whom.
     """)
+    family = load_family(FAMILY_PATH)
+    people = family.ids()
+    col1, col2 = st.columns(2)
+    with col1:
+        first = st.selectbox("First person", people, index=people.index("karna"),
+                             format_func=family.name, key="kuru_relation_first")
+    with col2:
+        second = st.selectbox("Second person", people, index=people.index("arjuna"),
+                              format_func=family.name, key="kuru_relation_second")
+    relation = family.relation(first, second)
+    if relation.kind is None:
+        st.warning(relation.sentence)
+    else:
+        st.success(relation.sentence)
+    for pid in (first, second):
+        note = family.people[pid].get("note")
+        if note:
+            st.caption(f"**{family.name(pid)}**: {note}")
+    if len(relation.path) > 1:
+        graphviz_diagram(family.subgraph_dot(relation), height=80 + 70 * len(relation.path))
+
+
+    st.subheader("The Dharma of the Gita: Three Paths to the Divine")
+    prose("formalization", "three-paths")
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -214,33 +234,18 @@ def render():
         st.metric(label="Core Paths (Yogas)", value="3")
 
     st.markdown("#### 1. Karma Yoga: The Path of Selfless Action")
-    st.markdown("""
-    *   **For Whom:** The active, dynamic individual. The householder, the soldier, the leader, the professional.
-    *   **Core Principle:** This is the path we explored in the interactive simulator. Its genius lies in its practicality. It does not ask you to renounce the world, but to renounce the *attachment to the fruits of your work*. You perform your duty to the best of your ability, not for personal gain, praise, or reward, but as an offering to a higher ideal (be it God, society, or Dharma itself).
-    *   **Gita's Words (Gita 3.19):** *"Therefore, without being attached to the fruits of activities, one should act as a matter of duty, for by working without attachment one attains the Supreme."*
-    *   **Example:** A doctor treating a patient with utmost dedication, irrespective of whether they will be paid or thanked. Their duty is simply to heal. That is Karma Yoga.
-
-    """)
+    prose("formalization", "karma-yoga")
 
     st.markdown("#### 2. Jnana Yoga: The Path of Knowledge")
-    st.markdown("""
-    *   **For Whom:** The intellectual, the contemplative, the philosophical. Those who seek answers through inquiry and wisdom.
-    *   **Core Principle:** This path involves a deep, intellectual inquiry into the nature of reality. It is the process of distinguishing the eternal from the temporary, the Self (Atman) from the non-Self (the body, the mind, the ego). Through study, reflection, and meditation, the Jnana Yogi comes to realize their true identity as the immortal soul, not the perishable body or fleeting thoughts.
-    *   **Gita's Words (Gita 4.38):** *"In this world, there is nothing so sublime and pure as transcendental knowledge. Such knowledge is the mature fruit of all mysticism. And one who has become accomplished in the practice of devotional service enjoys this knowledge within himself in due course of time."*
-    *   **Example:** A physicist pondering the fundamental laws of the universe to understand its true nature is treading a path parallel to the Jnana Yogi.
-
-    """)
+    prose("formalization", "jnana-yoga")
 
     st.markdown("#### 3. Bhakti Yoga: The Path of Devotion")
-    st.markdown("""
-    *   **For Whom:** The emotional, the relational, the artistic. Those who find fulfillment through love and surrender.
-    *   **Core Principle:** This is considered the most direct path. It involves channeling all of one's emotional energy towards God. This love can take many forms: chanting His names, singing praises, seeing the divine in all beings, and surrendering one's will to the divine. The Bhakti Yogi builds a deep, personal, loving relationship with the Divine.
-    *   **Gita's Words (Gita 9.34):** *"Engage your mind always in thinking of Me, become My devotee, offer obeisances to Me and worship Me. Being completely absorbed in Me, surely you will come to Me."*
-    *   **Example:** A musician composing a song not for fame, but out of pure love for their chosen ideal, is practicing Bhakti Yoga.
-    """)
+    prose("formalization", "bhakti-yoga")
     st.markdown("---")
 
 
+@lesson_part("Games")
+def part_games():
     # --- PART 5: THE APPLICATION (THE GAMES & PUZZLES) ---
     st.header("The Application: Test Your Dharmic Wisdom")
     st.markdown("""
@@ -304,9 +309,8 @@ def render():
         selected_scenario = st.selectbox("Select a scenario:", scenario_list, index=0)
 
         if selected_scenario:
-            options = scenarios[selected_scenario]["wrong"] + [scenarios[selected_scenario]["correct"]]
-            import random
-            random.shuffle(options)
+            options = shuffled(scenarios[selected_scenario]["wrong"] + [scenarios[selected_scenario]["correct"]],
+                               f"{__name__}/gita/{selected_scenario}")
             
             user_choice = st.radio(f"**Scenario:** *{selected_scenario}*\n\nWhich teaching applies best?", options, index=None, key=selected_scenario)
 
@@ -316,55 +320,61 @@ def render():
                     st.balloons()
                 else:
                     st.error(f"A good thought, but the more direct advice here would be: '{scenarios[selected_scenario]['correct']}'. Your choice might apply, but it's not the central theme for this specific problem.")
+
+        st.markdown("---")
+        st.markdown("#### Your Own Situation")
+        st.markdown("Describe something you are facing in your own words, and find the teachings of the Gita that speak to it most closely.")
+        situation = st.text_area("Describe your situation:", key="gita_situation",
+                                 placeholder="e.g. I keep comparing myself to my friends and feel I am falling behind.")
+        if situation.strip():
+            matches = get_index(TEACHINGS_PATH).search(situation, k=3)
+            if not matches:
+                st.warning("None of the teachings here speak to those words. Try describing what you feel, or what is at stake for you.")
+            for passage, score in matches:
+                st.success(f"**Bhagavad Gita {passage['ref']}:** {passage['teaching']}")
+                st.caption(f"*\"{passage['verse']}\"* (relevance {score:.0%})")
+            if matches:
+                st.caption("The verses are paraphrased from the Sanskrit.")
     
     with game3:
         st.subheader("Who Am I? - Kuru Kingdom Edition")
         st.markdown("Read the description and guess the character from the Mahabharata.")
 
-        characters = {
-            "Bhishma": "I took a terrible vow of celibacy and service to the throne of Hastinapura. I was the grand-uncle to both Pandavas and Kauravas, and fought for the latter out of duty, even though my heart was with the former. I could choose the time of my own death.",
-            "Drona": "I was the royal teacher of archery and military arts to both sets of cousins. Arjuna was my favorite student. My loyalty to the throne forced me to fight against him in the great war.",
-            "Karna": "I was the secret, abandoned son of Kunti, making me the eldest Pandava brother by birth. However, I was raised by a charioteer and became the closest friend of Duryodhana. I was known for my generosity and my skill in archery, which rivaled Arjuna's.",
-            "Yudhishthira": "I was the eldest of the five Pandava brothers, known as 'Dharmaraja' for my unwavering commitment to righteousness. My one great weakness was the game of dice, which led to our exile."
-        }
-        
-        char_name = st.selectbox("Choose a character to learn about:", list(characters.keys()))
+        family = load_family(FAMILY_PATH)
+        characters = [pid for pid in family.ids() if family.people[pid].get("clue")]
+        char_id = st.selectbox("Choose a character to learn about:", characters, format_func=family.name)
+        char_name = family.name(char_id)
         st.markdown("---")
-        st.markdown(f"**Description:** *{characters[char_name]}*")
+        st.markdown(f"**Description:** *{family.people[char_id]['clue']}*")
         st.markdown("---")
 
-        guess = st.text_input("Type your guess here and press Enter:")
+        guess = st.text_input("Type your guess here and press Enter:", on_change=start_reveal, args=("d2_who_am_i",))
 
         if guess:
-            if guess.strip().lower() == char_name.lower():
+            # Transliteration variants (Yudhisthir, Bhisma, Dronacharya) and other names
+            # (Partha, Radheya) count as the character's name.
+            match = family.names.lookup(guess)
+            if match is not None and match.key == char_id:
                 st.success(f"Correct! You have a keen eye for the heroes and legends of the epic. It is indeed {char_name}.")
-                time.sleep(1) # a small delay to let the user read
-                st.balloons()
+                staged_reveal("d2_who_am_i", [(1.0, st.balloons)]) # a small delay to let the user read
+            elif match is not None and match.method != "fuzzy":
+                # A fuzzy match is only a guess at a typo, too weak to name someone else.
+                st.error(f"Not quite: that sounds like {match.name}. Read the description again carefully. The clues point to another major figure in the saga.")
             else:
                 st.error("Not quite. Read the description again carefully. The clues point to another major figure in the saga.")
     st.markdown("---")
 
 
+@lesson_part("Horizon")
+def part_horizon():
     # --- PART 6: THE HORIZON (THE JNANA-CHAKSHU - EYE OF KNOWLEDGE) ---
     st.header("The Horizon: The Gita in the 21st Century")
-    st.markdown("""
-    The war ended. The Pandavas won the throne, but at a cost that haunted them forever. The fields of Kurukshetra fell silent. But the wisdom delivered on that battlefield—the Bhagavad Gita—became immortal. Why? Because it addresses the fundamental conflicts of the human condition.
-
-    The key takeaway from this chapter is not just the story of a war, but the revelation of a timeless toolkit for decision-making and purposeful living. **The Gita teaches us how to act with purpose in a world of chaos, by transforming our work into worship and our duty into devotion.**
-
-    *   **In the Office:** The principle of **Karma Yoga** is a powerful antidote to modern burnout. It encourages a programmer to code with excellence not just for a promotion, but for the sake of building something useful. It pushes a leader to manage a team with fairness not just for profit, but because it is their Dharma to nurture their people.
-
-    *   **In Personal Life:** The concept of the eternal **Atman** (Self) from **Jnana Yoga** provides immense resilience. It helps us navigate loss, failure, and criticism by reminding us that our true worth is not tied to our temporary bodies, careers, or social status.
-
-    *   **In Society:** The spirit of **Bhakti Yoga** inspires selfless service. It is the engine behind countless NGOs and individuals who work for the welfare of others, seeing a reflection of the divine in those they help.
-
-    The Mahabharata, and the Gita within it, is not a relic of the past to be placed in a museum. It is a living, breathing guide. Its stage was the ancient soil of Haryana, but its message is for all humanity, for all time.
-
-    **Teaser for the Next Chapter:** The great war, devastating as it was, created a massive power vacuum in northern India. The Kuru dynasty was shattered. This period of instability and recovery set the stage for the rise of new powers and great empires. In the next chapter, we will explore the **Rise of the Mahajanapadas and the stamp of Emperors like Ashoka**, who would try to unite the subcontinent not with the sword of war, but with the 'sword' of a different kind of Dharma.
-    """)
+    prose("horizon", "summary")
     st.markdown("---")
 
 
+@lesson_part("Pariksha")
+def part_pariksha():
     # --- PART 7: THE CHECK-UP (THE PARIKSHA) ---
     st.header("The Pariksha: Check Your Understanding")
     st.markdown("Let's consolidate what we've learned. Answer these questions to test your knowledge of the Mahabharata's core concepts.")
@@ -406,4 +416,4 @@ def render():
                 st.success(data["explanation"])
             else:
                 st.error(f"Not quite. The correct answer is: **{data['correct']}**. {data['explanation']}")
-        st.markdown("---")
\ No newline at end of file
+        st.markdown("---")
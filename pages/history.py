@@ -4,6 +4,8 @@
 
 import streamlit as st
 
+from utils.assets import asset_image
+
 def render():
     """Renders the History of Algebra page."""
     st.header("A Brief History of Algebra 📜")
@@ -11,8 +13,8 @@ def render():
     Algebra, the bedrock of so many mathematical and scientific fields, has a rich and fascinating history that spans continents and millennia. It didn't emerge fully formed but evolved through the contributions of numerous civilizations.
     """)
 
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Page_from_al-Khwarizmi%27s_al-Jabr.jpg/800px-Page_from_al-Khwarizmi%27s_al-Jabr.jpg",
-             caption="A page from 'The Compendious Book on Calculation by Completion and Balancing' by Muhammad ibn Musa al-Khwarizmi.")
+    asset_image("https://upload.wikimedia.org/wikipedia/commons/thumb/e/e3/Page_from_al-Khwarizmi%27s_al-Jabr.jpg/800px-Page_from_al-Khwarizmi%27s_al-Jabr.jpg",
+                caption="A page from 'The Compendious Book on Calculation by Completion and Balancing' by Muhammad ibn Musa al-Khwarizmi.")
 
     st.subheader("Ancient Origins: Babylon and Egypt")
     st.markdown("""
@@ -0,0 +1,35 @@
+# serve.py
+# Starts the app like `streamlit run app.py`, after warming up the server process
+# (see utils/warmup.py), so the first learner after a deploy or restart does not
+# pay for imports, font loading and first renders.
+#
+# Usage (from the project root; extra arguments are passed on to Streamlit):
+#   python serve.py
+#   python serve.py --server.port 8502 --server.headless true
+#   LESSON_SKIP_WARMUP=1 python serve.py      # start immediately, e.g. while developing
+
+import os
+import sys
+
+from streamlit.web import cli as stcli
+
+from utils.paths import PROJECT_ROOT
+from utils.warmup import warm_up
+
+SKIP_ENV_VAR = "LESSON_SKIP_WARMUP"
+
+
+def main():
+    if os.environ.get(SKIP_ENV_VAR, "").lower() not in ("1", "true", "yes", "on"):
+        timings = warm_up()
+        total = sum(seconds for _, seconds in timings)
+        steps = ", ".join(f"{name} {seconds:.1f} s" for name, seconds in timings)
+        print(f"Warmed up in {total:.1f} s ({steps}).", flush=True)
+    # The warmup already read Streamlit's config, so Streamlit notes that the [server]
+    # options changed when it applies the command line; they do take effect.
+    sys.argv = ["streamlit", "run", os.path.join(PROJECT_ROOT, "app.py"), *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
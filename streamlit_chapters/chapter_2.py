@@ -1,9 +1,15 @@
 # streamlit_chapters/chapter_2.py
 
 import streamlit as st
-import pandas as pd
 import numpy as np
+from utils.deferred import deferred_import
 from utils.plotting import image_search_button
+from utils.lesson import lesson_part
+from utils.static import static_data
+from utils.content import lesson_content
+
+pd = deferred_import("pandas")
+prose = lesson_content(__name__)
 
 def render():
     """
@@ -13,41 +19,62 @@ def render():
     st.title("📊 Chapter 2: The Art of Display")
     st.markdown("---")
 
-    # =================================================================================================
-    # Part 1: The Core Idea (The Analogy)
-    # =================================================================================================
-    st.header("Part 1: The Editor's Desk - From Raw News to a Gripping Story")
-    st.markdown("""
-    Imagine you are the chief editor of a bustling digital newspaper, let's call it *'The Daily Darpan'* (The Daily Mirror). Every morning, reporters send you raw, unformatted text and data: election results, the latest cricket scores, stock market numbers, and festival announcements.
+    part_analogy()
+    part_mechanism()
+    part_gallery()
+    part_formalization()
+    part_games()
+    part_horizon()
+    part_pariksha()
 
-    Is this raw information a story? Not yet. It's just... data.
 
-    Your job, as the editor, is to *present* this information so it tells a compelling story. You don't just dump the text on the page.
-    - You create a powerful **Headline** that grabs attention.
-    - You highlight the most **Critical Numbers** in bold, eye-catching boxes.
-    - You organize the detailed results into clean, easy-to-read **Tables**.
+# The sample tables never change, so they are built once per server and shared by
+# every learner (see utils/static.py). Style them with `.style`, never in place.
+@static_data
+def sales_report():
+    return pd.DataFrame({
+        'Salesperson': ['Arjun', 'Priya', 'Rohan', 'Sneha'],
+        'Units Sold': [150, 210, 120, 300],
+        'Region': ['North', 'South', 'West', 'South'],
+        'Profit (in ₹ Lakhs)': [1.2, 1.8, 0.9, 2.5]
+    })
 
-    This is precisely what you do in Streamlit. You are the editor of your web application. The tools we'll learn in this chapter—`st.markdown`, `st.metric`, and `st.dataframe`—are your editorial tools. They are the ink, the printing press, and the layout grid that transform your raw data into a clear, insightful, and beautiful narrative for your users.
 
-    This chapter is about learning the art of presentation. It’s about taking the numbers and words from your code and arranging them with such clarity that they create meaning and insight.
-    """)
+@static_data
+def snack_ledger():
+    return pd.DataFrame({
+        'Item': ['Samosa', 'Jalebi', 'Chai'],
+        'Price (₹)': [15, 25, 10],
+        'Quantity': [100, 50, 200]
+    })
+
+
+@static_data
+def sweet_shop_inventory():
+    return pd.DataFrame({
+        "Sweet Name": ["Kaju Katli", "Jalebi", "Ladoo", "Gulab Jamun", "Rasgulla"],
+        "Stock (kg)": [50, 45, 18, 60, 12]
+    })
+
+
+@lesson_part("Analogy")
+def part_analogy():
+    # =================================================================================================
+    # Part 1: The Core Idea (The Analogy)
+    # =================================================================================================
+    st.header("Part 1: The Editor's Desk - From Raw News to a Gripping Story")
+    prose("analogy", "newspaper")
     image_search_button("Vintage Indian Newspaper", "vintage indian newspaper")
     st.markdown("---")
 
 
+@lesson_part("Mechanism")
+def part_mechanism():
     # =================================================================================================
     # Part 2: The Mechanism (Interactive Discovery)
     # =================================================================================================
     st.header("Part 2: The Live Newsroom - Your Interactive Editing Tools")
-    st.markdown("""
-    Let's step into the live newsroom. Here, you can experiment with your editorial tools in real-time and see the immediate effect.
-
-    #### The Markdown Composer
-    Markdown is the language you use to write headlines, create lists, and emphasize text. It's like choosing the font and style for your newspaper's articles. Type in the box below and see how your text transforms instantly.
-
-    **Challenge:** Try to create a bold headline, an italicized sub-heading, and a bulleted list.
-    (Hint: Use `**Bold Text**`, `*Italic Text*`, and `- List Item`)
-    """)
+    prose("mechanism", "markdown-composer")
 
     col1, col2 = st.columns(2)
     with col1:
@@ -74,12 +101,7 @@ This is an *important* update.
     """)
 
     # Sample DataFrame for the data desk
-    df_data_desk = pd.DataFrame({
-        'Salesperson': ['Arjun', 'Priya', 'Rohan', 'Sneha'],
-        'Units Sold': [150, 210, 120, 300],
-        'Region': ['North', 'South', 'West', 'South'],
-        'Profit (in ₹ Lakhs)': [1.2, 1.8, 0.9, 2.5]
-    })
+    df_data_desk = sales_report()
 
     highlight_max_profit = st.checkbox("Highlight Top Profit")
     highlight_min_units = st.checkbox("Highlight Lowest Units Sold")
@@ -97,6 +119,8 @@ This is an *important* update.
     st.markdown("---")
 
 
+@lesson_part("Gallery")
+def part_gallery():
     # =================================================================================================
     # Part 3: The Gallery (Showcasing Variety)
     # =================================================================================================
@@ -132,9 +156,7 @@ st.markdown("> To be, or not to be, that is the question.")
 
     with gallery_tabs[1]:
         st.subheader("The Scoreboard: `st.metric()`")
-        st.markdown("""
-        `st.metric()` is designed for one thing: displaying a Key Performance Indicator (KPI) in a big, bold, beautiful way. It's perfect for a cricket scorecard, a stock price, or website visitors. The 'delta' shows the change from a previous value, instantly telling the user if the trend is positive or negative.
-        """)
+        prose("gallery", "metric")
         image_search_button("Live cricket scoreboard", "live cricket scoreboard")
         st.code("""
 st.metric(label="India's Score", value="357/5", delta="Overs: 48.2")
@@ -146,18 +168,8 @@ st.metric(label="New Signups", value="1,200", delta="150", delta_color="normal")
 
     with gallery_tabs[2]:
         st.subheader("The Business Ledger: `st.dataframe()` & `st.table()`")
-        st.markdown("""
-        When you have rows and columns of data, you need a table. Streamlit gives you two choices:
-        1.  **`st.dataframe()`**: This is the default choice. It's interactive! Users can scroll, sort by columns, and expand the table. It's best for displaying large datasets from sources like Pandas DataFrames.
-        2.  **`st.table()`**: This is a static table. It displays the entire dataset at once without scroll bars. It's best for small, simple tables where you want to show all the data at a glance.
-
-        Think of `st.dataframe` as an interactive digital ledger and `st.table` as a printed summary in a report.
-        """)
-        df_ledger = pd.DataFrame({
-            'Item': ['Samosa', 'Jalebi', 'Chai'],
-            'Price (₹)': [15, 25, 10],
-            'Quantity': [100, 50, 200]
-        })
+        prose("gallery", "tables")
+        df_ledger = snack_ledger()
         st.write("Interactive DataFrame (`st.dataframe`):")
         st.dataframe(df_ledger)
 
@@ -166,37 +178,18 @@ st.metric(label="New Signups", value="1,200", delta="150", delta_color="normal")
     st.markdown("---")
 
 
+@lesson_part("Formalization")
+def part_formalization():
     # =================================================================================================
     # Part 4: The Formalization (The Ganita Shastra - The Science of Presentation)
     # =================================================================================================
     st.header("Part 4: The 'Ganita Shastra' - The Science of Presentation")
-    st.markdown("""
-    Let's formalize our understanding. In ancient India, 'Ganita Shastra' referred to the science of calculation. Here, we adapt it to mean the 'Science of Presentation'. Let's look at the precise rules and powers of our new tools.
-
-    ### `st.markdown(body, unsafe_allow_html=False)`
-    -   **`body`**: The string to be rendered as Markdown.
-    -   **`unsafe_allow_html`**: A powerful but dangerous parameter. If `True`, you can inject raw HTML (`<p>`, `<font>`, etc.). Use it with extreme caution, as it can break your app's layout or create security risks if the HTML comes from a user.
-
-    ### `st.metric(label, value, delta=None, delta_color="normal")`
-    -   **`label`**: A short, descriptive title for the metric.
-    -   **`value`**: The main number or text to display.
-    -   **`delta`**: An optional string indicating the change from a previous value. It's displayed below the main value.
-    -   **`delta_color`**: Controls the color of the delta.
-        -   `"normal"`: Green for positive delta, red for negative.
-        -   `"inverse"`: Red for positive, green for negative (useful for things like 'rank' where a lower number is better).
-        -   `"off"`: The delta is always gray.
-
-    ### `st.dataframe(data, width=None, height=None)`
-    -   **`data`**: The data to display. Usually a Pandas DataFrame, but can be many other types.
-    -   **`width`** / **`height`**: Set the dimensions of the table in pixels. If not set, it will try to fit its container.
-    -   Its real power comes from being able to display **styled** DataFrames. You can pre-process a DataFrame with functions like `.style.background_gradient()` to create heatmaps directly in your table.
-
-    ### `st.table(data)`
-    -   **`data`**: The data to display.
-    -   It's simple and static. What you see is what you get. No scrolling, no sorting. Best for small, summary tables.
-    """)
+    prose("formalization", "markdown")
     st.markdown("---")
 
+
+@lesson_part("Games")
+def part_games():
     # =================================================================================================
     # Part 5: The Application (The Games & Puzzles)
     # =================================================================================================
@@ -244,10 +237,7 @@ col3.metric("Customer Rating", "4.8 ★", "+0.1")
         st.subheader("The Inventory Manager")
         st.markdown("You are managing the inventory for a sweet shop during Diwali. You need to display the stock levels. Use `st.dataframe` and its styling to highlight which item needs to be restocked urgently (less than 20 units).")
         
-        inventory_df = pd.DataFrame({
-            "Sweet Name": ["Kaju Katli", "Jalebi", "Ladoo", "Gulab Jamun", "Rasgulla"],
-            "Stock (kg)": [50, 45, 18, 60, 12]
-        })
+        inventory_df = sweet_shop_inventory()
 
         def highlight_low_stock(s):
             return ['background-color: #ffcccb' if v < 20 else '' for v in s]
@@ -280,26 +270,18 @@ st.dataframe(inventory_df.style.apply(highlight_stock, subset=['Stock (kg)']))
     st.markdown("---")
 
 
+@lesson_part("Horizon")
+def part_horizon():
     # =================================================================================================
     # Part 6: The Horizon (The Jnana-Chakshu - Eye of Knowledge)
     # =================================================================================================
     st.header("Part 6: The 'Jnana-Chakshu' - The Power of Clear Presentation")
-    st.markdown("""
-    You now hold the tools of the editor. This might seem simple—just displaying text and numbers—but it is the foundation of every data application ever built.
-
-    -   **Business Intelligence Dashboards** used by startups in Mumbai and Bengaluru are built on these principles. They use `st.metric` for KPIs and `st.dataframe` for deep dives.
-    -   **Machine Learning Engineers** use `st.markdown` to explain their models and `st.dataframe` to show prediction results.
-    -   **Financial Analysts** tracking the Nifty 50 use these tools to build live reports that are easier to understand than any spreadsheet.
-
-    **The Key Takeaway:** Raw data is noise. Well-presented data is information. Information that guides decisions is knowledge. Your job as a Streamlit developer is to facilitate this journey from data to knowledge.
-
-    **The Next Chapter:** So far, our newspaper is static. We, the editors, decide what the reader sees. But what if the reader could talk back? What if they could ask questions, filter the news, and create their own view?
-
-    In the next chapter, we will hand the controls to the user. We will explore **Interactive Widgets**, turning our one-way broadcast into a two-way conversation.
-    """)
+    prose("horizon", "summary")
     st.markdown("---")
 
 
+@lesson_part("Pariksha")
+def part_pariksha():
     # =================================================================================================
     # Part 7: The Check-up (The Pariksha)
     # =================================================================================================
@@ -338,4 +320,4 @@ st.dataframe(inventory_df.style.apply(highlight_stock, subset=['Stock (kg)']))
                 st.markdown(data["explanation"])
             else:
                 st.error("Incorrect. Here's the explanation:")
-                st.markdown(data["explanation"])
\ No newline at end of file
+                st.markdown(data["explanation"])
@@ -1,7 +1,11 @@
 import streamlit as st
-import time
 # We are assuming the image_search_button is in a shared utility file
 from utils.plotting import image_search_button
+from utils.reveal import start_reveal, staged_reveal
+from utils.lesson import lesson_part
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
 
 def render():
     """
@@ -11,6 +15,17 @@ def render():
     of the Lesson Design Guide.
     """
 
+    part_analogy()
+    part_mechanism()
+    part_gallery()
+    part_formalization()
+    part_games()
+    part_horizon()
+    part_pariksha()
+
+
+@lesson_part("Analogy")
+def part_analogy():
     # =================================================================================================
     # == PART 1: THE CORE IDEA (THE ANALOGY)
     # =================================================================================================
@@ -18,42 +33,20 @@ def render():
     st.subheader("From a Silent Sign to a Bustling Bazaar Stall")
     st.markdown("---")
 
-    st.markdown("""
-    Imagine you are walking through a vibrant Indian market. You see two stalls side-by-side.
-
-    The first stall has a beautifully painted, static wooden sign. It reads: **"Superb Samosas - Crispy, Hot, and Delicious."** It's informative, yes. You know what they sell. But it's a one-way street. The sign talks *at* you. It cannot listen. It cannot answer your questions. It cannot change.
-
-    The second stall has a cheerful vendor. As you approach, they make eye contact and smile. They don't just have a sign; they start a conversation.
-
-    *"Namaste! Welcome! Looking for a snack?"* they ask.
-    
-    You ask, *"How spicy are your samosas?"*
-    
-    They reply, *"We have three levels! Mild, for the gentle soul; Medium, for the adventurous spirit; and Fire, for the truly brave! Which one calls to you?"*
-
-    You point and ask, *"How much for four?"*
-
-    They respond, *"For you, a special price! Move this marker,"* they say, pointing to a sliding scale, *"to a price you feel is fair, and we have a deal!"*
-
-    This second stall is **interactive**. It responds to you. It reconfigures itself based on your questions and choices. It pulls you into an experience.
-
-    Until now, our Streamlit apps have been like that first wooden sign: beautiful, perhaps, but silent. We used `st.write` and `st.markdown` to display information. In this chapter, we will learn how to become the second vendor. We will give our app a voice and ears. We will learn to use **widgets**—the tools of conversation in Streamlit. These are the magical elements like buttons, sliders, and dropdown menus that allow your user to "talk" to your app, and your app to listen and respond.
-    """)
+    prose("analogy", "market-stalls")
 
     st.info("💡 **The Big Idea:** Static apps present information. Interactive apps have a conversation. Widgets are the building blocks of that conversation.")
 
     st.markdown("---")
 
 
+@lesson_part("Mechanism")
+def part_mechanism():
     # =================================================================================================
     # == PART 2: THE MECHANISM (INTERACTIVE DISCOVERY)
     # =================================================================================================
     st.header("The Vendor's Toolkit: Our First Interactive Playground")
-    st.markdown("""
-    Let's set up our own digital stall and experiment with the tools of the trade. Below is our "Control Panel." As you interact with each widget, pay close attention to the **"App's Brain"** section. This shows you exactly what the widget is "telling" our Python script.
-
-    This is the most crucial concept to grasp: **every time you click, slide, or select, Streamlit reruns your entire Python script from top to bottom.** The widget the user just changed simply reports its new value, which your script can then use to change what it displays. It's a continuous, dynamic loop.
-    """)
+    prose("mechanism", "control-panel")
 
     # Create a two-column layout for the interactive playground
     col1, col2 = st.columns([1, 1.5], gap="large")
@@ -103,6 +96,9 @@ def render():
 
     st.markdown("---")
 
+
+@lesson_part("Gallery")
+def part_gallery():
     # =================================================================================================
     # == PART 3: THE GALLERY (SHOWCASING VARIETY)
     # =================================================================================================
@@ -120,13 +116,7 @@ def render():
 
     with button_tab:
         st.subheader("🔘 The Trigger: `st.button`")
-        st.markdown("""
-        **Sub-Analogy:** The "Go!" signal in a race.
-        
-        The button is the simplest form of interaction. It does not store a value like the others; it simply reports whether it was pressed *on this specific script run*. Its value is `True` for the single run immediately after it's clicked, and `False` on all subsequent runs until clicked again.
-        
-        This makes it perfect for actions: starting a calculation, submitting a form, or triggering an animation. It's the "Do this now!" command.
-        """)
+        prose("gallery", "button")
         image_search_button("Website 'Submit' button", "submit button ui")
         st.code("""
 # When to use it: For actions and confirmations.
@@ -138,13 +128,7 @@ else:
 
     with select_tab:
         st.subheader("👇 The Choice: `st.selectbox`")
-        st.markdown("""
-        **Sub-Analogy:** A menu at a restaurant.
-        
-        The selectbox is for when you have a limited, pre-defined set of options for the user. It's clean, simple, and prevents the user from entering an invalid choice. You give it a list of options, and it returns the single option the user has currently selected.
-        
-        It's ideal for categories, modes, or any situation where the user must pick one from many.
-        """)
+        prose("gallery", "selectbox")
         image_search_button("Dropdown menu on a website", "web dropdown menu ui")
         st.code("""
 # When to use it: For selecting from a list of defined options.
@@ -157,13 +141,7 @@ st.write(f"Fetching the weather for {city}...")
 
     with slider_tab:
         st.subheader("↔️ The Dial: `st.slider`")
-        st.markdown("""
-        **Sub-Analogy:** The volume knob on a stereo.
-        
-        The slider is the king of numerical input over a range. It allows the user to select a value by dragging a handle along a continuum. This is far more intuitive for quantities than typing a number, as it gives a visual sense of scale.
-        
-        It can select a single value, or with an extra argument, it can select a *range* (a start and end value).
-        """)
+        prose("gallery", "slider")
         image_search_button("Price range filter on e-commerce", "price range slider ui")
         st.code("""
 # When to use it: For selecting numbers within a known range.
@@ -182,11 +160,7 @@ st.write(f"You selected items between ₹{price_range[0]} and ₹{price_range[1]
 
     with text_tab:
         st.subheader("✍️ The Blank Slate: `st.text_input`")
-        st.markdown("""
-        **Sub-Analogy:** A blank form field for your name.
-        
-        When you need information that you cannot pre-define—like a name, a search query, or a password—`st.text_input` is your tool. It provides a simple text box and returns whatever the user types into it as a string. You can also have a multi-line version called `st.text_area` for longer feedback or comments.
-        """)
+        prose("gallery", "text-input")
         image_search_button("Web search bar", "search bar ui")
         st.code("""
 # When to use it: For freeform text, like names, IDs, or search terms.
@@ -197,6 +171,8 @@ st.write(f"Searching for articles about: {user_query}")
     st.markdown("---")
 
 
+@lesson_part("Formalization")
+def part_formalization():
     # =================================================================================================
     # == PART 4: THE FORMALIZATION (THE GANITA SHASTRA)
     # =================================================================================================
@@ -206,21 +182,7 @@ st.write(f"Searching for articles about: {user_query}")
     """)
 
     st.subheader("The Golden Rule: The Script Reruns")
-    st.markdown("""
-    This is the law that governs all of Streamlit. It is so important, we will state it again:
-
-    > **Every time a user interacts with a widget, the entire Python script is re-executed from top to bottom.**
-
-    This seems strange at first. Why not just update the part of the page that changed? This "rerun" model is what makes Streamlit so simple and powerful. Your script is always a direct reflection of your app's state. You don't need to write complex "callback" logic to handle what changes when. You just write a simple, linear script.
-    
-    1.  A user moves a slider.
-    2.  The browser tells Streamlit the slider's new value.
-    3.  Streamlit says, "Aha! A change!" and **reruns `your_script.py` from the very first line.**
-    4.  When the execution reaches the slider's line of code (e.g., `value = st.slider(...)`), Streamlit doesn't use the default value. It substitutes the new value it received from the browser.
-    5.  The rest of your script executes naturally, using this new value.
-
-    This mental model is your key to unlocking everything. Your code isn't a one-time setup; it's a recipe that is re-cooked fresh every single time an ingredient changes.
-    """)
+    prose("formalization", "rerun-law")
 
     st.subheader("Essential Widget Parameters: The Art of Control")
     st.markdown("""
@@ -228,18 +190,10 @@ st.write(f"Searching for articles about: {user_query}")
     """)
 
     st.markdown("#### 1. The `label` (The Question)")
-    st.markdown("""
-    - **What it is:** The first argument to any widget. It's the text that's displayed to the user.
-    - **Syntax:** `st.widget("This is the label", ...)`
-    - **Dharma:** A good label is a clear, concise question. It is the most important piece of user interface design. Never have a widget without a clear label. Your user should never have to guess what a widget is for.
-    """)
+    prose("formalization", "label")
 
     st.markdown("#### 2. The `key` (The Name Tag)")
-    st.markdown("""
-    - **What it is:** An optional string parameter that gives the widget a unique internal name.
-    - **Syntax:** `st.slider("My Slider", key="my_unique_slider")`
-    - **Dharma:** The `key` is essential for two reasons. First, if you have two widgets of the same type with the exact same label, Streamlit will throw an error unless you give them unique keys. Second, and more importantly, the widget's value is stored in `st.session_state` under its key. We will explore `st.session_state` in a future chapter, but know that the `key` is the secret to making your app remember things.
-    """)
+    prose("formalization", "key")
     st.code("""
 # This will cause an error without keys!
 st.text_input("Enter your value:")
@@ -251,17 +205,16 @@ st.text_input("Enter your value:", key="value2")
     """, language="python")
 
     st.markdown("#### 3. The `help` (The Guidebook)")
-    st.markdown("""
-    - **What it is:** An optional string that provides a tooltip—a small help text that appears when the user hovers over a small `(?)` icon next to the widget.
-    - **Syntax:** `st.slider("Age", help="Drag the slider to your current age.")`
-    - **Dharma:** Use the `help` parameter to provide extra context or instructions without cluttering your main UI. If a widget's purpose isn't immediately obvious from its label, add a `help` tooltip. It's a sign of a thoughtful developer.
-    """)
+    prose("formalization", "help")
 
     st.slider("My slider with a tooltip", 0, 100, 50, help="Hover over the (?) to see me! This is useful for giving users more context.")
 
 
     st.markdown("---")
 
+
+@lesson_part("Games")
+def part_games():
     # =================================================================================================
     # == PART 5: THE APPLICATION (THE GAMES & PUZZLES)
     # =================================================================================================
@@ -299,9 +252,13 @@ st.text_input("Enter your value:", key="value2")
         )
         
         if st.button("Generate Design Specification", use_container_width=True):
+            start_reveal("s3_design_spec")
+
+        def show_generating():
             st.write("Generating Design Spec...")
-            with st.spinner('Calculating orbital paint trajectories...'):
-                time.sleep(2)
+            st.caption("⏳ Calculating orbital paint trajectories...")
+
+        def show_spec():
             st.success("Specification Generated!")
             st.markdown(f"""
             - **Satellite:** Bharat-SAT
@@ -311,6 +268,8 @@ st.text_input("Enter your value:", key="value2")
             - **Status:** Approved for fabrication.
             """)
 
+        staged_reveal("s3_design_spec", [(0.0, show_generating), (2.0, show_spec)])
+
     with game2:
         st.subheader("🎵 The Mood Music Curator")
         st.markdown("""
@@ -371,29 +330,21 @@ st.text_input("Enter your value:", key="value2")
 
     st.markdown("---")
 
+
+@lesson_part("Horizon")
+def part_horizon():
     # =================================================================================================
     # == PART 6: THE HORIZON (THE JNANA-CHAKSHU - EYE OF KNOWLEDGE)
     # =================================================================================================
     st.header("The Horizon: The Power of Conversation")
-    st.markdown("""
-    You have now mastered the fundamental building blocks of user interaction. These simple widgets are the atoms from which almost all complex web applications are built.
-    
-    - A **data science dashboard** uses `selectbox` to choose a dataset and `slider` to filter a date range.
-    - A **machine learning tool** uses `st.text_input` for a user to enter a sentence for analysis and a `button` to run the model.
-    - A **financial modeling app** uses multiple `st.slider` widgets for users to input their assumptions about market growth and inflation.
-
-    **The Key Takeaway:** Interactivity separates a report from a tool. By allowing users to input their own context, questions, and data, you transform your script from a piece of code into a collaborative partner.
-
-    However, as you were playing with the games, did you notice a small inconvenience? In the satellite painter, every time you changed a color, the whole app re-ran before you were ready. You couldn't set the primary color, then the secondary, and *then* generate the spec. You had to do it all at once with the button.
-    
-    What if we want to fill out multiple fields *before* submitting? How do we group widgets together? And how do we build apps that have completely separate pages, like a real website?
-
-    This brings us to the next steps in our journey...
-    """)
+    prose("horizon", "summary")
     st.success("🚀 **Next Chapter Tease:** In our upcoming chapters, we will learn how to structure our apps with **Layouts and Containers** to create clean, professional designs, and how to use **Forms** to batch multiple inputs together for a more seamless user experience.")
 
     st.markdown("---")
 
+
+@lesson_part("Pariksha")
+def part_pariksha():
     # =================================================================================================
     # == PART 7: THE CHECK-UP (THE PARIKSHA)
     # =================================================================================================
@@ -468,4 +419,4 @@ st.text_input("Enter your value:", key="value2")
                 st.success(f"**Correct!** {details['explanation']}")
             else:
                 st.error(f"**Incorrect.** The correct answer is: **'{details['answer']}'.** {details['explanation']}")
-        st.markdown("---")
\ No newline at end of file
+        st.markdown("---")
@@ -7,6 +7,10 @@ import time
 # from utils.plotting import image_search_button 
 # For this self-contained example, we'll define it here.
 import urllib.parse
+from utils.lesson import lesson_part, rerun_part
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
 
 def image_search_button(label, search_term, use_container_width=True):
     """Creates a Streamlit link button that searches Google Images in a new tab."""
@@ -27,49 +31,37 @@ def render():
     st.title("🧠 Chapter 5: The App's Memory - Understanding Session State")
     st.markdown("---")
 
+    part_analogy()
+    part_mechanism()
+    part_gallery()
+    part_formalization()
+    part_games()
+    part_horizon()
+    part_pariksha()
+
 
+@lesson_part("Analogy")
+def part_analogy():
     #================================================================================
     # PART 1: THE CORE IDEA (THE ANALOGY)
     #================================================================================
     st.markdown("## Part 1: The Brahma-Kamala of Memory - Our Akshaya Patra")
 
-    st.markdown("""
-    Before we write a single line of code, let us embark on a story. A story from the grand epic, the Mahabharata, that holds the very essence of the concept we are about to master.
-
-    Imagine the Pandavas, living in exile in the forest. They are noble princes, but now they are humble hermits. They have guests, learned sages and rishis, who visit them. But how does one host a guest in a forest with no kingdom, no treasury, no granary? A deep worry creases Yudhisthira's brow. To fail to show hospitality is a great adharma.
-
-    Seeing his plight, Yudhisthira prays to Surya, the Sun God. Pleased with his devotion, Surya grants him a divine vessel: the **Akshaya Patra**, the *Inexhaustible Vessel*.
-    """)
+    prose("analogy", "akshaya-patra")
 
     image_search_button("Akshaya Patra Mahabharata", "Akshaya Patra Mahabharata story")
 
-    st.markdown("""
-    This vessel was not ordinary. It had a magical property. Every day, Draupadi could serve food from it to any number of guests. The vessel would never become empty. It would continuously produce food until she herself had taken her meal for the day. Once she ate, the vessel would be exhausted until the next sunrise.
-
-    Now, think about this beautiful concept. Each day is a new beginning, a 'reset'. And yet, the Akshaya Patra is there, ready to provide. It *remembers* its duty. It *holds* its bounty across the day, no matter how many sages come and go.
-
-    **This is the very heart of Streamlit's Session State.**
-
-    Every time a user clicks a button or moves a slider in your app, Streamlit does something that might surprise you: **it re-runs your entire Python script from top to bottom.** It's like a new sunrise. Every variable you created is wiped clean and re-initialized. Your `count = 0` is always `count = 0` at the start of each run. Your app, by default, has the memory of a goldfish. It's perpetually a new day, with an empty kitchen.
-
-    This is where `st.session_state` comes in. It is our Akshaya Patra.
-
-    `st.session_state` is a special, magical container that Streamlit gives us. It is **not** wiped clean on every re-run. It persists. It endures. It holds whatever we put inside it, safe from the constant cycle of script re-runs. It allows our app to have a *memory within a single user session*. It's how our app can remember the user's name, the items in their shopping cart, or their score in a game, even as they click around and cause the script to re-run dozens of times.
-
-    In this chapter, we will learn how to receive this divine vessel. We will learn how to store our data within it, how to retrieve that data, and how to use it to build applications that are not just interactive, but intelligent, responsive, and truly stateful. We are about to give our app a memory, a consciousness. We are about to give it its own Akshaya Patra.
-    """)
+    prose("analogy", "magic-vessel")
     st.markdown("---")
 
 
+@lesson_part("Mechanism")
+def part_mechanism():
     #================================================================================
     # PART 2: THE MECHANISM (INTERACTIVE DISCOVERY)
     #================================================================================
     st.markdown("## Part 2: Feeling the Forgetting, Seeing the Remembering")
-    st.markdown("""
-    Words and analogies can take us far, but to truly understand, we must feel. Let's build two simple worlds side-by-side. The first world is a standard Streamlit app with no memory. The second world has been gifted the Akshaya Patra of `st.session_state`.
-
-    Your goal is simple: try to make the counter in each world go up.
-    """)
+    prose("mechanism", "two-worlds")
 
     col1, col2 = st.columns(2)
 
@@ -140,6 +132,9 @@ st.metric("Counter Value", st.session_state.count_with_state)
     st.caption("Try clicking the 'Rememberful World' button and see the `count_with_state` value update here in real-time.")
     st.markdown("---")
 
+
+@lesson_part("Gallery")
+def part_gallery():
     #================================================================================
     # PART 3: THE GALLERY (SHOWCASING VARIETY)
     #================================================================================
@@ -167,13 +162,13 @@ st.metric("Counter Value", st.session_state.count_with_state)
             if st.button("Submit Name"):
                 # Transfer from the widget's state key to our desired state key
                 st.session_state.user_name = st.session_state.user_name_input
-                st.rerun() # Rerun to update the UI immediately
+                rerun_part() # Rerun to update the UI immediately
         else:
             st.success(f"### Welcome back, {st.session_state.user_name}!")
             st.write("Notice how the input box is gone. The app *remembers* you now.")
             if st.button("Forget My Name"):
                 del st.session_state.user_name # We can delete keys too!
-                st.rerun()
+                rerun_part()
         
         image_search_button("Traditional Indian Welcome 'Namaste'", "Namaste welcome")
 
@@ -196,7 +191,7 @@ st.metric("Counter Value", st.session_state.count_with_state)
                 if submitted and name:
                     st.session_state.user_data['name'] = name
                     st.session_state.wizard_step = 2
-                    st.rerun()
+                    rerun_part()
         
         elif st.session_state.wizard_step == 2:
             st.info("Step 2: Contact Information")
@@ -206,7 +201,7 @@ st.metric("Counter Value", st.session_state.count_with_state)
                 if submitted and email:
                     st.session_state.user_data['email'] = email
                     st.session_state.wizard_step = 3
-                    st.rerun()
+                    rerun_part()
 
         elif st.session_state.wizard_step == 3:
             st.info("Step 3: Confirmation")
@@ -217,7 +212,7 @@ st.metric("Counter Value", st.session_state.count_with_state)
         if st.button("Start Over"):
             st.session_state.wizard_step = 1
             st.session_state.user_data = {}
-            st.rerun()
+            rerun_part()
 
         image_search_button("Saptapadi seven steps Hindu wedding", "Saptapadi ritual")
         st.caption("Just like the seven sacred steps of the Saptapadi, each step in our wizard builds upon the last, held together by a sacred bond - in our case, `st.session_state`.")
@@ -235,7 +230,7 @@ st.metric("Counter Value", st.session_state.count_with_state)
 
         if st.button("Toggle View Mode"):
             st.session_state.detailed_view = not st.session_state.detailed_view
-            st.rerun()
+            rerun_part()
 
         st.markdown("---")
         st.subheader("Your Data Report")
@@ -256,32 +251,22 @@ st.metric("Counter Value", st.session_state.count_with_state)
     st.markdown("---")
 
 
+@lesson_part("Formalization")
+def part_formalization():
     #================================================================================
     # PART 4: THE FORMALIZATION (THE GANITA SHASTRA)
     #================================================================================
     st.markdown("## Part 4: The Ganita Shastra - The Laws and Language of Memory")
-    st.markdown("""
-    We have felt the power of the Akshaya Patra. Now, let us become its master. We must learn the formal language, the *sutras* and principles that govern its behavior. This is the 'Ganita Shastra' (the Science of Calculation, or in our case, the Science of State).
-
-    `st.session_state` behaves almost exactly like a standard Python dictionary. If you know how to use a dictionary, you are 90% of the way there. It is an object that stores key-value pairs.
-    """)
+    prose("formalization", "intro")
 
     st.subheader("1. The Sutra of Initialization: The First Offering")
-    st.markdown("""
-    You cannot take food from an empty vessel. The first and most critical rule is: **you must initialize a key before you can use it.**
-
-    The problem is that your script re-runs from top to bottom. A simple `st.session_state.my_variable = 0` will reset your variable on every single interaction. This defeats the purpose!
-
-    The solution is the sacred initialization block we saw earlier. This is the single most important pattern in state management:
-    """)
+    prose("formalization", "initialize")
     st.code("""
 # The Canonical Initialization Block
 if 'my_key' not in st.session_state:
     st.session_state.my_key = 'my_initial_value'
     """, language="python")
-    st.markdown("""
-    **The Dharma (The Law):** This code says, "Look into the Akshaya Patra. Is there a dish called 'my_key'? If there isn't, and *only* if there isn't, create it and give it an initial value." Since this check happens on every re-run, the inner block is executed only on the very first run of the session, before 'my_key' exists. After that, the key is present, and the block is skipped, preserving the value within.
-    """)
+    prose("formalization", "read-write")
 
     st.subheader("2. The Sutra of Access: Reading and Writing")
     st.markdown("Once initialized, interacting with the state is beautifully simple. You can access values using two styles:")
@@ -315,15 +300,7 @@ if st.button("Logout"):
     """, language="python")
 
     st.subheader("4. The Hidden Magic: Widget Keys")
-    st.markdown("""
-    This is a subtle but powerful feature. **Every interactive widget in Streamlit can be connected directly to session state using the `key` argument.**
-
-    When you write `st.text_input("Your name", key="my_input")`, Streamlit does two things automatically:
-    1.  The value of the text input is now stored in `st.session_state.my_input`.
-    2.  If `st.session_state.my_input` already has a value, the text input widget will initialize with that value.
-
-    It's a two-way street! The widget updates the state, and the state sets the widget.
-    """)
+    prose("formalization", "widget-keys")
     st.code("""
 import streamlit as st
 
@@ -343,6 +320,8 @@ st.write("The current value in session state is:", st.session_state.name)
     st.markdown("---")
 
 
+@lesson_part("Games")
+def part_games():
     #================================================================================
     # PART 5: THE APPLICATION (THE GAMES & PUZZLES)
     #================================================================================
@@ -377,7 +356,7 @@ st.write("The current value in session state is:", st.session_state.name)
             if st.button("Add to Inventory"):
                 st.session_state.inventory[spice_to_add] += qty_to_add
                 st.success(f"Added {qty_to_add} units of {spice_to_add}!")
-                st.rerun()
+                rerun_part()
         
         with col_b:
             st.markdown("**Sell**")
@@ -389,11 +368,11 @@ st.write("The current value in session state is:", st.session_state.name)
                     st.success(f"Sold {qty_to_sell} units of {spice_to_sell}!")
                 else:
                     st.error(f"Not enough {spice_to_sell}! You only have {st.session_state.inventory[spice_to_sell]}.")
-                st.rerun()
+                rerun_part()
 
         if st.button("Reset Inventory"):
             del st.session_state.inventory
-            st.rerun()
+            rerun_part()
         st.caption("This game tests your ability to manage a dictionary in state, performing updates based on user input.")
 
     with game_tabs[1]:
@@ -442,13 +421,13 @@ st.write("The current value in session state is:", st.session_state.name)
                     if st.session_state.room_state['door_locked']:
                         st.session_state.room_state['door_locked'] = False
                         st.write("> You insert the key into the lock. It turns with a satisfying click! The door is now unlocked.")
-                        st.rerun()
+                        rerun_part()
                     else:
                         st.write("> The door is already unlocked.")
 
         if st.button("Reset Puzzle"):
             del st.session_state.room_state
-            st.rerun()
+            rerun_part()
         st.caption("This game tests your ability to use boolean flags in state to control the logic and narrative flow of an application.")
 
 
@@ -477,7 +456,7 @@ st.write("The current value in session state is:", st.session_state.name)
         item_to_add = st.selectbox("Choose a sweet to add:", options=list(products.keys()))
         if st.button(f"Add {item_to_add} to Cart"):
             st.session_state.cart.append(item_to_add)
-            st.rerun()
+            rerun_part()
 
         st.markdown("---")
         st.subheader("Your Shopping Cart")
@@ -495,40 +474,25 @@ st.write("The current value in session state is:", st.session_state.name)
 
         if st.button("Empty Cart"):
             st.session_state.cart = []
-            st.rerun()
+            rerun_part()
 
         st.caption("This game tests your ability to manage a list in state, adding items and then reading from the list to perform calculations.")
 
     st.markdown("---")
 
+
+@lesson_part("Horizon")
+def part_horizon():
     #================================================================================
     # PART 6: THE HORIZON (THE JNANA-CHAKSHU - EYE OF KNOWLEDGE)
     #================================================================================
     st.markdown("## Part 6: The Jnana-Chakshu - The Eye of Future Knowledge")
-    st.markdown("""
-    You have mastered the Akshaya Patra. You have tamed the ephemeral nature of the web. `st.session_state` is more than a feature; it is a fundamental shift in what you can build. It is the boundary between a simple script that displays data and a true, stateful *application*.
-
-    With this skill, you have unlocked the door to creating:
-    *   **Personalized Dashboards:** Apps that remember a user's preferences, their favorite stocks, or the cities they track for weather.
-    *   **Complex Forms and Wizards:** Any process that requires multiple steps, like creating a user profile, booking a train ticket, or configuring a machine learning model.
-    *   **Interactive Games:** Any game, from a simple quiz to a complex puzzle, requires state to track score, progress, and inventory.
-    *   **User Login Systems:** The most fundamental state of all: is this user logged in or not? This is controlled by a simple boolean flag in `st.session_state`.
-
-    Think of the apps you use every day. They all have memory. Your email client remembers who you are. Your favorite shopping app remembers your cart. Your music app remembers your playlists. This is the power you now wield.
-
-    ### The Next Horizon: The Gift of Speed
-
-    We have bestowed the gift of **Memory** upon our app. It can remember what happened in the past. But what if a part of our app is very, very slow? What if we need to download a large file, query a huge database, or run a complex calculation that takes 30 seconds?
-
-    Right now, if that calculation is part of our script, it will re-run every single time, even if the inputs haven't changed! Our app may have a good memory, but it has no patience. It does the same hard work over and over again, needlessly.
-
-    This is the next challenge on our journey. We must give our app the gift of **Speed**. We must teach it not to re-calculate what it already knows.
-
-    In the next chapter, we will learn about **Caching** (`st.cache_data` and `st.cache_resource`). We will learn how to perform a slow operation just once and then store the result in a high-speed memory, giving our applications the instantaneous, magical feel of a truly professional tool. The journey from apprentice to master builder continues!
-    """)
+    prose("horizon", "summary")
     st.markdown("---")
 
 
+@lesson_part("Pariksha")
+def part_pariksha():
     #================================================================================
     # PART 7: THE CHECK-UP (THE PARIKSHA)
     #================================================================================
@@ -602,4 +566,4 @@ st.write("The current value in session state is:", st.session_state.name)
             else:
                 st.error("Not quite. Here's a hint:")
                 st.info(f"**Explanation:** {data['explanation']}")
-            st.markdown("---")
\ No newline at end of file
+            st.markdown("---")
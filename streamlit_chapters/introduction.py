@@ -1,16 +1,15 @@
 import streamlit as st
 from utils.plotting import image_search_button # Assuming this utility is available
+from utils.content import lesson_content
+
+prose = lesson_content(__name__)
 
 def render():
     """
     Renders the syllabus and introduction page for The Streamlit Saga.
     """
     st.header("Syllabus: The Streamlit Saga")
-    st.markdown("""
-    Welcome, creator! This saga is your journey from a curious apprentice to a master builder of web applications. 
-    You will learn not just the *how*, but the *why*, crafting everything from simple data displays to complex, interactive dashboards. 
-    We begin with a single line of code and end with an app deployed to the world.
-    """)
+    prose("render", "intro")
     
     st.subheader("Your 10-Chapter Journey")
     st.markdown("---")
@@ -0,0 +1,236 @@
+# tools/benchmark_chapters.py
+# This script benchmarks every chapter's render() and fails if one got slower.
+#
+# Each chapter is run with Streamlit's AppTest harness, on its own (without the
+# sidebar of app.py), in two situations:
+#
+#   - cold: the first render of a new session (empty session state), and
+#   - warm: a rerun after the widgets were moved to a representative state
+#     (see BENCHMARKS below), which is what every learner interaction costs.
+#
+# For both it records the median wall time, the peak memory allocated while the
+# script ran (tracemalloc) and the number of elements sent to the browser.
+# Cold numbers include AppTest's own session start-up, so compare them with
+# each other rather than with the warm ones.
+#
+# The numbers are compared with the baselines stored in tools/benchmark_baseline.json.
+# A chapter fails when a metric grows by more than --threshold percent (and by more
+# than a small absolute amount, so a 3 ms page is not failed for 1 ms of noise).
+# Timings depend on the machine: regenerate the baselines with --update on the
+# machine that runs the check, and commit them together with the change that
+# explains them.
+#
+# Usage (from the project root):
+#   python tools/benchmark_chapters.py                      # compare with the baselines
+#   python tools/benchmark_chapters.py --threshold 15       # stricter check
+#   python tools/benchmark_chapters.py --update             # record new baselines
+#   python tools/benchmark_chapters.py --only chapters.chapter_3 --runs 10
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from streamlit import config
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+BASELINE_PATH = os.path.join(PROJECT_ROOT, "tools", "benchmark_baseline.json")
+DEFAULT_THRESHOLD = 25.0
+
+SCRIPT_TEMPLATE = """
+import sys
+sys.path.insert(0, {root!r})
+import {module} as chapter
+chapter.render()
+"""
+
+# Every chapter module with a render(), and the widget values used for its warm rerun.
+BENCHMARKS = {
+    "chapters.chapter_1": {"c1_walk_x": 2.0, "c1_wind_y": 1.0, "c1_q1": "Magnitude and Direction"},
+    "chapters.chapter_2": {"c2_sl_ang_i": 30.0, "c2_sl_mag_j": 1.5},
+    "chapters.chapter_3": {"c3_a": 2.0, "c3_b": 1.0, "c3_c": -0.5, "c3_d": 1.5, "rot_angle": 90.0},
+    "chapters.chapter_4": {"c4_angle": 120, "weave_game": 90, "isro_game": "v = [1, 2, 3]"},
+    "chapters.chapter_5": {"c5_br": 1.2, "c5_sy": 0.6, "game1_slider": 0.7},
+    "chapters.chapter_6": {"q1_Matrix 1": "Safe (Invertible)", "q1_Matrix 2": "Dangerous (Singular)"},
+    "streamlit_chapters.introduction": {},
+    "streamlit_chapters.chapter_1": {"q0": "Building a house brick by brick"},
+    "streamlit_chapters.chapter_2": {"q_2": "For small, static tables where all data should be visible at once"},
+    "streamlit_chapters.chapter_3": {"primary_color_sat": "Deep Space Blue", "secondary_color_sat": "GSLV White"},
+    "streamlit_chapters.chapter_4": {"q_1": "`st.columns([2, 1])`"},
+    "streamlit_chapters.chapter_5": {"user_name_input": "Arjuna", "add_spice": "Cloves", "add_qty": 3},
+    "dharma_sindhu_saga.chapter_0_syllabus": {},
+    "dharma_sindhu_saga.chapter_1": {"archaeo_game": "Rakhigarhi"},
+    "dharma_sindhu_saga.chapter_2": {"q2": "Karma Yoga (Path of Action)"},
+}
+
+# A metric only counts as a regression if it also grew by at least this much.
+MIN_DELTA = {
+    "cold_ms": 5.0,
+    "warm_ms": 5.0,
+    "cold_alloc_kb": 256.0,
+    "warm_alloc_kb": 256.0,
+    "cold_elements": 1,
+    "warm_elements": 1,
+}
+
+
+def new_session(module_name):
+    return AppTest.from_string(SCRIPT_TEMPLATE.format(root=PROJECT_ROOT, module=module_name), default_timeout=120)
+
+
+def count_elements(node):
+    """Counts the elements (not the layout blocks) in an AppTest element tree."""
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    return (time.perf_counter() - start) * 1000
+
+
+def traced_run(at):
+    """Runs the script once and returns the peak memory allocated meanwhile, in KB."""
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - baseline) / 1024
+
+
+def apply_state(at, state):
+    for key, value in state.items():
+        at.session_state[key] = value
+
+
+def benchmark_chapter(module_name, state, runs):
+    """
+    Measures the cold and warm renders of one chapter.
+
+    Args:
+        module_name (str): The dotted name of the chapter module.
+        state (dict): Widget key -> value applied before the warm reruns.
+        runs (int): How many runs to take the median of.
+
+    Returns:
+        dict: The metrics of the chapter (see MIN_DELTA for their names).
+    """
+    # Import once up front: module import time is paid once per server, not per session.
+    importlib.import_module(module_name)
+
+    cold_times = []
+    for _ in range(runs):
+        at = new_session(module_name)
+        cold_times.append(timed_run(at))
+        if at.exception:
+            raise RuntimeError(f"{module_name} raised: {at.exception[0].message}")
+    cold_elements = count_elements(at._tree)
+    cold_alloc = traced_run(new_session(module_name))
+
+    apply_state(at, state)
+    at.run()  # The first rerun after the change can still fill caches.
+    warm_times = [timed_run(at) for _ in range(runs)]
+    if at.exception:
+        raise RuntimeError(f"{module_name} raised on rerun: {at.exception[0].message}")
+    warm_elements = count_elements(at._tree)
+    warm_alloc = traced_run(at)
+
+    return {
+        "cold_ms": round(statistics.median(cold_times), 1),
+        "warm_ms": round(statistics.median(warm_times), 1),
+        "cold_alloc_kb": round(cold_alloc, 1),
+        "warm_alloc_kb": round(warm_alloc, 1),
+        "cold_elements": cold_elements,
+        "warm_elements": warm_elements,
+    }
+
+
+def find_regressions(results, baselines, threshold):
+    """
+    Compares the results with the baselines.
+
+    Returns:
+        list: (module, metric, baseline, current) for every metric that regressed.
+    """
+    regressions = []
+    for module_name, metrics in results.items():
+        baseline = baselines.get(module_name)
+        if baseline is None:
+            continue
+        for metric, value in metrics.items():
+            old = baseline.get(metric)
+            if old is None:
+                continue
+            if value > old * (1 + threshold / 100) and value - old >= MIN_DELTA[metric]:
+                regressions.append((module_name, metric, old, value))
+    return regressions
+
+
+def load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every chapter's render() against stored baselines.")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement, the median is kept (default: 5).")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed growth of a metric in percent (default: {DEFAULT_THRESHOLD:g}).")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Benchmark only these chapters.")
+    parser.add_argument("--update", action="store_true", help="Store the results as the new baselines.")
+    args = parser.parse_args()
+
+    # Streamlit logs a warning with a stack trace for every unlabeled widget on every
+    # run. Parse the config first, otherwise it resets the level on the first run.
+    config.get_config_options()
+    set_log_level("error")
+
+    baselines = load_baselines()
+    results = {}
+    for module_name in args.only or BENCHMARKS:
+        metrics = benchmark_chapter(module_name, BENCHMARKS[module_name], args.runs)
+        results[module_name] = metrics
+        print(f"{module_name:<40} cold {metrics['cold_ms']:7.1f} ms {metrics['cold_alloc_kb']:9.0f} KB "
+              f"{metrics['cold_elements']:4d} el | warm {metrics['warm_ms']:7.1f} ms "
+              f"{metrics['warm_alloc_kb']:9.0f} KB {metrics['warm_elements']:4d} el")
+
+    if args.update:
+        baselines.update(results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baselines written to {os.path.relpath(BASELINE_PATH, PROJECT_ROOT)}")
+        return
+
+    missing = [name for name in results if name not in baselines]
+    if missing:
+        print(f"No baseline yet for: {', '.join(missing)} (run with --update)")
+
+    regressions = find_regressions(results, baselines, args.threshold)
+    if not regressions:
+        print(f"No chapter regressed by more than {args.threshold:g}%.")
+        return
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%:")
+    for module_name, metric, old, new in regressions:
+        print(f"  {module_name} {metric}: {old:g} -> {new:g} (+{(new - old) / old * 100:.0f}%)")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
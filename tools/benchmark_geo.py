@@ -0,0 +1,110 @@
+# tools/benchmark_geo.py
+# This script measures the map layer (see utils/geo.py) on a large synthetic layer:
+# how long loading takes (parsing, Douglas-Peucker per zoom level, grid index), how
+# many vertices each zoom level keeps, and the latency of viewport queries at every
+# zoom level, compared with a linear scan over all features.
+#
+# The synthetic layer has --features features spread over Haryana's bounding box:
+# a third points, a third rivers (random walks of --vertices vertices) and a third
+# small polygons, like a dense layer of villages, streams and fields would.
+#
+# Usage (from the project root):
+#   python tools/benchmark_geo.py
+#   python tools/benchmark_geo.py --features 50000 --queries 500
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils import geo  # noqa: E402
+
+# Haryana's bounding box: (lon_min, lat_min, lon_max, lat_max).
+EXTENT = (74.4, 27.6, 77.6, 31.0)
+
+
+def synthetic_layer(count, vertices, rng):
+    """Returns a GeoJSON FeatureCollection of count random points, lines and polygons."""
+    features = []
+    for i in range(count):
+        x, y = rng.uniform(EXTENT[0], EXTENT[2]), rng.uniform(EXTENT[1], EXTENT[3])
+        if i % 3 == 0:
+            geometry = {"type": "Point", "coordinates": [x, y]}
+        elif i % 3 == 1:
+            heading, line = rng.uniform(0, 2 * math.pi), []
+            for _ in range(vertices):
+                line.append([x, y])
+                heading += rng.gauss(0, 0.3)
+                x, y = x + 0.002 * math.cos(heading), y + 0.002 * math.sin(heading)
+            geometry = {"type": "LineString", "coordinates": line}
+        else:
+            radius = rng.uniform(0.002, 0.02)
+            ring = [[x + radius * (1 + 0.1 * rng.random()) * math.cos(a * 2 * math.pi / vertices),
+                     y + radius * (1 + 0.1 * rng.random()) * math.sin(a * 2 * math.pi / vertices)]
+                    for a in range(vertices)]
+            geometry = {"type": "Polygon", "coordinates": [ring + [ring[0]]]}
+        features.append({"type": "Feature", "properties": {"name": f"feature {i}"}, "geometry": geometry})
+    return {"type": "FeatureCollection", "features": features}
+
+
+def linear_scan(layer, bbox):
+    return [i for i, f in enumerate(layer.features)
+            if f.bbox[0] <= bbox[2] and f.bbox[2] >= bbox[0] and f.bbox[1] <= bbox[3] and f.bbox[3] >= bbox[1]]
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark viewport queries of the map layer.")
+    parser.add_argument("--features", type=int, default=12000, help="Features in the synthetic layer (default: 12000).")
+    parser.add_argument("--vertices", type=int, default=60, help="Vertices per line or polygon (default: 60).")
+    parser.add_argument("--queries", type=int, default=200, help="Viewport queries per zoom level (default: 200).")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    collection = synthetic_layer(args.features, args.vertices, rng)
+    start = time.perf_counter()
+    layer = geo.GeoLayer(collection)
+    print(f"Loaded {len(layer.features)} features in {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({len(layer.index.cells)} grid cells)")
+
+    print("\nMilliseconds per viewport query: the grid index, a linear scan of every box, and")
+    print("layer.viewport() (index plus the simplified geometries). Counts are medians.")
+    print(f"\n{'zoom':<16}{'vertices kept':>15}{'index p50':>11}{'index p95':>11}{'scan p50':>10}"
+          f"{'viewport p50':>14}{'features':>10}{'vertices':>10}")
+    for zoom in geo.ZOOM_LEVELS:
+        kept = sum(len(part) for f in layer.features for part in f.levels[zoom])
+        times, scans, viewports, sizes, shipped = [], [], [], [], []
+        for _ in range(args.queries):
+            center = (rng.uniform(EXTENT[0], EXTENT[2]), rng.uniform(EXTENT[1], EXTENT[3]))
+            bbox = geo.viewport_bbox(center, zoom)
+            start = time.perf_counter()
+            indexed = layer.index.query(bbox)
+            times.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            expected = linear_scan(layer, bbox)
+            scans.append((time.perf_counter() - start) * 1000)
+            if indexed != expected:
+                sys.exit(f"Index and scan disagree at {bbox}: {len(indexed)} != {len(expected)} features")
+            start = time.perf_counter()
+            found = layer.viewport(bbox, zoom)
+            viewports.append((time.perf_counter() - start) * 1000)
+            sizes.append(len(found))
+            shipped.append(sum(len(part) for _, parts in found for part in parts))
+        print(f"{zoom:<16}{kept:>15}{statistics.median(times):>11.2f}{percentile(times, 0.95):>11.2f}"
+              f"{statistics.median(scans):>10.2f}{statistics.median(viewports):>14.2f}"
+              f"{statistics.median(sizes):>10.0f}{statistics.median(shipped):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# tools/build_assets.py
+# This script stores every remote image the chapters show with asset_image() locally
+# (see utils/assets.py) and reports the variants and their sizes.
+#
+# The app does this itself the first time an image is needed (serve.py does it during
+# the warmup), so running this script is optional. Run it in a build or deploy step,
+# or with LESSON_ASSET_SOURCE=<directory> to build from local copies of the images.
+#
+# Usage (from the project root):
+#   python tools/build_assets.py
+#   LESSON_ASSET_SOURCE=~/wikimedia-images python tools/build_assets.py
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils import assets  # noqa: E402
+
+
+def main():
+    failures = assets.build_all()
+    for url, entry in sorted(assets.load_manifest().items()):
+        print(f"{url}\n  {entry['width']}x{entry['height']}, hash {entry['hash']}")
+        for width, files in sorted(entry["variants"].items(), key=lambda item: int(item[0])):
+            sizes = ", ".join(f"{extension} {os.path.getsize(os.path.join(assets.ASSET_DIR, name)) / 1024:.0f} KB"
+                              for extension, name in sorted(files.items()))
+            print(f"  {width:>5} px: {sizes}")
+    if failures:
+        print(f"\n{len(failures)} image(s) could not be fetched and are still linked remotely:")
+        for url, message in failures:
+            print(f"  {url}: {message}")
+        sys.exit(1)
+    print(f"\nAll images stored in {assets.ASSET_DIR}.")
+
+
+if __name__ == "__main__":
+    main()
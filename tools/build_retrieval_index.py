@@ -0,0 +1,70 @@
+# tools/build_retrieval_index.py
+# This script rebuilds the retrieval index of every passage corpus in the content
+# store (see utils/retrieval.py) and reports what it costs: how long building took,
+# how many passages and terms each index holds, how large it is on disk, how long
+# memory-mapping it takes, and how fast queries are.
+#
+# The app builds an index itself when it is missing or out of date (serve.py does it
+# during the warmup), so running this script is optional. Run it in a build or deploy
+# step to ship up-to-date indexes, or to try queries.
+#
+# Usage (from the project root):
+#   python tools/build_retrieval_index.py
+#   python tools/build_retrieval_index.py --query "I am afraid of failing my exams"
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils import retrieval  # noqa: E402
+
+SAMPLE_QUERIES = (
+    "I am terrified of failing my exam",
+    "my grandmother passed away and I cannot stop crying",
+    "I feel empty even though my business is successful",
+    "my brother betrayed me and I cannot forgive him",
+)
+# Queries timed per corpus, after one untimed query that warms up the page cache.
+TIMED_ROUNDS = 200
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the retrieval indexes and report their cost.")
+    parser.add_argument("--query", action="append", help="A query to run (repeatable). Defaults to a few samples.")
+    parser.add_argument("--limit", type=int, default=3, help="Passages to show per query (default: 3).")
+    args = parser.parse_args()
+    queries = args.query or SAMPLE_QUERIES
+
+    for path in retrieval.corpus_paths():
+        passages, fingerprint = retrieval.read_corpus(path)
+        start = time.perf_counter()
+        index = retrieval.build_index(passages, fingerprint)
+        build_ms = (time.perf_counter() - start) * 1000
+        directory = retrieval.index_dir(path)
+        size = retrieval.save_index(index, directory)
+        print(f"{os.path.relpath(path, PROJECT_ROOT)}: {len(index)} passages, {len(index.vocabulary)} terms, "
+              f"built in {build_ms:.0f} ms, {size / 1024:.0f} KB at {directory}")
+
+        start = time.perf_counter()
+        loaded = retrieval.load_index(passages, fingerprint, directory)
+        print(f"Memory-mapping it takes {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        loaded.search(queries[0])
+        start = time.perf_counter()
+        for round_ in range(TIMED_ROUNDS):
+            loaded.search(queries[round_ % len(queries)], k=args.limit)
+        print(f"A query takes {(time.perf_counter() - start) * 1000 / TIMED_ROUNDS:.3f} ms on average")
+
+        for query in queries:
+            print(f"\n{query!r}")
+            for passage, score in loaded.search(query, k=args.limit):
+                print(f"  {score:5.2f}  {passage.get('ref', ''):<8} {passage.get('teaching', '')[:70]}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# tools/build_search_index.py
+# This script rebuilds the full-text search index (see utils/search.py) and reports
+# what it costs: how long indexing took, how many sections and terms it holds, how
+# large it is on disk, how long loading it takes, and how fast a few queries are.
+#
+# The app builds the index itself when it is missing or out of date (serve.py does
+# it during the warmup), so running this script is optional. Run it in a build or
+# deploy step to ship an up-to-date index, or to try queries.
+#
+# Usage (from the project root):
+#   python tools/build_search_index.py
+#   python tools/build_search_index.py --query "session state" --query Karma
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils import search  # noqa: E402
+
+SAMPLE_QUERIES = ("determinant", "Karma", "session state", "eigenvector", "Kurukshetra")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the search index and report its cost.")
+    parser.add_argument("--query", action="append", help="A query to run (repeatable). Defaults to a few samples.")
+    parser.add_argument("--limit", type=int, default=5, help="Results to show per query (default: 5).")
+    args = parser.parse_args()
+
+    index = search.build_index()
+    size = search.save_index(index)
+    postings = sum(len(entries) for entries in index["postings"].values())
+    print(f"Indexed {len(index['documents'])} sections of {len(index['chapters'])} chapters "
+          f"in {index['build_seconds'] * 1000:.0f} ms")
+    print(f"{len(index['postings'])} terms, {postings} postings, {size / 1024:.0f} KB at {search.INDEX_PATH}")
+
+    start = time.perf_counter()
+    loaded = search.load_index()
+    print(f"Loading it takes {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for query in args.query or SAMPLE_QUERIES:
+        start = time.perf_counter()
+        results = search.search(query, limit=args.limit, index=loaded)
+        print(f"\n{query!r}: {len(results)} results in {(time.perf_counter() - start) * 1000:.2f} ms")
+        for result in results:
+            print(f"  {result['score']:6.2f}  {result['chapter']:<38} {result['title'][:60]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# tools/check_genealogy.py
+# This script checks the genealogy engine (utils/genealogy.py) against relations
+# of the Kuru dynasty whose answer is known, and fails if any comes out different.
+#
+# Each case is a pair of people and the term the engine must find; the cases cover
+# every branch of the engine: half-siblings through a mother (Karna and Arjuna),
+# uncles on the mother's side (Krishna and Abhimanyu), spouses, co-wives that are
+# not in-laws (Madri and Kunti), steps and in-laws. Run it after changing the engine
+# or kuru_dynasty.json.
+#
+# Usage (from the project root):
+#   python tools/check_genealogy.py
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.genealogy import load_family  # noqa: E402
+from utils.paths import CONTENT_ROOT  # noqa: E402
+
+FAMILY_PATH = os.path.join(CONTENT_ROOT, "dharma_sindhu_saga", "chapter_2", "kuru_dynasty.json")
+
+# (a, b, the term for how a is related to b)
+CASES = (
+    ("karna", "arjuna", "half-brother"),
+    ("arjuna", "karna", "half-brother"),
+    ("arjuna", "bhima", "brother"),
+    ("krishna", "abhimanyu", "maternal uncle"),
+    ("abhimanyu", "krishna", "nephew"),
+    ("arjuna", "krishna", "first cousin"),
+    ("draupadi", "bhima", "wife"),
+    ("madri", "kunti", "co-wife"),
+    ("kunti", "madri", "co-wife"),
+    ("subhadra", "draupadi", "co-wife"),
+    ("gandhari", "kunti", "co-sister-in-law"),
+    ("pandu", "karna", "stepfather"),
+    ("karna", "pandu", "stepson"),
+    ("kunti", "draupadi", "mother-in-law"),
+    ("draupadi", "kunti", "daughter-in-law"),
+)
+
+
+def main():
+    family = load_family(FAMILY_PATH)
+    failures = []
+    for a, b, expected in CASES:
+        relation = family.relation(a, b)
+        ok = relation.term == expected
+        print(f"{'ok  ' if ok else 'FAIL'} {relation.sentence}")
+        if not ok:
+            failures.append(f"{a} -> {b}: {relation.term!r}, expected {expected!r}")
+
+    if failures:
+        print(f"\n{len(failures)} of {len(CASES)} relation(s) wrong:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"\nAll {len(CASES)} relations as expected.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+# tools/export_static.py
+# This script exports every chapter to a static HTML site, for readers who only read.
+#
+# Most visits to the long narrative sections never touch a widget, yet each of them
+# holds a websocket session and a script thread on the Streamlit server. The pages
+# written here can be served by any static file server (nginx, GitHub Pages, a CDN),
+# which leaves the live app to the learners who play with it.
+#
+# Each chapter is rendered once, headless, with its default widget values (as the
+# warmup does) and every element is written out:
+#
+#   - prose, headings, captions, alerts, LaTeX and code as HTML: the markdown is
+#     converted here with markdown-it-py and the math with latex2mathml, to MathML
+#     that browsers typeset themselves, so the pages need no script to be read;
+#   - Matplotlib figures and images as pre-rendered PNG files in site/media/, named
+#     by a hash of their content, so an unchanged figure keeps its file name;
+#   - Graphviz diagrams as SVG laid out here by utils/diagrams.py (diagrams it
+#     already pre-rendered keep their pan-and-zoom viewer);
+#   - Plotly figures in their default state, drawn by the copy of plotly.js that
+#     ships with the plotly package, written to site/media/;
+#   - tables and dataframes as HTML tables;
+#   - every widget (or run of widgets) as a link to the same section in the live
+#     app (?chapter=<module>#<section>, see utils/search.py).
+#
+# Every tab and expander body is exported, not only the one open by default (see
+# utils/lazy.py). Content that only appears after a click (a game's result, a quiz
+# answer) is not in the export; the reader follows the link to the live app for it.
+#
+# Nothing is loaded from a third-party server. markdown-it-py and latex2mathml are in
+# requirements.txt; diagrams also need Graphviz's `dot` program.
+#
+# Usage (from the project root):
+#   python tools/export_static.py --app-url https://lessons.example.org/
+#   python tools/export_static.py --out /srv/www/lessons --only chapters.chapter_3
+
+import argparse
+import functools
+import hashlib
+import html
+import os
+import re
+import sys
+import time
+
+import plotly.offline
+from latex2mathml.converter import convert as latex_to_mathml
+from markdown_it import MarkdownIt
+from streamlit import config
+from streamlit.logger import set_log_level
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.testing.v1 import AppTest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils import assets, diagrams, lazy, search  # noqa: E402
+from utils.paths import CHAPTER_MODULES  # noqa: E402
+from utils.warmup import CHAPTER_SCRIPT  # noqa: E402
+
+WIDGET_TYPES = frozenset((
+    "button", "button_group", "camera_input", "chat_input", "checkbox", "color_picker",
+    "data_editor", "date_input", "download_button", "file_uploader", "form_submit_button",
+    "multiselect", "number_input", "radio", "select_slider", "selectbox", "slider",
+    "text_area", "text_input", "time_input", "toggle",
+))
+ALERT_TYPES = frozenset(("info", "success", "warning", "error"))
+# Streamlit's colored text, :red[...], which markdown does not know.
+COLORED_TEXT = re.compile(r":(red|orange|green|blue|violet|gray|grey|rainbow|primary)\[([^\]]*)\]")
+# $$display math$$ and $inline math$, as Streamlit's markdown reads them.
+MATH = re.compile(r"\$\$([\s\S]+?)\$\$|\$([^\s$](?:[^$\n]*?[^\s$])?)\$")
+MATH_PLACEHOLDER = re.compile(r"@@MATH(\d+)@@")
+PLOTLY_JS = "plotly.min.js"
+
+# Raw HTML passes through, as in the chapters' `unsafe_allow_html` markdown.
+_md = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ font-family: "Source Sans Pro", system-ui, sans-serif; line-height: 1.6; color: #31333f;
+       max-width: 58rem; margin: 0 auto; padding: 1rem 1.5rem 4rem; }}
+a {{ color: #ff4b4b; }}
+img {{ max-width: 100%; }}
+pre {{ background: #f0f2f6; padding: .75rem 1rem; border-radius: .5rem; overflow-x: auto; }}
+table {{ border-collapse: collapse; margin: .5rem 0; }}
+td, th {{ border: 1px solid #e6e9ef; padding: .25rem .6rem; }}
+nav {{ font-size: .9rem; margin-bottom: 1rem; }}
+.columns {{ display: flex; gap: 1rem; flex-wrap: wrap; }}
+.columns > .column {{ min-width: 12rem; }}
+.graphviz svg {{ max-width: 100%; height: auto; }}
+.container.border, .tab {{ border: 1px solid #e6e9ef; border-radius: .5rem; padding: .25rem 1rem; margin: .5rem 0; }}
+.tab-label {{ margin: .5rem 0 0; color: #ff4b4b; }}
+.caption {{ font-size: .875rem; color: #808495; }}
+.alert {{ border-radius: .5rem; padding: .25rem 1rem; margin: .5rem 0; }}
+.alert.info {{ background: #e8f1fb; }} .alert.success {{ background: #e8f5ec; }}
+.alert.warning {{ background: #fffae6; }} .alert.error {{ background: #fdecec; }}
+.metric .label {{ font-size: .875rem; }} .metric .value {{ font-size: 2rem; }}
+.interactive {{ border: 1px dashed #ff4b4b; border-radius: .5rem; padding: .5rem 1rem; margin: .5rem 0; }}
+.math-error {{ color: #ff4b4b; }}
+.red {{ color: #ff4b4b; }} .orange {{ color: #ffa421; }} .green {{ color: #21c354; }}
+.blue {{ color: #1c83e1; }} .violet {{ color: #803df5; }} .gray, .grey {{ color: #808495; }}
+</style>
+</head>
+<body>
+<nav>{nav}</nav>
+{body}
+{scripts}
+</body>
+</html>
+"""
+PLOTLY_SCRIPT = f"""<script src="../media/{PLOTLY_JS}"></script>
+<script>
+document.querySelectorAll(".plotly").forEach(el => {{
+  const spec = JSON.parse(el.dataset.spec);
+  Plotly.newPlot(el, spec.data, spec.layout, {{responsive: true}});
+}});
+</script>"""
+
+# Media URL -> (bytes, mimetype) of every image a chapter added while it was rendered.
+_media = {}
+
+
+def capture_media():
+    """Keeps a copy of every image or figure the chapters hand to Streamlit's media storage."""
+    add = MediaFileManager.add
+
+    @functools.wraps(add)
+    def capturing_add(self, path_or_data, mimetype, *args, **kwargs):
+        url = add(self, path_or_data, mimetype, *args, **kwargs)
+        if isinstance(path_or_data, bytes):
+            _media[url] = (path_or_data, mimetype)
+        return url
+
+    MediaFileManager.add = capturing_add
+
+
+def _math(source, display):
+    try:
+        return latex_to_mathml(source.strip(), display="block" if display else "inline")
+    except Exception:  # latex2mathml raises a variety of errors on LaTeX it does not know.
+        return f'<code class="math-error">{html.escape(source)}</code>'
+
+
+def _markdown(body, css_class="md", tag="div"):
+    """Returns the HTML of a markdown body, with its math typeset as MathML."""
+    math = []
+
+    def extract(match):
+        block, span = match.groups()
+        math.append(_math(block or span, bool(block)))
+        return f"@@MATH{len(math) - 1}@@"
+
+    # The math is taken out first, so the underscores of x_1 are not read as emphasis.
+    body = MATH.sub(extract, COLORED_TEXT.sub(r'<span class="\1">\2</span>', body))
+    markup = _md.renderInline(body) if tag == "span" else _md.render(body)
+    markup = MATH_PLACEHOLDER.sub(lambda match: math[int(match.group(1))], markup)
+    return f'<{tag} class="{css_class}">{markup}</{tag}>'
+
+
+class ChapterExporter:
+    """Turns the element tree of one rendered chapter into HTML."""
+
+    def __init__(self, module, out_dir, app_url):
+        self.module = module
+        self.out_dir = out_dir
+        self.app_url = app_url
+        self.anchor = None
+        self.scripts = set()
+        self.images = 0
+        # Why each diagram that could not be laid out was exported as its DOT source.
+        self.missing = []
+
+    def live_link(self):
+        return self.app_url + search.deep_link(self.module, self.anchor)
+
+    def blocks(self, node):
+        """Returns the HTML of a node's children, in order."""
+        parts = []
+        widgets = False
+        for _, child in sorted(node.children.items()):
+            if child.type in WIDGET_TYPES:
+                # A run of widgets becomes one link to the live app.
+                if not widgets:
+                    parts.append(
+                        f'<p class="interactive">🎮 This part is interactive. '
+                        f'<a href="{html.escape(self.live_link())}">Try it in the live app</a>.</p>'
+                    )
+                widgets = True
+                continue
+            widgets = False
+            parts.append(self.element(child))
+        return "\n".join(part for part in parts if part)
+
+    def element(self, node):
+        """Returns the HTML of one element or container."""
+        kind = node.type
+        proto = getattr(node, "proto", None)
+        if kind in ("title", "header", "subheader"):
+            anchor = proto.anchor or search.heading_anchor(proto.body)
+            self.anchor = anchor
+            return f'<{proto.tag} id="{html.escape(anchor)}">{_markdown(proto.body, "md-inline", "span")}</{proto.tag}>'
+        if kind in ("markdown", "latex"):
+            return _markdown(proto.body)
+        if kind == "caption":
+            return _markdown(proto.body, "md caption")
+        if kind == "divider":
+            return "<hr>"
+        if kind in ALERT_TYPES:
+            return f'<div class="alert {kind}">{_markdown(f"{proto.icon} {proto.body}".strip())}</div>'
+        if kind == "code":
+            return f'<pre><code class="language-{proto.language}">{html.escape(proto.code_text)}</code></pre>'
+        if kind in ("text", "json"):
+            return f"<pre>{html.escape(proto.body)}</pre>"
+        if kind == "metric":
+            delta = f'<div class="delta">{html.escape(proto.delta)}</div>' if proto.delta else ""
+            return (f'<div class="metric"><div class="label">{html.escape(proto.label)}</div>'
+                    f'<div class="value">{html.escape(proto.body)}</div>{delta}</div>')
+        if kind == "image":
+            return "\n".join(self.image(img.url, img.caption) for img in proto.imgs)
+        if kind == "plotly_chart":
+            self.scripts.add(PLOTLY_SCRIPT)
+            return (f'<div class="plotly" data-spec="{html.escape(proto.spec)}"></div>'
+                    f'<noscript><p class="interactive">This chart is drawn with JavaScript. '
+                    f'<a href="{html.escape(self.live_link())}">See it in the live app</a>.</p></noscript>')
+        if kind == "graphviz_chart":
+            try:
+                return f'<div class="graphviz">{diagrams.render_svg(proto.spec, proto.engine or "dot")}</div>'
+            except diagrams.DiagramError as error:
+                self.missing.append(str(error))
+                return f"<pre>{html.escape(proto.spec)}</pre>"
+        if kind == "iframe" and proto.srcdoc:
+            # An HTML component, such as the pan-and-zoom viewer of utils/diagrams.py.
+            return f'<iframe srcdoc="{html.escape(proto.srcdoc)}" style="width: 100%; height: 560px; border: 0"></iframe>'
+        if kind in ("dataframe", "table"):
+            return node.value.to_html(border=0)
+        if kind == "link_button":
+            return f'<p><a href="{html.escape(proto.url)}" target="_blank" rel="noopener">{html.escape(proto.label)}</a></p>'
+        if kind == "tab_container":
+            return "\n".join(
+                f'<section class="tab"><h4 class="tab-label">{_markdown(tab.label, "md-inline", "span")}</h4>'
+                f'{self.blocks(tab)}</section>'
+                for _, tab in sorted(node.children.items())
+            )
+        if kind == "expander":
+            opened = " open" if proto.expanded else ""
+            return f"<details{opened}><summary>{_markdown(node.label, 'md-inline', 'span')}</summary>{self.blocks(node)}</details>"
+        if kind == "flex_container" and proto.flex_container.direction == proto.flex_container.HORIZONTAL:
+            return f'<div class="columns">{self.blocks(node)}</div>'
+        if kind == "column":
+            return f'<div class="column" style="flex: {getattr(node, "weight", 0) or 1}">{self.blocks(node)}</div>'
+        if hasattr(node, "children"):
+            border = " border" if kind == "flex_container" and proto.flex_container.border else ""
+            return f'<div class="container{border}">{self.blocks(node)}</div>'
+        return f"<!-- not exported: {kind} -->"
+
+    def image(self, url, caption):
+        """Writes a captured image to media/ and returns its <img> tag."""
+        captured = _media.get(url)
+        if captured is None and url.startswith(assets.ASSET_URL + "/"):
+            # A remote image stored locally (see utils/assets.py).
+            mimetype = {"webp": "image/webp", "jpg": "image/jpeg"}.get(url.rsplit(".", 1)[-1], "image/png")
+            with open(os.path.join(assets.ASSET_DIR, url[len(assets.ASSET_URL) + 1:]), "rb") as source:
+                captured = (source.read(), mimetype)
+        if captured is None:
+            # An image from the web (or one the export did not see); link it as it is.
+            src = url
+        else:
+            data, mimetype = captured
+            extension = {"image/svg+xml": "svg", "image/jpeg": "jpg", "image/gif": "gif", "image/webp": "webp"}.get(mimetype, "png")
+            name = f"{hashlib.sha256(data).hexdigest()[:16]}.{extension}"
+            path = os.path.join(self.out_dir, "media", name)
+            if not os.path.exists(path):
+                with open(path, "wb") as target:
+                    target.write(data)
+            self.images += 1
+            src = f"../media/{name}"
+        figure = f'<img src="{html.escape(src)}" alt="{html.escape(caption)}" loading="lazy">'
+        if caption:
+            figure += f'<div class="caption">{html.escape(caption)}</div>'
+        return figure
+
+
+def export_chapter(module, out_dir, app_url):
+    """
+    Renders one chapter and writes it to <out_dir>/<package>/<chapter>.html.
+
+    Returns:
+        dict: "title", "path" (relative to out_dir), "bytes", "images", "error" (or None)
+            and "missing" (why diagrams were exported as their DOT source).
+    """
+    title, _ = search.chapter_sections(module)
+    _media.clear()
+    at = AppTest.from_string(CHAPTER_SCRIPT.format(root=PROJECT_ROOT, module=module), default_timeout=120)
+    at.run()
+    error = at.exception[0].message if at.exception else None
+
+    exporter = ChapterExporter(module, out_dir, app_url)
+    body = exporter.blocks(at.main)
+    exporter.anchor = None
+    nav = (f'<a href="../index.html">All chapters</a> · '
+           f'<a href="{html.escape(exporter.live_link())}">Open the interactive version</a>')
+    page = PAGE.format(title=html.escape(title), nav=nav, body=body, scripts="\n".join(sorted(exporter.scripts)))
+
+    package, name = module.split(".")
+    relative = f"{package}/{name}.html"
+    os.makedirs(os.path.join(out_dir, package), exist_ok=True)
+    with open(os.path.join(out_dir, relative), "w", encoding="utf-8") as target:
+        target.write(page)
+    return {"title": title, "path": relative, "bytes": len(page.encode("utf-8")),
+            "images": exporter.images, "error": error, "missing": exporter.missing}
+
+
+def write_index(out_dir, pages, app_url):
+    """Writes index.html, listing the exported chapters saga by saga."""
+    sections = []
+    for package, saga in search.SAGAS.items():
+        links = [f'<li><a href="{html.escape(page["path"])}">{_markdown(page["title"], "md-inline", "span")}</a></li>'
+                 for module, page in pages.items() if module.split(".")[0] == package]
+        if links:
+            sections.append(f"<h2>{html.escape(saga)}</h2>\n<ul>\n" + "\n".join(links) + "\n</ul>")
+    nav = f'<a href="{html.escape(app_url)}">Open the interactive app</a>'
+    page = PAGE.format(title="The Grand Library", nav=nav, scripts="",
+                       body="<h1>🌌 The Grand Library</h1>\n" + "\n".join(sections))
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as target:
+        target.write(page)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the chapters to a static HTML site.")
+    parser.add_argument("--out", default=os.path.join(PROJECT_ROOT, "site"), help="Output directory (default: site/).")
+    parser.add_argument("--app-url", default="http://localhost:8501/",
+                        help="URL of the live app that interactive parts link to (default: http://localhost:8501/).")
+    parser.add_argument("--only", action="append", help="Export only this chapter module (repeatable).")
+    args = parser.parse_args()
+
+    # Export every tab and expander body, as on Streamlit versions without lazy containers.
+    lazy._TRACKS_TABS = lazy._TRACKS_EXPANDERS = False
+    capture_media()
+    config.get_config_options()
+    set_log_level("error")
+    os.makedirs(os.path.join(args.out, "media"), exist_ok=True)
+    with open(os.path.join(args.out, "media", PLOTLY_JS), "w", encoding="utf-8") as target:
+        target.write(plotly.offline.get_plotlyjs())
+
+    start = time.perf_counter()
+    pages = {}
+    for module in args.only or CHAPTER_MODULES:
+        page = export_chapter(module, args.out, args.app_url)
+        pages[module] = page
+        status = f"  ERROR: {page['error']}" if page["error"] else ""
+        if page["missing"]:
+            status += f"  {len(page['missing'])} diagrams as DOT source ({page['missing'][0]})"
+        print(f"{module:<40} {page['bytes'] / 1024:7.0f} KB {page['images']:4d} images{status}")
+    write_index(args.out, pages, args.app_url)
+
+    media_dir = os.path.join(args.out, "media")
+    media_bytes = sum(os.path.getsize(os.path.join(media_dir, name)) for name in os.listdir(media_dir))
+    html_bytes = sum(page["bytes"] for page in pages.values())
+    print(f"\nExported {len(pages)} chapters to {args.out} in {time.perf_counter() - start:.1f} s "
+          f"({html_bytes / 1024:.0f} KB of HTML, {len(os.listdir(media_dir))} media files, {media_bytes / 1024:.0f} KB)")
+    if any(page["error"] for page in pages.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
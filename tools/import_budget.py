@@ -0,0 +1,123 @@
+# tools/import_budget.py
+# This script measures what importing the app costs a fresh server process and
+# fails if it exceeds the budget below.
+#
+# It imports everything app.py imports (the chapter modules and the utils) in a
+# new interpreter started with `python -X importtime`, and prints:
+#
+#   - the slowest modules, in the style of `-X importtime` (cumulative and self
+#     time in ms, nested imports indented), and
+#   - the import time of every top-level package (the sum of the self times of
+#     its modules), next to its budget.
+#
+# The script exits with an error when a package or the total exceeds its budget.
+# Packages without a budget only count towards the total. Like the benchmarks,
+# the times depend on the machine: the budgets leave about 2x headroom on the
+# single-CPU machine they were set on. Scale them with --scale elsewhere.
+#
+# Usage (from the project root):
+#   python tools/import_budget.py
+#   python tools/import_budget.py --top 40
+#   python tools/import_budget.py --scale 0.5      # a faster machine
+
+import argparse
+import collections
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.paths import CHAPTER_MODULES  # noqa: E402
+
+# What app.py imports besides the chapters.
+APP_MODULES = CHAPTER_MODULES + ("utils.metrics", "utils.profiler", "utils.recorder")
+
+# Import time budget in ms per top-level package, and for everything together.
+IMPORT_BUDGET_MS = {
+    "matplotlib": 600,
+    "streamlit": 500,
+    "pandas": 400,
+    "numpy": 200,
+    "scipy": 0,  # No chapter needs it at start-up; import it with utils.deferred.
+    "plotly": 100,
+    "chapters": 50,
+    "streamlit_chapters": 50,
+    "dharma_sindhu_saga": 50,
+    "utils": 30,
+}
+TOTAL_BUDGET_MS = 2600
+
+
+def measure_imports(modules):
+    """
+    Imports the modules in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        list: (self ms, cumulative ms, depth, module) per imported module, in the
+            order `-X importtime` reports them (nested imports first).
+    """
+    code = "; ".join(f"import {name}" for name in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((int(self_us) / 1000, int(cumulative_us) / 1000, depth, name.strip()))
+    return entries
+
+
+def package_times(entries):
+    """Returns {top-level package: ms}, summing the self times of its modules."""
+    totals = collections.Counter()
+    for self_ms, _, _, name in entries:
+        totals[name.split(".")[0]] += self_ms
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the app's import time against a budget.")
+    parser.add_argument("--top", type=int, default=20, help="Slowest modules to show (default: 20).")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget by this factor.")
+    args = parser.parse_args()
+
+    entries = measure_imports(APP_MODULES)
+    print(f"{'cumulative':>10} | {'self':>8} | module (ms)")
+    for self_ms, cumulative_ms, depth, name in sorted(entries, key=lambda e: -e[1])[:args.top]:
+        print(f"{cumulative_ms:10.1f} | {self_ms:8.1f} | {'  ' * depth}{name}")
+
+    packages = package_times(entries)
+    total = sum(packages.values())
+    failures = []
+    print(f"\n{'package':<22} {'ms':>8} {'budget':>8}")
+    for package, ms in packages.most_common():
+        budget = IMPORT_BUDGET_MS.get(package)
+        if budget is None:
+            if ms >= 10:
+                print(f"{package:<22} {ms:8.1f}")
+            continue
+        budget *= args.scale
+        print(f"{package:<22} {ms:8.1f} {budget:8.0f}{'  OVER' if ms > budget else ''}")
+        if ms > budget:
+            failures.append(f"{package}: {ms:.0f} ms (budget {budget:.0f} ms)")
+    total_budget = TOTAL_BUDGET_MS * args.scale
+    print(f"{'total':<22} {total:8.1f} {total_budget:8.0f}{'  OVER' if total > total_budget else ''}")
+    if total > total_budget:
+        failures.append(f"total: {total:.0f} ms (budget {total_budget:.0f} ms)")
+
+    if failures:
+        print(f"\n{len(failures)} import budget(s) exceeded:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nAll imports within budget.")
+
+
+if __name__ == "__main__":
+    main()
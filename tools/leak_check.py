@@ -0,0 +1,262 @@
+# tools/leak_check.py
+# This script looks for memory that keeps growing while a learner repeats the same
+# interaction, the signature of a leak.
+#
+# For every scenario below a virtual learner (see tools/load_test.py) opens a
+# chapter and repeats one interaction many times: dragging a slider back and forth,
+# advancing the population simulation, living another lifetime in the karma
+# simulator... After a warm-up (caches fill up, lazy imports happen), it takes a
+# tracemalloc snapshot and counts the matplotlib figures every N repetitions.
+#
+# For each scenario it reports:
+#   - the traced memory at every sample and its growth over the measured repetitions,
+#   - the most figures held by a single rerun (Streamlit closes all figures when a
+#     script run ends, so a chapter keeps every figure it draws until then),
+#   - figures still open between reruns (these would be leaking), and
+#   - the allocation sites that grew the most between the first and last snapshot,
+#     attributed to the line of app code (chapters, utils, app.py) that caused them,
+#     e.g. a session-state list that is appended to on every click.
+#
+# The script exits with an error when the memory of a scenario is still growing
+# after the warm-up by more than --max-growth-kb, or when figures stay open
+# between reruns and their number grows, so it can fail a test run.
+#
+# Usage (from the project root):
+#   python tools/leak_check.py
+#   python tools/leak_check.py --only population karma --repeats 100 --every 20
+#   python tools/leak_check.py --max-growth-kb 128 --top 15 --frames 30
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tracemalloc
+
+import load_test
+from load_test import PROJECT_ROOT, VirtualLearner
+
+# Each scenario opens a page with `setup` and then repeats `interaction`
+# (steps in the format of JOURNEYS in tools/load_test.py).
+SCENARIOS = {
+    "vectors": {
+        "setup": [("saga", "Eigen-Verse Explorer"), ("chapter", "eigen_verse_chapters", "Chapter 1: Vectors")],
+        "interaction": [("change", "c1_walk_x", 2.0), ("change", "c1_walk_x", 4.0)],
+    },
+    "shape_shifter": {
+        "setup": [("saga", "Eigen-Verse Explorer"), ("chapter", "eigen_verse_chapters", "Chapter 2: Transformations")],
+        "interaction": [("change", "c2_sl_ang_i", 30.0), ("change", "c2_sl_ang_i", 0.0)],
+    },
+    "yantra": {
+        "setup": [("saga", "Eigen-Verse Explorer"), ("chapter", "eigen_verse_chapters", "Chapter 3: Determinant")],
+        "interaction": [
+            ("set", "c3_a", 2.0), ("click", "✨ Cast the Spell"),
+            ("set", "c3_a", 1.0), ("click", "✨ Cast the Spell"),
+        ],
+    },
+    "eigen_dance": {
+        "setup": [("saga", "Eigen-Verse Explorer"),
+                  ("chapter", "eigen_verse_chapters", "Chapter 4: Eigenvectors & Eigenvalues")],
+        "interaction": [("change", "c4_angle", 120), ("change", "c4_angle", 45)],
+    },
+    "population": {
+        "setup": [("saga", "Eigen-Verse Explorer"), ("chapter", "eigen_verse_chapters", "Chapter 5: Application")],
+        "interaction": [("click", "Advance One Year →")],
+    },
+    "karma": {
+        "setup": [("saga", "The Dharma-Kshetra Saga"),
+                  ("chapter", "dharma_saga_chapters", "Chapter 1: The Seed of Dharma")],
+        "interaction": [("click", "⏳ Live a Lifetime")],
+    },
+}
+
+# Allocations made by the measurement itself (including the learner's own
+# bookkeeping in load_test.py) rather than by the app.
+IGNORED_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, os.path.abspath(__file__)),
+    tracemalloc.Filter(False, load_test.__file__, all_frames=True),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+# How many frames to keep per allocation by default. Every frame slows down the
+# reruns (with 40 frames a chapter with a plot reruns about 40x slower), so this
+# reaches the chapter code from shallow library calls only; raise --frames to
+# attribute allocations made deep inside matplotlib or Streamlit.
+TRACE_FRAMES = 12
+
+# The directories (and files) whose lines count as "app code" when attributing.
+APP_PATHS = tuple(
+    os.path.join(PROJECT_ROOT, name)
+    for name in ("chapters", "streamlit_chapters", "dharma_sindhu_saga", "pages", "utils", "app.py")
+)
+
+# The developer modes wrap the Streamlit calls; their lines are skipped so the
+# allocation is attributed to the chapter line that called the widget.
+WRAPPER_PATHS = tuple(os.path.join(PROJECT_ROOT, "utils", name) for name in ("profiler.py", "recorder.py"))
+
+
+class FigureCounter:
+    """Counts the figures each rerun still holds when Streamlit closes them all."""
+
+    def __init__(self):
+        import matplotlib.pyplot as plt
+
+        self.plt = plt
+        self.original_close = plt.close
+        self.most = 0
+        plt.close = self.close
+
+    def close(self, fig=None):
+        if fig == "all":
+            self.most = max(self.most, len(self.plt.get_fignums()))
+        return self.original_close(fig)
+
+    def open_now(self):
+        return len(self.plt.get_fignums())
+
+    def remove(self):
+        self.plt.close = self.original_close
+
+
+def take_sample(figure_counter):
+    """Returns (traced bytes, snapshot, figures open between reruns) after a full garbage collection."""
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED_FRAMES)
+    return tracemalloc.get_traced_memory()[0], snapshot, figure_counter.open_now()
+
+
+def short_path(filename):
+    if filename.startswith(PROJECT_ROOT):
+        return os.path.relpath(filename, PROJECT_ROOT)
+    marker = "site-packages" + os.sep
+    return filename.split(marker, 1)[1] if marker in filename else filename
+
+
+def attribute(traceback):
+    """Names an allocation site: the innermost line of app code, and where it allocated."""
+    # tracemalloc sorts the frames from the oldest to the most recent call.
+    innermost = traceback[-1]
+    site = f"{short_path(innermost.filename)}:{innermost.lineno}"
+    for frame in reversed(traceback):
+        if frame.filename.startswith(APP_PATHS) and not frame.filename.startswith(WRAPPER_PATHS):
+            app_site = f"{short_path(frame.filename)}:{frame.lineno}"
+            return app_site if frame == innermost else f"{app_site} (in {site})"
+    return site
+
+
+def growing_sites(first_snapshot, last_snapshot, top):
+    """Returns the `top` (site, bytes, blocks) that grew the most between two snapshots."""
+    sites = {}
+    for stat in last_snapshot.compare_to(first_snapshot, "traceback"):
+        site = attribute(stat.traceback)
+        size, count = sites.get(site, (0, 0))
+        sites[site] = (size + stat.size_diff, count + stat.count_diff)
+    ranked = sorted(sites.items(), key=lambda item: -item[1][0])
+    return [(site, size, count) for site, (size, count) in ranked[:top] if size > 0]
+
+
+def check_scenario(name, warmup, repeats, every, top, frames=TRACE_FRAMES):
+    """
+    Repeats a scenario's interaction and measures how memory and figures evolve.
+
+    Args:
+        name (str): The scenario name (a key of SCENARIOS).
+        warmup (int): Repetitions before the first snapshot.
+        repeats (int): Measured repetitions.
+        every (int): Take a sample every `every` repetitions.
+        top (int): How many growing allocation sites to keep.
+        frames (int): How many frames tracemalloc keeps per allocation.
+
+    Returns:
+        dict: Traced memory per sample (KB), growth (KB), figures per sample,
+            the most figures held by one rerun, the top sites and any errors.
+    """
+    scenario = SCENARIOS[name]
+    learner = VirtualLearner()
+    figure_counter = FigureCounter()
+
+    def repeat_interaction(times):
+        for _ in range(times):
+            for step in scenario["interaction"]:
+                learner.perform(step)
+
+    try:
+        for step in scenario["setup"]:
+            learner.perform(step)
+        repeat_interaction(warmup)
+
+        tracemalloc.start(frames)
+        try:
+            # The first interval only shows what one rerun keeps alive (the last
+            # output, filled caches), so the first sample is taken after it.
+            repeat_interaction(every)
+            memory, first_snapshot, figures = take_sample(figure_counter)
+            memory_samples, figure_samples = [memory], [figures]
+            for _ in range(repeats // every):
+                repeat_interaction(every)
+                memory, last_snapshot, figures = take_sample(figure_counter)
+                memory_samples.append(memory)
+                figure_samples.append(figures)
+        finally:
+            tracemalloc.stop()
+    finally:
+        figure_counter.remove()
+
+    # Compare the start and end of the measurement, each smoothed over a few samples.
+    edge = max(1, len(memory_samples) // 3)
+    growth = statistics.median(memory_samples[-edge:]) - statistics.median(memory_samples[:edge])
+    return {
+        "memory_kb": [round(m / 1024, 1) for m in memory_samples],
+        "growth_kb": round(growth / 1024, 1),
+        "figures": figure_samples,
+        "most_figures_per_rerun": figure_counter.most,
+        "sites": growing_sites(first_snapshot, last_snapshot, top),
+        "errors": learner.errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect memory that grows with repeated identical interactions.")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="Check only these scenarios.")
+    parser.add_argument("--warmup", type=int, default=10, help="Repetitions before measuring (default: 10).")
+    parser.add_argument("--repeats", type=int, default=20, help="Measured repetitions (default: 20).")
+    parser.add_argument("--every", type=int, default=5, help="Take a snapshot every N repetitions (default: 5).")
+    parser.add_argument("--top", type=int, default=10, help="Growing allocation sites to show (default: 10).")
+    parser.add_argument("--frames", type=int, default=TRACE_FRAMES,
+                        help=f"Frames kept per allocation; more is slower (default: {TRACE_FRAMES}).")
+    parser.add_argument("--max-growth-kb", type=float, default=256.0,
+                        help="Allowed memory growth per scenario after the warm-up, in KB (default: 256).")
+    args = parser.parse_args()
+    if args.repeats < args.every:
+        parser.error("--repeats must be at least --every")
+
+    sys.path.insert(0, PROJECT_ROOT)
+    failures = []
+    for name in args.only or SCENARIOS:
+        result = check_scenario(name, args.warmup, args.repeats, args.every, args.top, args.frames)
+        print(f"\n{name}: {args.repeats} repetitions, traced memory "
+              f"{' -> '.join(f'{kb:.0f}' for kb in result['memory_kb'])} KB ({result['growth_kb']:+.1f} KB)")
+        print(f"    at most {result['most_figures_per_rerun']} figure(s) held by one rerun, "
+              f"open between reruns {result['figures']}")
+        for site, size, count in result["sites"]:
+            print(f"    {size / 1024:+9.1f} KB {count:+7d} blocks  {site}")
+        for error in result["errors"]:
+            failures.append(f"{name}: {error['message']}")
+        if result["growth_kb"] > args.max_growth_kb:
+            failures.append(f"{name}: memory grew by {result['growth_kb']:.1f} KB (limit {args.max_growth_kb:g} KB)")
+        if result["figures"][-1] > result["figures"][0]:
+            failures.append(f"{name}: open figures grew from {result['figures'][0]} to {result['figures'][-1]}")
+
+    if failures:
+        print(f"\n{len(failures)} problem(s):")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nNo scenario kept growing.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+# tools/load_test.py
+# This script is a headless load test: it sends "virtual learners" through the app
+# and reports how long their reruns took.
+#
+# Every learner is a separate process that drives app.py with Streamlit's AppTest,
+# following one of the scripted JOURNEYS below (pick a saga, open a chapter, move
+# sliders, press buttons, answer a quiz...). The results of all learners are
+# combined into a JSON report with, overall and per chapter:
+#
+#   - p50 / p95 / p99 / max rerun latency in milliseconds,
+#   - throughput (reruns per second across all learners),
+#   - peak resident memory (RSS) of the learner processes, and
+#   - how many matplotlib figures were left open per chapter (figure growth).
+#
+# The report is written with sorted keys so two releases can be compared with a
+# plain `diff`. Note that AppTest always performs full reruns; fragment-only reruns
+# (utils/lesson.py) are cheaper, so these numbers are an upper bound.
+#
+# Usage (from the project root):
+#   python tools/load_test.py --learners 8 --iterations 2 --output load_report.json
+#   python tools/load_test.py --journeys yantra quiz
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(PROJECT_ROOT, "app.py")
+
+# A journey is a list of steps. Each step is a tuple whose first item says what to do:
+#   ("saga", label)                 choose a saga in the sidebar and rerun
+#   ("chapter", radio_key, label)   choose a chapter in the sidebar and rerun
+#   ("set", widget_key, value)      change a widget without rerunning (e.g. inside a form)
+#   ("change", widget_key, value)   change a widget and rerun
+#   ("set_labeled", widget_type, label, index, value)
+#   ("change_labeled", widget_type, label, index, value)
+#                                   the same for a widget without a key, found by its
+#                                   type (e.g. "radio"), label and position among
+#                                   widgets with that label (from 0)
+#   ("click", button_label)         press a button (or form submit button) and rerun
+#   ("repeat", times, step)         perform `step` several times
+JOURNEYS = {
+    "yantra": [
+        ("saga", "Eigen-Verse Explorer"),
+        ("chapter", "eigen_verse_chapters", "Chapter 3: Determinant"),
+        ("set", "c3_a", 2.0),
+        ("set", "c3_d", 1.5),
+        ("click", "✨ Cast the Spell"),
+        ("set", "c3_b", 1.0),
+        ("set", "c3_c", -0.5),
+        ("click", "✨ Cast the Spell"),
+        ("set", "c3_a", 1.0),
+        ("set", "c3_b", 1.0),
+        ("set", "c3_c", 1.0),
+        ("set", "c3_d", 1.0),
+        ("click", "✨ Cast the Spell"),
+    ],
+    "population": [
+        ("saga", "Eigen-Verse Explorer"),
+        ("chapter", "eigen_verse_chapters", "Chapter 5: Application"),
+        ("change", "c5_br", 1.2),
+        ("repeat", 50, ("click", "Advance One Year →")),
+        ("click", "Reset Simulation"),
+    ],
+    "quiz": [
+        ("saga", "The Streamlit Saga"),
+        ("chapter", "streamlit_saga_chapters", "Chapter 1: Your First Web App - The Digital Thali"),
+        ("set", "q0", "Building a house brick by brick"),
+        ("set", "q1", "`streamlit run my_app.py`"),
+        ("set", "q2", "The entire script re-runs from top to bottom on every user interaction."),
+        ("set", "q3", "`st.title('My Title')`"),
+        ("click", "Submit My Answers"),
+    ],
+    "browse": [
+        ("saga", "Eigen-Verse Explorer"),
+        ("chapter", "eigen_verse_chapters", "Chapter 1: Vectors"),
+        ("chapter", "eigen_verse_chapters", "Chapter 2: Transformations"),
+        ("chapter", "eigen_verse_chapters", "Chapter 4: Eigenvectors & Eigenvalues"),
+        ("chapter", "eigen_verse_chapters", "Chapter 6: Inverse of a Matrix"),
+        ("saga", "The Dharma-Kshetra Saga"),
+        ("chapter", "dharma_saga_chapters", "Chapter 1: The Seed of Dharma"),
+        ("chapter", "dharma_saga_chapters", "Chapter 2: Echoes of the Mahabharata"),
+    ],
+}
+
+
+class VirtualLearner:
+    """Drives one AppTest session and records the latency of every rerun."""
+
+    def __init__(self, query_params=None):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(APP_PATH, default_timeout=120)
+        self.at.query_params.update(query_params or {})
+        self.page = "startup"
+        self.samples = []  # (page, milliseconds)
+        self.figures = {}  # page -> matplotlib figures opened while on it
+        self.errors = []
+        self._run()
+
+    def _current_page(self):
+        saga = self.at.sidebar.radio[0].value
+        chapter = self.at.sidebar.radio[1].value if len(self.at.sidebar.radio) > 1 else None
+        return f"{saga} / {chapter}" if chapter else saga
+
+    def _run(self):
+        import matplotlib.pyplot as plt
+
+        figures_before = len(plt.get_fignums())
+        start = time.perf_counter()
+        self.at.run()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # Attribute the rerun to the page it shows (for navigation, the page being opened).
+        self.page = self._current_page()
+        self.samples.append((self.page, elapsed_ms))
+        self.figures[self.page] = self.figures.get(self.page, 0) + len(plt.get_fignums()) - figures_before
+        for exception in self.at.exception:
+            self.errors.append({"page": self.page, "message": exception.message})
+
+    def perform(self, step):
+        action = step[0]
+        if action == "repeat":
+            for _ in range(step[1]):
+                self.perform(step[2])
+            return
+        if action == "saga":
+            self.at.sidebar.radio[0].set_value(step[1])
+        elif action == "chapter":
+            self.at.sidebar.radio(key=step[1]).set_value(step[2])
+        elif action in ("set", "change"):
+            self.at.session_state[step[1]] = step[2]
+            if action == "set":
+                return
+        elif action in ("set_labeled", "change_labeled"):
+            widget_type, label, index, value = step[1:]
+            widgets = [w for w in getattr(self.at, widget_type) if w.label == label]
+            if len(widgets) <= index:
+                self.errors.append({"page": self.page, "message": f"No {widget_type} labelled {label!r}"})
+                return
+            widgets[index].set_value(value)
+            if action == "set_labeled":
+                return
+        elif action == "click":
+            buttons = [b for b in self.at.button if b.label == step[1]]
+            if not buttons:
+                self.errors.append({"page": self.page, "message": f"No button labelled {step[1]!r}"})
+                return
+            buttons[0].click()
+        else:
+            raise ValueError(f"Unknown journey step '{action}'.")
+
+        self._run()
+
+
+def run_learner(job):
+    """
+    Process entry point: runs one virtual learner through its journey.
+
+    Args:
+        job (tuple): (learner id, journey name, iterations)
+
+    Returns:
+        dict: The learner's samples, figure counts, errors and peak RSS.
+    """
+    learner_id, journey_name, iterations = job
+    sys.path.insert(0, PROJECT_ROOT)
+    learner = VirtualLearner()
+    for _ in range(iterations):
+        for step in JOURNEYS[journey_name]:
+            learner.perform(step)
+    return {
+        "learner": learner_id,
+        "journey": journey_name,
+        "samples": learner.samples,
+        "figures": learner.figures,
+        "errors": learner.errors,
+        # ru_maxrss is reported in kilobytes on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def latency_stats(values):
+    """Returns the p50/p95/p99/max of a list of latencies in milliseconds."""
+    values = np.asarray(values, dtype=float)
+    return {
+        "reruns": int(values.size),
+        "p50_ms": round(float(np.percentile(values, 50)), 1),
+        "p95_ms": round(float(np.percentile(values, 95)), 1),
+        "p99_ms": round(float(np.percentile(values, 99)), 1),
+        "max_ms": round(float(values.max()), 1),
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results, args, wall_seconds):
+    """Combines the learners' results into the JSON-serializable report."""
+    all_latencies, by_page, figures = [], {}, {}
+    for result in results:
+        for page, ms in result["samples"]:
+            all_latencies.append(ms)
+            by_page.setdefault(page, []).append(ms)
+        for page, count in result["figures"].items():
+            figures[page] = figures.get(page, 0) + count
+
+    import streamlit
+
+    summary = latency_stats(all_latencies)
+    summary["throughput_rps"] = round(len(all_latencies) / wall_seconds, 2)
+    summary["wall_s"] = round(wall_seconds, 2)
+    summary["peak_rss_mb"] = round(max(r["peak_rss_mb"] for r in results), 1)
+    summary["errors"] = sum(len(r["errors"]) for r in results)
+
+    chapters = {}
+    for page, values in by_page.items():
+        chapters[page] = latency_stats(values)
+        chapters[page]["figures_left_open"] = figures.get(page, 0)
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "learners": args.learners,
+            "processes": args.processes,
+            "iterations": args.iterations,
+            "journeys": args.journeys,
+        },
+        "summary": summary,
+        "chapters": chapters,
+        "learners": [
+            {
+                "learner": r["learner"],
+                "journey": r["journey"],
+                "peak_rss_mb": round(r["peak_rss_mb"], 1),
+                "errors": r["errors"],
+            }
+            for r in results
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run virtual learners against app.py and report rerun latency.")
+    parser.add_argument("--learners", type=int, default=4, help="Number of virtual learners (default: 4).")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Learners running at the same time (default: one per learner, up to the CPU count).")
+    parser.add_argument("--iterations", type=int, default=1, help="Times each learner repeats its journey (default: 1).")
+    parser.add_argument("--journeys", nargs="+", choices=sorted(JOURNEYS), default=sorted(JOURNEYS),
+                        help="Journeys to hand out to the learners, round-robin (default: all).")
+    parser.add_argument("--output", default="load_report.json", help="Where to write the JSON report.")
+    args = parser.parse_args()
+    args.processes = args.processes or min(args.learners, os.cpu_count() or 1)
+
+    jobs = [(i, args.journeys[i % len(args.journeys)], args.iterations) for i in range(args.learners)]
+    start = time.perf_counter()
+    # Every learner gets a fresh interpreter of its own: AppTest replaces the process's
+    # __main__ module with app.py while it runs, so a worker cannot be reused.
+    with multiprocessing.get_context("spawn").Pool(processes=args.processes, maxtasksperchild=1) as pool:
+        results = pool.map(run_learner, jobs)
+    wall_seconds = time.perf_counter() - start
+
+    report = build_report(results, args, wall_seconds)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    summary = report["summary"]
+    print(f"{summary['reruns']} reruns by {args.learners} learners in {summary['wall_s']} s "
+          f"({summary['throughput_rps']} reruns/s)")
+    print(f"p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms, p99 {summary['p99_ms']} ms, "
+          f"peak RSS {summary['peak_rss_mb']} MB, errors {summary['errors']}")
+    for page, stats in sorted(report["chapters"].items()):
+        print(f"  {page}: p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms, "
+              f"{stats['figures_left_open']} figures left open")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
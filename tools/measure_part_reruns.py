@@ -0,0 +1,92 @@
+# tools/measure_part_reruns.py
+# This script measures what a single widget interaction costs in every chapter.
+#
+# Before chapters were split into lesson parts (see utils/lesson.py), any widget
+# rerun the whole chapter. Now a widget inside an isolated part reruns only that
+# part. For each chapter this script reports:
+#
+#   - the full chapter run time (the old cost of *every* interaction), and
+#   - the run time of each part, which is the new cost of interacting with a
+#     widget inside that part (unless the part is marked as not isolated).
+#
+# Usage (from the project root):
+#   python tools/measure_part_reruns.py [--runs 5]
+
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.lesson import PART_TIMINGS_KEY  # noqa: E402
+from utils.paths import CHAPTER_MODULES  # noqa: E402
+
+SCRIPT_TEMPLATE = """
+import sys
+sys.path.insert(0, {root!r})
+import {module} as chapter
+chapter.render()
+"""
+
+
+def part_isolation(module_name):
+    """Returns a dict mapping each lesson part name of a chapter to its `isolated` flag."""
+    module = importlib.import_module(module_name)
+    return {
+        obj.lesson_part: obj.isolated
+        for obj in vars(module).values()
+        if callable(obj) and hasattr(obj, "lesson_part")
+    }
+
+
+def measure_chapter(module_name, runs):
+    """
+    Runs a chapter several times and collects its full and per-part run times.
+
+    Args:
+        module_name (str): The dotted name of the chapter module.
+        runs (int): How many warm runs to take the median of.
+
+    Returns:
+        tuple: (median full run in ms, dict of part name -> median part run in ms)
+    """
+    at = AppTest.from_string(SCRIPT_TEMPLATE.format(root=PROJECT_ROOT, module=module_name), default_timeout=120)
+    at.run()  # Cold run: imports, caches and session state set-up are not what we measure.
+
+    full_runs, part_runs = [], {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        full_runs.append((time.perf_counter() - start) * 1000)
+        for key, seconds in at.session_state[PART_TIMINGS_KEY].items():
+            part_runs.setdefault(key.split(":", 1)[1], []).append(seconds * 1000)
+
+    return statistics.median(full_runs), {name: statistics.median(ms) for name, ms in part_runs.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full-chapter reruns with per-part reruns.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of warm runs per chapter (default: 5).")
+    args = parser.parse_args()
+
+    for module_name in CHAPTER_MODULES:
+        isolation = part_isolation(module_name)
+        if not isolation:
+            continue  # A chapter without lesson parts (the syllabi) always reruns whole.
+        full_ms, parts = measure_chapter(module_name, args.runs)
+        print(f"\n{module_name}: full chapter rerun {full_ms:.1f} ms")
+        for name, part_ms in parts.items():
+            if isolation.get(name, True):
+                print(f"    {name:<14} {part_ms:8.1f} ms  (a widget here now reruns only this part)")
+            else:
+                print(f"    {name:<14} {part_ms:8.1f} ms  (not isolated: still reruns the chapter)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# tools/replay_traces.py
+# This script replays recorded learner sessions against headless copies of the app.
+#
+# Record real sessions first with the opt-in recorder (see utils/recorder.py),
+# which writes every widget change and button click to `lesson_interactions.jsonl`.
+# Each recorded session is then replayed by its own virtual learner (the AppTest
+# driver of tools/load_test.py): the changes that arrived with one script run are
+# applied together and followed by one rerun, at the original pace or faster.
+#
+# The report has the same latency figures as the load test (p50/p95/p99/max per
+# page, throughput, peak RSS), so an optimization can be checked against the way
+# learners really use the app, e.g. dragging one slider back and forth for a minute.
+#
+# Usage (from the project root):
+#   python tools/replay_traces.py lesson_interactions.jsonl               # original pace
+#   python tools/replay_traces.py lesson_interactions.jsonl --speed 10    # 10x faster
+#   python tools/replay_traces.py traces/*.jsonl --speed 0 --output replay_report.json
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from itertools import groupby
+
+from load_test import PROJECT_ROOT, VirtualLearner, git_revision, latency_stats
+
+# Widgets whose recorded list values stand for tuples (range sliders).
+TUPLE_WIDGETS = ("slider", "select_slider")
+
+
+def load_sessions(paths):
+    """
+    Reads trace files and groups their events by session.
+
+    Returns:
+        dict: session id -> list of events sorted by run and time.
+    """
+    sessions = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as trace:
+            for line in trace:
+                if line.strip():
+                    event = json.loads(line)
+                    sessions.setdefault(event["s"], []).append(event)
+    for events in sessions.values():
+        events.sort(key=lambda event: (event["r"], event["ts"]))
+    return sessions
+
+
+def to_step(event, rerun):
+    """Turns a recorded event into a virtual-learner step (see JOURNEYS in load_test.py)."""
+    value = event["v"]
+    if event["w"] in TUPLE_WIDGETS and isinstance(value, list):
+        value = tuple(value)
+    if event["w"] in ("button", "form_submit_button"):
+        # A click always triggers the rerun of its script run.
+        return ("click", event["l"])
+    if "k" in event:
+        return ("change" if rerun else "set", event["k"], value)
+    return ("change_labeled" if rerun else "set_labeled", event["w"], event["l"], event.get("n", 0), value)
+
+
+def to_runs(events):
+    """
+    Groups a session's events into reruns.
+
+    Returns:
+        list: (seconds since the first event, list of steps) per recorded script run.
+            Only the last step of a run triggers the rerun.
+    """
+    if not events:
+        return []
+    first_ts = events[0]["ts"]
+    runs = []
+    for _, run_events in groupby(events, key=lambda event: event["r"]):
+        run_events = list(run_events)
+        # A click submits the values set before it (e.g. the fields of a form).
+        run_events.sort(key=lambda event: event["w"] in ("button", "form_submit_button"))
+        steps = [to_step(event, rerun=i == len(run_events) - 1) for i, event in enumerate(run_events)]
+        runs.append((run_events[0]["ts"] - first_ts, steps))
+    return runs
+
+
+def replay_session(job):
+    """
+    Process entry point: replays one recorded session.
+
+    Args:
+        job (tuple): (session id, list of events, speed)
+
+    Returns:
+        dict: The session's samples, errors and peak RSS.
+    """
+    session_id, events, speed = job
+    sys.path.insert(0, PROJECT_ROOT)
+    # The session's seed makes the games draw what the learner saw (utils/randomness.py).
+    seeds = [event["v"] for event in events if event["w"] == "seed"]
+    learner = VirtualLearner({"seed": str(seeds[0])} if seeds else None)
+    events = [event for event in events if event["w"] != "seed"]
+    start = time.perf_counter()
+    for offset, steps in to_runs(events):
+        if speed > 0:
+            time.sleep(max(0.0, offset / speed - (time.perf_counter() - start)))
+        for step in steps:
+            learner.perform(step)
+    return {
+        "session": session_id,
+        "samples": learner.samples,
+        "errors": learner.errors,
+        # ru_maxrss is reported in kilobytes on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded learner sessions against app.py.")
+    parser.add_argument("traces", nargs="+", help="Trace files written by utils/recorder.py.")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="Replay speed: 1 is the original pace, 10 is ten times faster, "
+                             "0 replays without pauses (default: 1).")
+    parser.add_argument("--sessions", nargs="+", help="Replay only these session ids.")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Sessions replayed at the same time (default: one per session, up to the CPU count).")
+    parser.add_argument("--output", default="replay_report.json", help="Where to write the JSON report.")
+    args = parser.parse_args()
+
+    sessions = load_sessions(args.traces)
+    if args.sessions:
+        sessions = {sid: events for sid, events in sessions.items() if sid in args.sessions}
+    if not sessions:
+        sys.exit("No recorded sessions to replay.")
+    processes = args.processes or min(len(sessions), os.cpu_count() or 1)
+
+    jobs = [(sid, events, args.speed) for sid, events in sorted(sessions.items())]
+    start = time.perf_counter()
+    # As in load_test.py, every session needs a fresh process of its own.
+    with multiprocessing.get_context("spawn").Pool(processes=processes, maxtasksperchild=1) as pool:
+        results = pool.map(replay_session, jobs)
+    wall_seconds = time.perf_counter() - start
+
+    latencies, by_page = [], {}
+    for result in results:
+        for page, ms in result["samples"]:
+            latencies.append(ms)
+            by_page.setdefault(page, []).append(ms)
+    summary = latency_stats(latencies)
+    summary["throughput_rps"] = round(len(latencies) / wall_seconds, 2)
+    summary["wall_s"] = round(wall_seconds, 2)
+    summary["peak_rss_mb"] = round(max(r["peak_rss_mb"] for r in results), 1)
+    summary["errors"] = sum(len(r["errors"]) for r in results)
+    report = {
+        "meta": {"git_revision": git_revision(), "traces": args.traces, "speed": args.speed,
+                 "sessions": len(results), "events": sum(len(events) for _, events, _ in jobs)},
+        "summary": summary,
+        "chapters": {page: latency_stats(values) for page, values in by_page.items()},
+        "sessions": [{"session": r["session"], "errors": r["errors"]} for r in results],
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    print(f"Replayed {len(results)} session(s), {summary['reruns']} reruns in {summary['wall_s']} s "
+          f"({summary['throughput_rps']} reruns/s)")
+    print(f"p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms, p99 {summary['p99_ms']} ms, "
+          f"peak RSS {summary['peak_rss_mb']} MB, errors {summary['errors']}")
+    for page, stats in sorted(report["chapters"].items()):
+        print(f"  {page}: {stats['reruns']} reruns, p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
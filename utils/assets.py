@@ -0,0 +1,265 @@
+# utils/assets.py
+# This file contains the local asset pipeline for images that come from the web.
+#
+# A chapter that calls `st.image("https://upload.wikimedia.org/...")` makes every
+# learner's browser fetch the image from a third party, with its latency and its
+# outages. Write instead:
+#
+#   from utils.assets import asset_image
+#   asset_image("https://upload.wikimedia.org/...", caption="...")
+#
+# The first time an image is needed (normally during the warmup, see
+# utils/warmup.py, or with tools/build_assets.py) it is fetched once and stored in
+# static/assets/ as resized variants, each as WebP and in the source's own format:
+#
+#   static/assets/kolam-in-tamil-nadu-3f2a9c1b7e4d-400.webp
+#   static/assets/kolam-in-tamil-nadu-3f2a9c1b7e4d-400.jpg
+#   ...
+#
+# The names contain a hash of the source image, so a file never changes once it is
+# written. Streamlit serves the directory at app/static/ (server.enableStaticServing
+# in .streamlit/config.toml); it sends no Cache-Control header of its own, so let the
+# reverse proxy in front of it mark these files as cacheable forever, e.g. for nginx:
+#
+#   location /app/static/assets/ {
+#       add_header Cache-Control "public, max-age=31536000, immutable";
+#       proxy_pass http://127.0.0.1:8501;
+#   }
+#
+# How an image is fetched is pluggable: set_fetcher() replaces the HTTP fetcher with
+# any function url -> bytes, and LESSON_ASSET_SOURCE=<directory> makes the pipeline
+# read the images from a local directory (by file name) instead of the network, for
+# offline builds and tests. If an image cannot be fetched the chapter falls back to
+# the remote URL, as before.
+
+import ast
+import hashlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import re
+import threading
+import urllib.parse
+import urllib.request
+
+import streamlit as st
+
+from utils.paths import CHAPTER_MODULES, PROJECT_ROOT
+
+ASSET_DIR = os.path.join(PROJECT_ROOT, "static", "assets")
+ASSET_URL = "/app/static/assets"
+MANIFEST_PATH = os.path.join(ASSET_DIR, "manifest.json")
+SOURCE_ENV_VAR = "LESSON_ASSET_SOURCE"
+
+# Widths (in pixels) every image is resized to, besides its own width. An image shown
+# without a width is served at the widest of them.
+DISPLAY_WIDTHS = (400, 800)
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+FETCH_TIMEOUT = 20
+
+# Modules that may show remote images: the chapters and the pages of pages/.
+ASSET_MODULES = CHAPTER_MODULES + ("pages.history",)
+
+_lock = threading.Lock()
+_manifest = None
+# URLs whose fetch failed in this process; they are linked, not fetched again.
+_failed = set()
+
+logger = logging.getLogger(__name__)
+
+
+def http_fetch(url):
+    """Fetches url over HTTP(S) and returns its bytes."""
+    request = urllib.request.Request(url, headers={"User-Agent": "GrandLibrary-assets/1.0"})
+    with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+        return response.read()
+
+
+def directory_fetcher(directory):
+    """Returns a fetcher that reads each image from `directory`, by the file name of its URL."""
+    def fetch(url):
+        name = urllib.parse.unquote(os.path.basename(urllib.parse.urlparse(url).path))
+        with open(os.path.join(directory, name), "rb") as source:
+            return source.read()
+    return fetch
+
+
+_fetcher = directory_fetcher(os.environ[SOURCE_ENV_VAR]) if os.environ.get(SOURCE_ENV_VAR) else http_fetch
+
+
+def set_fetcher(fetcher):
+    """
+    Replaces how images are fetched.
+
+    Args:
+        fetcher (callable): Takes a URL and returns the image's bytes.
+
+    Returns:
+        callable: The previous fetcher, to restore it later.
+    """
+    global _fetcher
+    previous, _fetcher = _fetcher, fetcher
+    return previous
+
+
+def _slug(url):
+    """Turns the file name of a URL into a short readable name, e.g. "kolam-in-tamil-nadu"."""
+    name = urllib.parse.unquote(os.path.basename(urllib.parse.urlparse(url).path))
+    name = re.sub(r"^\d+px-", "", os.path.splitext(name)[0])
+    return "-".join(re.findall(r"[a-z0-9]+", name.lower()))[:40] or "image"
+
+
+def load_manifest():
+    """Returns {source URL: asset entry} for every asset built so far (read from disk once)."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as source:
+                _manifest = json.load(source)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _save_manifest(manifest):
+    temporary = f"{MANIFEST_PATH}.tmp"
+    with open(temporary, "w", encoding="utf-8") as target:
+        json.dump(manifest, target, indent=2, sort_keys=True)
+    os.replace(temporary, MANIFEST_PATH)
+
+
+def build_asset(url):
+    """
+    Fetches one image and writes its resized variants to static/assets/.
+
+    Returns:
+        dict: The asset entry: "hash", "width", "height" and "variants"
+            ({width: {format: file name}}).
+    """
+    from PIL import Image
+
+    data = _fetcher(url)
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    source_format = "png" if image.format == "PNG" or image.mode in ("RGBA", "LA", "P") else "jpg"
+    width, height = image.size
+
+    os.makedirs(ASSET_DIR, exist_ok=True)
+    variants = {}
+    for target_width in sorted({w for w in DISPLAY_WIDTHS if w < width} | {width}):
+        resized = image if target_width == width else image.resize(
+            (target_width, round(height * target_width / width)), Image.LANCZOS)
+        if resized.mode not in ("RGB", "RGBA"):
+            resized = resized.convert("RGBA" if source_format == "png" else "RGB")
+        files = {}
+        for extension in ("webp", source_format):
+            name = f"{_slug(url)}-{digest}-{target_width}.{extension}"
+            path = os.path.join(ASSET_DIR, name)
+            if not os.path.exists(path):
+                buffer = io.BytesIO()
+                if extension == "webp":
+                    resized.save(buffer, "WEBP", quality=WEBP_QUALITY, method=6)
+                elif extension == "png":
+                    resized.save(buffer, "PNG", optimize=True)
+                else:
+                    resized.convert("RGB").save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+                with open(f"{path}.tmp", "wb") as target:
+                    target.write(buffer.getvalue())
+                os.replace(f"{path}.tmp", path)
+            files[extension] = name
+        variants[str(target_width)] = files
+    return {"hash": digest, "width": width, "height": height, "variants": variants}
+
+
+def get_asset(url):
+    """
+    Returns the asset entry of url, building it on first use.
+
+    Returns None if the image cannot be fetched; it is then not tried again until the
+    process restarts.
+    """
+    entry = load_manifest().get(url)
+    if entry is not None or url in _failed:
+        return entry
+    with _lock:
+        manifest = load_manifest()
+        if url not in manifest and url not in _failed:
+            try:
+                manifest[url] = build_asset(url)
+            except Exception as error:  # noqa: BLE001 - any fetch or decode failure
+                _failed.add(url)
+                logger.warning("Could not store %s locally, linking it instead: %s", url, error)
+                return None
+            _save_manifest(manifest)
+        return manifest.get(url)
+
+
+def asset_url(url, width=None, image_format="webp"):
+    """
+    Returns the local URL of an image, or url itself if it could not be stored locally.
+
+    Args:
+        url (str): The image's source URL.
+        width (int, optional): The display width in pixels; picks the smallest variant
+            at least this wide. Defaults to the widest display width, DISPLAY_WIDTHS[-1].
+        image_format (str, optional): "webp" or the source's format ("jpg"/"png").
+    """
+    entry = get_asset(url)
+    if entry is None:
+        return url
+    width = width or DISPLAY_WIDTHS[-1]
+    widths = sorted(int(w) for w in entry["variants"])
+    chosen = next((w for w in widths if w >= width), widths[-1])
+    files = entry["variants"][str(chosen)]
+    return f"{ASSET_URL}/{files.get(image_format) or files['webp']}"
+
+
+def asset_image(url, caption=None, width=None):
+    """
+    Shows a remote image from its local copy, like `st.image(url, caption=...)`.
+
+    Args:
+        url (str): The image's source URL.
+        caption (str, optional): The caption below the image.
+        width (int, optional): The display width in pixels. Defaults to the width of
+            the variant for the widest display width (or the image's own width, if it
+            is narrower).
+    """
+    kwargs = {"caption": caption}
+    if width is not None:
+        kwargs["width"] = width
+    st.image(asset_url(url, width), **kwargs)
+
+
+def referenced_urls(modules=ASSET_MODULES):
+    """Returns the URLs that asset_image() / asset_url() calls in the modules' sources ask for."""
+    urls = []
+    for module in modules:
+        spec = importlib.util.find_spec(module)
+        with open(spec.origin, encoding="utf-8") as source:
+            tree = ast.parse(source.read(), filename=spec.origin)
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                    and node.func.id in ("asset_image", "asset_url") and node.args
+                    and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)):
+                if node.args[0].value not in urls:
+                    urls.append(node.args[0].value)
+    return urls
+
+
+def build_all(modules=ASSET_MODULES):
+    """
+    Makes sure every image the modules ask for is stored locally.
+
+    Returns:
+        list: (url, error message) for every image that could not be fetched.
+    """
+    failures = []
+    for url in referenced_urls(modules):
+        if get_asset(url) is None:
+            failures.append((url, "could not be fetched"))
+    return failures
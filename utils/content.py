@@ -0,0 +1,192 @@
+# utils/content.py
+# This file contains the lesson content store: the long markdown prose of every
+# chapter, kept in markdown files instead of string literals in the Python code.
+#
+# The prose of a chapter lives in content/<package>/<chapter>/, one file per lesson
+# part (analogy.md, mechanism.md, ...) or per helper function that draws prose
+# (game_tiger_project.md). A file holds one or more named blocks:
+#
+#   <!-- block: treasure-map -->
+#   Forget everything you *think* you know about vectors...
+#
+#   <!-- block: the-core-concept -->
+#   That single instruction...
+#
+# A chapter shows a block with:
+#
+#   from utils.content import lesson_content
+#   prose = lesson_content(__name__)
+#   ...
+#   prose("analogy", "treasure-map")      # like st.markdown(...) with that text
+#
+# Block names are short and chosen by hand after what the block is about ("intro",
+# "karma-definition", "summary"), not after its first words, so that editing the text
+# leaves the name alone. Names are unique within a file.
+#
+# Every file is compiled once per process (and again only when it changes on disk)
+# into Blocks with a stable id ("chapters.chapter_1/analogy/treasure-map") and a
+# hash of their text. Because a block's text is the same on every rerun, its
+# message is identical too: Streamlit keeps messages above
+# `global.minCachedMessageSize` (lowered in .streamlit/config.toml so that prose
+# blocks qualify) in the browser and sends only their hash on later reruns.
+#
+# The JSON data files next to the prose (family trees, timelines, map layers) are
+# loaded with load_json(), which parses each file once per version the same way:
+#
+#   family = load_json(path, Family)      # Family(<the decoded JSON>), shared by every session
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import namedtuple
+
+import streamlit as st
+
+from utils.lesson import LESSON_PARTS
+from utils.paths import CONTENT_ROOT, PROJECT_ROOT
+
+BLOCK_MARKER = re.compile(r"^<!-- block: ([a-z0-9][a-z0-9-]*) -->[ \t]*$", re.MULTILINE)
+
+Block = namedtuple("Block", ["id", "chapter", "part", "name", "text", "hash"])
+
+_lock = threading.Lock()
+# part file path -> (modification time, size, {block name: Block})
+_compiled = {}
+# (JSON file path, parse function) -> ((modification time, size), parsed value)
+_parsed = {}
+
+
+class ContentError(LookupError):
+    """Raised when a chapter asks for a content file or block that does not exist."""
+
+
+def chapter_dir(chapter):
+    """Returns the content directory of a chapter module, e.g. "chapters.chapter_1"."""
+    return os.path.join(CONTENT_ROOT, *chapter.split("."))
+
+
+def compile_part(chapter, part):
+    """
+    Returns the blocks of one content file, compiling it on first use or after it changed.
+
+    Args:
+        chapter (str): The chapter module name, e.g. "chapters.chapter_1".
+        part (str): The file name without ".md", e.g. "analogy".
+
+    Returns:
+        dict: Block name -> Block, in the order of the file.
+    """
+    path = os.path.join(chapter_dir(chapter), f"{part}.md")
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise ContentError(f"No content file {os.path.relpath(path, PROJECT_ROOT)}") from None
+    cached = _compiled.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(path, encoding="utf-8") as source:
+        text = source.read()
+    pieces = BLOCK_MARKER.split(text)
+    if pieces[0].strip():
+        raise ContentError(f"{os.path.relpath(path, PROJECT_ROOT)} has text before its first block marker")
+    blocks = {}
+    for name, body in zip(pieces[1::2], pieces[2::2]):
+        if name in blocks:
+            raise ContentError(f"{os.path.relpath(path, PROJECT_ROOT)} has two blocks named '{name}'")
+        body = body.strip()
+        blocks[name] = Block(
+            id=f"{chapter}/{part}/{name}",
+            chapter=chapter,
+            part=part,
+            name=name,
+            text=body,
+            hash=hashlib.sha256(body.encode("utf-8")).hexdigest()[:16],
+        )
+    with _lock:
+        _compiled[path] = (stat.st_mtime_ns, stat.st_size, blocks)
+    return blocks
+
+
+def load_json(path, parse):
+    """
+    Returns the value parsed from a JSON file, parsed on first use and again only when
+    the file changes. Sessions asking at the same time wait for a single parse.
+
+    Args:
+        path (str): The JSON file.
+        parse (callable): Builds the value from the decoded JSON, e.g. a class such as
+            Family.
+
+    Returns:
+        The value `parse` returned for the current version of the file.
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (path, parse)
+    cached = _parsed.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with _lock:
+        cached = _parsed.get(key)
+        if cached is None or cached[0] != stamp:
+            with open(path, encoding="utf-8") as source:
+                cached = (stamp, parse(json.load(source)))
+            _parsed[key] = cached
+    return cached[1]
+
+
+def get_block(chapter, part, name):
+    """Returns one Block of a chapter's content. Raises ContentError if it does not exist."""
+    block = compile_part(chapter, part).get(name)
+    if block is None:
+        raise ContentError(f"No block '{name}' in the '{part}' content of {chapter}")
+    return block
+
+
+def lesson_content(chapter):
+    """
+    Returns the function a chapter uses to show its prose blocks.
+
+    Args:
+        chapter (str): The chapter module name; pass `__name__`.
+
+    Returns:
+        callable: prose(part, name, **kwargs) shows the block with `st.markdown`,
+            passing on keyword arguments such as `unsafe_allow_html`.
+    """
+    def prose(part, name, **kwargs):
+        return st.markdown(get_block(chapter, part, name).text, **kwargs)
+    return prose
+
+
+def iter_blocks(chapters=None):
+    """
+    Yields every Block in the content store, chapter by chapter, in lesson-part order.
+
+    Args:
+        chapters (iterable, optional): Only these chapter modules. Defaults to every
+            chapter with a content directory.
+    """
+    if chapters is None:
+        chapters = []
+        for package in sorted(os.listdir(CONTENT_ROOT)):
+            package_dir = os.path.join(CONTENT_ROOT, package)
+            if os.path.isdir(package_dir):
+                chapters += [f"{package}.{name}" for name in sorted(os.listdir(package_dir))
+                             if os.path.isdir(os.path.join(package_dir, name))]
+    for chapter in chapters:
+        directory = chapter_dir(chapter)
+        if not os.path.isdir(directory):
+            continue
+        parts = [name[:-3] for name in os.listdir(directory) if name.endswith(".md")]
+        for part in sorted(parts, key=_part_order):
+            yield from compile_part(chapter, part).values()
+
+
+def _part_order(part):
+    """Sorts lesson parts in the order of the chapter, then any other files by name."""
+    order = [name.lower() for name in LESSON_PARTS]
+    return (order.index(part), "") if part in order else (len(order), part)
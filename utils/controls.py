@@ -0,0 +1,140 @@
+# utils/controls.py
+# This file contains the shared "control panel" used by chapters that drive a
+# visualization from several related sliders (a matrix, a pair of vectors, ...).
+#
+# A plain slider reruns the whole chapter every time it is released, so a learner
+# adjusting four matrix elements pays for four full reruns. A control panel groups
+# those sliders and lets each chapter pick how changes reach the rest of the page:
+#
+#   - "batched": the sliders live inside an `st.form`. Nothing reruns until the
+#                learner presses the apply button, so one intent costs one rerun.
+#   - "live":    the sliders live inside an `st.fragment`. Moving a slider reruns
+#                only the panel itself; the rest of the page is refreshed at most
+#                `max_reruns_per_second` times. A change that arrives too soon is
+#                held back and flushed by a short timer instead of being dropped.
+#
+# Inside an isolated lesson part (utils/lesson.py) the part itself is already a
+# fragment, and the panel's values only reach that part. A "live" panel there
+# renders its sliders inline, so a change reruns just the enclosing part: a panel
+# fragment nested in it could only rerun itself or the whole app.
+
+import time
+
+import streamlit as st
+
+from utils.lesson import in_isolated_part
+
+PANEL_MODES = ("live", "batched")
+
+
+def control_panel(key, sliders, mode="live", title=None, max_reruns_per_second=2.0,
+                  submit_label="Apply Changes", border=True):
+    """
+    Renders a group of related sliders and returns their applied values.
+
+    Args:
+        key (str): A unique name for this panel. It prefixes the panel's form and
+            session-state entries, so it must not clash with any widget key.
+        sliders (list): The contents of the panel, in display order. Each entry is
+            either a dict of keyword arguments for `st.slider` (it must contain a
+            `key`) or a string, which is rendered as a markdown sub-heading.
+        mode (str, optional): "batched" or "live" (see the module notes). Defaults to "live".
+        title (str, optional): Markdown shown at the top of the panel. Defaults to None.
+        max_reruns_per_second (float, optional): The most page reruns a "live" panel
+            may trigger per second. Defaults to 2.0.
+        submit_label (str, optional): The apply button label of a "batched" panel.
+            Defaults to "Apply Changes".
+        border (bool, optional): Whether to draw a border around the panel. Defaults to True.
+
+    Returns:
+        dict: The value of every slider the rest of the page should use, keyed by the
+            slider's `key`.
+    """
+    if mode not in PANEL_MODES:
+        raise ValueError(f"Unknown control panel mode '{mode}'. Expected one of {PANEL_MODES}.")
+
+    if mode == "batched":
+        return _batched_panel(key, sliders, title, submit_label, border)
+    if in_isolated_part():
+        with st.container(border=border):
+            return _render_sliders(sliders, title)
+
+    # The panel's bookkeeping lives in one session-state dict. "full_run" tells the
+    # fragment body that the whole page is already rerunning (this function is only
+    # reached on full runs), so changes can be applied without asking for another rerun.
+    state_key = f"{key}_panel_state"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = {"applied": None, "pending": None, "last_applied": 0.0}
+    st.session_state[state_key]["full_run"] = True
+
+    min_interval = 1.0 / max_reruns_per_second
+    _live_panel(state_key, sliders, title, border, min_interval)
+    return dict(st.session_state[state_key]["applied"])
+
+
+def _render_sliders(sliders, title):
+    """Renders the panel's title, sub-headings and sliders, returning the slider values."""
+    if title:
+        st.markdown(title)
+    values = {}
+    for spec in sliders:
+        if isinstance(spec, str):
+            st.markdown(spec)
+        else:
+            values[spec["key"]] = st.slider(**spec)
+    return values
+
+
+def _batched_panel(key, sliders, title, submit_label, border):
+    """Renders the sliders inside a form so they only rerun the page when submitted."""
+    with st.form(key=f"{key}_form", border=border):
+        values = _render_sliders(sliders, title)
+        st.form_submit_button(submit_label, use_container_width=True)
+    return values
+
+
+@st.fragment
+def _live_panel(state_key, sliders, title, border, min_interval):
+    """Renders the sliders as a fragment and forwards changes to the page at a limited rate."""
+    with st.container(border=border):
+        values = _render_sliders(sliders, title)
+
+    state = st.session_state[state_key]
+    full_run = state.pop("full_run", False)
+
+    if full_run or state["applied"] is None:
+        # The rest of the page is about to render anyway, so it can use these values now.
+        state["applied"], state["pending"] = values, None
+        state["last_applied"] = time.monotonic()
+        return
+
+    if values == state["applied"]:
+        state["pending"] = None
+        return
+
+    state["pending"] = values
+    wait = min_interval - (time.monotonic() - state["last_applied"])
+    if wait <= 0:
+        _apply_pending(state)
+        # Outside an isolated part the values feed the rest of the page (or later
+        # parts of a non-isolated one), so the whole app reruns.
+        st.rerun()
+    else:
+        # Too soon after the last rerun: hold the change and let a timer flush it.
+        st.fragment(_flush_pending, run_every=wait)(state_key, min_interval)
+
+
+def _flush_pending(state_key, min_interval):
+    """Timer body that applies a held-back change once the rate limit allows it."""
+    state = st.session_state[state_key]
+    if state["pending"] is None:
+        return
+    if time.monotonic() - state["last_applied"] >= min_interval:
+        _apply_pending(state)
+        st.rerun()
+
+
+def _apply_pending(state):
+    """Promotes the pending slider values to the applied values."""
+    state["applied"], state["pending"] = state["pending"], None
+    state["last_applied"] = time.monotonic()
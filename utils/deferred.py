@@ -0,0 +1,86 @@
+# utils/deferred.py
+# This file contains deferred imports for heavy optional dependencies.
+#
+# A module-level `import plotly.graph_objects as go` makes every server start (and
+# every reload of the chapter while developing) pay for plotly, even when no
+# learner ever opens the lesson that draws with it. Instead write:
+#
+#   from utils.deferred import deferred_import
+#   go = deferred_import("plotly.graph_objects")
+#
+# `go` then behaves like the module, but the real import happens the first time
+# one of its attributes is used (`go.Figure()`). How long that import took is kept
+# in import_costs() and, when the profiler is on, recorded as an "import" in its
+# trace (see utils/profiler.py).
+#
+# Use it for scipy, plotly, pandas and the like; numpy and matplotlib are needed by
+# almost every chapter and are imported normally.
+
+import importlib
+import sys
+import threading
+import time
+import types
+
+from utils import profiler
+
+_lock = threading.Lock()
+# Module name -> seconds its first use spent importing it (0.0 if already imported).
+_costs = {}
+
+
+class DeferredModule(types.ModuleType):
+    """A stand-in for a module that imports the real one on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_deferred_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_deferred_module"]
+        if module is not None:
+            return module
+        name = self.__name__
+        seconds = 0.0
+        with _lock:
+            module = self.__dict__["_deferred_module"]
+            if module is None:
+                already_imported = name in sys.modules
+                start = time.perf_counter()
+                module = importlib.import_module(name)
+                if not already_imported:
+                    seconds = time.perf_counter() - start
+                _costs[name] = seconds
+                self.__dict__["_deferred_module"] = module
+        if seconds:
+            profiler.record("import", name, seconds)
+        return module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_deferred_module"] is not None else "not loaded yet"
+        return f"<deferred module {self.__name__!r} ({state})>"
+
+
+def deferred_import(name):
+    """
+    Returns a stand-in for module `name` that imports it on first use.
+
+    Args:
+        name (str): The dotted module name, e.g. "plotly.graph_objects".
+
+    Returns:
+        DeferredModule: Use it like the module itself.
+    """
+    return DeferredModule(name)
+
+
+def import_costs():
+    """Returns {module name: seconds its first use spent importing it} for the modules used so far."""
+    with _lock:
+        return dict(_costs)
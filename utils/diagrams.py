@@ -0,0 +1,219 @@
+# utils/diagrams.py
+# This file contains pre-rendered Graphviz diagrams with pan and zoom.
+#
+# `st.graphviz_chart(dot)` sends the DOT source to the browser, which lays the graph
+# out again on every rerun of every learner. Write instead:
+#
+#   from utils.diagrams import graphviz_diagram
+#   graphviz_diagram(dot, height=560)
+#
+# The source is laid out once into SVG by Graphviz's `dot` program and the SVG is
+# cached under a hash of the source and the layout engine: in memory for this
+# process and on disk (DIAGRAM_CACHE_DIR) for the next ones, so a deploy lays out
+# each diagram once (the warmup renders every chapter, which fills the cache) and
+# every later view is a cache lookup. Editing the source changes the hash, so there
+# is nothing to invalidate by hand.
+#
+# The SVG is shown in a small viewer that fits it to the frame and lets the learner
+# zoom (mouse wheel or the +/- buttons) and pan (drag); double-click fits it again.
+#
+# When Graphviz is not installed on the server, or cannot lay a diagram out in time,
+# the diagram falls back to `st.graphviz_chart`, which lays it out in the browser as
+# before; the failure is remembered, so later reruns do not try again. Set
+# GRAPHVIZ_DOT if the `dot` program is not on the PATH. If the disk cache cannot be
+# written (a read-only checkout) the SVG is kept in memory only.
+
+import hashlib
+import html
+import logging
+import os
+import shutil
+import subprocess
+import threading
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from utils import metrics
+from utils.paths import PROJECT_ROOT
+
+DIAGRAM_CACHE_DIR = os.environ.get("LESSON_DIAGRAM_CACHE", os.path.join(PROJECT_ROOT, ".cache", "diagrams"))
+DOT_ENV_VAR = "GRAPHVIZ_DOT"
+LAYOUT_TIMEOUT = 60
+
+VIEWER = """<style>
+html, body {{ margin: 0; height: 100%; overflow: hidden; font-family: sans-serif; }}
+#view {{ position: relative; width: 100%; height: 100%; cursor: grab; touch-action: none; overflow: hidden; }}
+#view.dragging {{ cursor: grabbing; }}
+#view > svg {{ position: absolute; left: 0; top: 0; transform-origin: 0 0; }}
+#tools {{ position: absolute; top: 6px; right: 6px; display: flex; gap: 4px; }}
+#tools button {{ width: 28px; height: 28px; border: 1px solid #d0d3da; border-radius: 6px;
+                background: #fff; cursor: pointer; font-size: 15px; line-height: 1; }}
+</style>
+<div id="view" title="{title}">{svg}</div>
+<div id="tools">
+  <button data-zoom="1.25" title="Zoom in">+</button>
+  <button data-zoom="0.8" title="Zoom out">&minus;</button>
+  <button id="fit" title="Fit to frame">&#x27F2;</button>
+</div>
+<script>
+const view = document.getElementById("view");
+const svg = view.querySelector("svg");
+const box = svg.viewBox.baseVal;
+svg.setAttribute("width", box.width);
+svg.setAttribute("height", box.height);
+let scale = 1, x = 0, y = 0, drag = null;
+function apply() {{ svg.style.transform = `translate(${{x}}px, ${{y}}px) scale(${{scale}})`; }}
+function fit() {{
+  scale = Math.min(view.clientWidth / box.width, view.clientHeight / box.height, 1.5);
+  x = (view.clientWidth - box.width * scale) / 2;
+  y = (view.clientHeight - box.height * scale) / 2;
+  apply();
+}}
+function zoomAt(cx, cy, factor) {{
+  const next = Math.min(Math.max(scale * factor, 0.05), 20);
+  factor = next / scale;
+  x = cx - (cx - x) * factor;
+  y = cy - (cy - y) * factor;
+  scale = next;
+  apply();
+}}
+view.addEventListener("wheel", e => {{
+  e.preventDefault();
+  const r = view.getBoundingClientRect();
+  zoomAt(e.clientX - r.left, e.clientY - r.top, Math.exp(-e.deltaY * 0.0015));
+}}, {{passive: false}});
+view.addEventListener("pointerdown", e => {{
+  drag = {{px: e.clientX, py: e.clientY, x, y}};
+  view.setPointerCapture(e.pointerId);
+  view.classList.add("dragging");
+}});
+view.addEventListener("pointermove", e => {{
+  if (!drag) return;
+  x = drag.x + e.clientX - drag.px;
+  y = drag.y + e.clientY - drag.py;
+  apply();
+}});
+view.addEventListener("pointerup", () => {{ drag = null; view.classList.remove("dragging"); }});
+view.addEventListener("dblclick", fit);
+document.querySelectorAll("[data-zoom]").forEach(b => b.addEventListener("click",
+  () => zoomAt(view.clientWidth / 2, view.clientHeight / 2, parseFloat(b.dataset.zoom))));
+document.getElementById("fit").addEventListener("click", fit);
+window.addEventListener("resize", fit);
+fit();
+</script>
+"""
+
+_lock = threading.Lock()
+# Source hash -> SVG markup of every diagram laid out or loaded by this process.
+_svgs = {}
+# Source hash -> why the diagram could not be laid out; it is not tried again until
+# the process restarts.
+_failed = {}
+
+logger = logging.getLogger(__name__)
+
+
+class DiagramError(RuntimeError):
+    """Raised when a diagram cannot be laid out (Graphviz missing, or an invalid source)."""
+
+
+def dot_program():
+    """Returns the path of Graphviz's `dot` program, or None if it is not installed."""
+    return os.environ.get(DOT_ENV_VAR) or shutil.which("dot")
+
+
+def source_hash(source, engine="dot"):
+    """Returns the cache key of a diagram: a hash of its layout engine and DOT source."""
+    return hashlib.sha256(f"{engine}\n{source}".encode("utf-8")).hexdigest()[:20]
+
+
+def layout(source, engine="dot"):
+    """
+    Lays a DOT source out into SVG with Graphviz.
+
+    Args:
+        source (str): The DOT source.
+        engine (str, optional): The Graphviz layout engine (dot, neato, ...). Defaults to "dot".
+
+    Returns:
+        str: The `<svg>` element (without the XML prolog).
+    """
+    program = dot_program()
+    if program is None:
+        raise DiagramError("Graphviz is not installed (no `dot` program on the PATH)")
+    try:
+        result = subprocess.run(
+            [program, f"-K{engine}", "-Tsvg"], input=source, capture_output=True, text=True, timeout=LAYOUT_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        raise DiagramError(f"Graphviz did not lay out the diagram within {LAYOUT_TIMEOUT} s") from None
+    except OSError as error:
+        raise DiagramError(f"Could not run Graphviz ({program}): {error}") from None
+    if result.returncode != 0:
+        raise DiagramError(f"Graphviz could not lay out the diagram: {result.stderr.strip()}")
+    svg = result.stdout
+    return svg[svg.index("<svg"):]
+
+
+def render_svg(source, engine="dot"):
+    """
+    Returns the SVG of a diagram from the cache, laying it out only on first use.
+
+    Raises:
+        DiagramError: If it is not cached and cannot be laid out, now or earlier in
+            this process.
+    """
+    key = source_hash(source, engine)
+    svg = _svgs.get(key)
+    if svg is not None:
+        metrics.cache_lookup("diagrams", hit=True)
+        return svg
+    if key in _failed:
+        raise DiagramError(_failed[key])
+    with _lock:
+        svg = _svgs.get(key)
+        hit = svg is not None
+        if svg is None:
+            if key in _failed:
+                raise DiagramError(_failed[key])
+            path = os.path.join(DIAGRAM_CACHE_DIR, f"{key}.svg")
+            try:
+                with open(path, encoding="utf-8") as cached:
+                    svg = cached.read()
+                hit = True
+            except OSError:
+                try:
+                    svg = layout(source, engine)
+                except DiagramError as error:
+                    _failed[key] = str(error)
+                    raise
+                try:
+                    os.makedirs(DIAGRAM_CACHE_DIR, exist_ok=True)
+                    with open(f"{path}.tmp", "w", encoding="utf-8") as target:
+                        target.write(svg)
+                    os.replace(f"{path}.tmp", path)
+                except OSError as error:
+                    # A read-only checkout still gets the diagram, laid out once per process.
+                    logger.warning("Could not write the diagram cache to %s: %s", DIAGRAM_CACHE_DIR, error)
+            _svgs[key] = svg
+    metrics.cache_lookup("diagrams", hit=hit)
+    return svg
+
+
+def graphviz_diagram(source, height=520, engine="dot", title="Drag to pan, scroll to zoom"):
+    """
+    Shows a Graphviz diagram, laid out once and cached, in a pan-and-zoom viewer.
+
+    Args:
+        source (str): The DOT source.
+        height (int, optional): The viewer's height in pixels. Defaults to 520.
+        engine (str, optional): The Graphviz layout engine. Defaults to "dot".
+        title (str, optional): The viewer's tooltip.
+    """
+    try:
+        svg = render_svg(source, engine)
+    except DiagramError:
+        st.graphviz_chart(source)
+        return
+    components.html(VIEWER.format(svg=svg, title=html.escape(title)), height=height)
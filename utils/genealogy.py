@@ -0,0 +1,296 @@
+# utils/genealogy.py
+# This file contains the genealogy engine behind the family trees of the sagas.
+#
+# A family is a JSON list of people (see content/dharma_sindhu_saga/chapter_2/
+# kuru_dynasty.json). Everyone has an id, a name and a sex ("m"/"f"), and may have a
+# "father", a "mother", a "birth_father" (the Mahabharata is full of sons begotten by
+# a sage or a god on behalf of a king: Vyasa for Dhritarashtra and Pandu, Indra for
+# Arjuna...), "spouses", "aliases" (other names the learner may type, see
+# utils/names.py), a "group" (used for colors), a "note" and a "clue" (the riddle of
+# the "Who Am I?" game).
+#
+#   family = load_family(path)              # parsed and indexed once per file version
+#   relation = family.relation("karna", "arjuna")
+#   relation.sentence   # "Karna is Arjuna's half-brother. Both descend from Kunti."
+#   graphviz_diagram(family.subgraph_dot(relation))   # only the people on the path
+#
+# People and relationships are kept as adjacency lists (parents, children, spouses).
+# Because a person has up to three parents, the family is a directed acyclic graph,
+# not a tree, so tree techniques such as Euler tour + LCA would miss relations that
+# run through a mother (Karna and Arjuna share only Kunti). Instead, when a family is
+# loaded, every person gets an ancestor index: {ancestor: (generations up, the parent
+# that leads there)}, built once in topological order. A relationship query then
+# looks up the ancestors of one person in the index of the other, so it costs
+# O(number of ancestors) dictionary lookups, independent of the size of the family.
+
+from collections import namedtuple
+
+from utils.content import load_json
+from utils.names import NameIndex
+
+Relation = namedtuple("Relation", ["a", "b", "kind", "term", "sentence", "path"])
+
+ORDINALS = ("first", "second", "third", "fourth", "fifth", "sixth", "seventh", "eighth")
+GROUP_COLORS = {
+    "pandava": "lightblue",
+    "kaurava": "lightcoral",
+    "kuru": "wheat",
+    "yadava": "gold",
+    "divine": "lightyellow",
+}
+
+class GenealogyError(ValueError):
+    """Raised for an invalid family file, or a query about someone who is not in it."""
+
+
+class Family:
+    """People and their relationships, indexed for relationship queries."""
+
+    def __init__(self, people):
+        self.people = {}
+        for person in people:
+            if person["id"] in self.people:
+                raise GenealogyError(f"Two people with the id '{person['id']}'")
+            self.people[person["id"]] = person
+        self.parents = {pid: [] for pid in self.people}
+        self.children = {pid: [] for pid in self.people}
+        self.spouses = {pid: [] for pid in self.people}
+        for pid, person in self.people.items():
+            for field in ("father", "mother", "birth_father"):
+                parent = person.get(field)
+                if parent is not None:
+                    self._check(parent, f"{pid}.{field}")
+                    if parent not in self.parents[pid]:
+                        self.parents[pid].append(parent)
+                        self.children[parent].append(pid)
+            for spouse in person.get("spouses", ()):
+                self._check(spouse, f"{pid}.spouses")
+                if spouse not in self.spouses[pid]:
+                    self.spouses[pid].append(spouse)
+                if pid not in self.spouses[spouse]:
+                    self.spouses[spouse].append(pid)
+        self.ancestors = self._index_ancestors()
+        self._names = None
+
+    def _check(self, pid, where):
+        if pid not in self.people:
+            raise GenealogyError(f"Unknown person '{pid}' in {where}")
+
+    def _index_ancestors(self):
+        """Builds {person: {ancestor: (generations, parent on the way)}} in topological order."""
+        pending = {pid: len(parents) for pid, parents in self.parents.items()}
+        ready = [pid for pid, count in pending.items() if count == 0]
+        ancestors = {}
+        while ready:
+            pid = ready.pop()
+            index = {}
+            for parent in self.parents[pid]:
+                candidates = [(parent, 1)] + [(ancestor, d + 1) for ancestor, (d, _) in ancestors[parent].items()]
+                for ancestor, generations in candidates:
+                    if ancestor not in index or generations < index[ancestor][0]:
+                        index[ancestor] = (generations, parent)
+            ancestors[pid] = index
+            for child in self.children[pid]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.append(child)
+        if len(ancestors) != len(self.people):
+            raise GenealogyError("The family has a cycle: someone is their own ancestor")
+        return ancestors
+
+    def name(self, pid):
+        return self.people[pid]["name"]
+
+    @property
+    def names(self):
+        """The NameIndex of everyone's name and aliases, built on first use."""
+        if self._names is None:
+            self._names = NameIndex((pid, [person["name"]] + person.get("aliases", []))
+                                    for pid, person in self.people.items())
+        return self._names
+
+    def ids(self):
+        """Returns every person's id, sorted by name."""
+        return sorted(self.people, key=lambda pid: self.people[pid]["name"])
+
+    def _climb(self, pid, ancestor):
+        """Returns the path from pid up to one of its ancestors, both included."""
+        path = [pid]
+        while path[-1] != ancestor:
+            path.append(self.ancestors[path[-1]][ancestor][1])
+        return path
+
+    def common_ancestor(self, a, b):
+        """
+        Returns the nearest common ancestor of a and b (either may be the other's ancestor).
+
+        Returns:
+            tuple: (ancestor, generations from a, generations from b), or None.
+        """
+        index_a = dict(self.ancestors[a], **{a: (0, None)})
+        index_b = dict(self.ancestors[b], **{b: (0, None)})
+        if len(index_b) < len(index_a):
+            index_a, index_b, swapped = index_b, index_a, True
+        else:
+            swapped = False
+        best = None
+        for ancestor, (da, _) in index_a.items():
+            found = index_b.get(ancestor)
+            if found is not None:
+                key = (da + found[0], max(da, found[0]))
+                if best is None or key < best[0]:
+                    best = (key, ancestor, da, found[0])
+        if best is None:
+            return None
+        _, ancestor, da, db = best
+        return (ancestor, db, da) if swapped else (ancestor, da, db)
+
+    def relation(self, a, b):
+        """
+        Describes how person a is related to person b.
+
+        Returns:
+            Relation: kind is "self", "spouse", "blood", "marriage" or None (no recorded
+                relation); term is e.g. "half-brother"; path lists the people that
+                connect them, from a to b.
+        """
+        for pid in (a, b):
+            if pid not in self.people:
+                raise GenealogyError(f"Unknown person '{pid}'")
+        name_a, name_b = self.name(a), self.name(b)
+        if a == b:
+            return Relation(a, b, "self", "self", f"That is {name_a} twice.", [a])
+        if b in self.spouses[a]:
+            term = _gendered(self.people[a], "husband", "wife")
+            return Relation(a, b, "spouse", term, f"{name_a} is {name_b}'s {term}.", [a, b])
+
+        found = self.common_ancestor(a, b)
+        if found is not None:
+            ancestor, da, db = found
+            path = self._climb(a, ancestor) + self._climb(b, ancestor)[-2::-1]
+            term = self._blood_term(a, b, ancestor, da, db)
+            sentence = f"{name_a} is {name_b}'s {term}."
+            if da and db:
+                shared = [p for p in self.parents[a] if p in self.parents[b]] if da == db == 1 else [ancestor]
+                sentence += f" Both descend from {_join(self.name(p) for p in shared)}."
+            return Relation(a, b, "blood", term, sentence, path)
+        return self._marriage_relation(a, b)
+
+    def _blood_term(self, a, b, ancestor, da, db):
+        person = self.people[a]
+        if da == 0:
+            return _generations(db, _gendered(person, "father", "mother"), _gendered(person, "grandfather", "grandmother"))
+        if db == 0:
+            return _generations(da, _gendered(person, "son", "daughter"), _gendered(person, "grandson", "granddaughter"))
+        if da == db == 1:
+            full = all(self.people[a].get(f) is not None and self.people[a].get(f) == self.people[b].get(f)
+                       for f in ("father", "mother"))
+            return ("" if full else "half-") + _gendered(person, "brother", "sister")
+        if da == 1:
+            term = _generations(db - 1, _gendered(person, "uncle", "aunt"), _gendered(person, "grand-uncle", "grand-aunt"))
+            if db == 2:
+                # The parent of b through whom the relation runs.
+                side = self._climb(b, ancestor)[1]
+                term = ("maternal " if side == self.people[b].get("mother") else "paternal ") + term
+            return term
+        if db == 1:
+            return _generations(da - 1, _gendered(person, "nephew", "niece"),
+                                _gendered(person, "grand-nephew", "grand-niece"))
+        degree, removed = min(da, db) - 1, abs(da - db)
+        term = f"{ORDINALS[min(degree, len(ORDINALS)) - 1]} cousin"
+        if removed:
+            term += " " + {1: "once", 2: "twice"}.get(removed, f"{removed} times") + " removed"
+        return term
+
+    def _marriage_relation(self, a, b):
+        name_a, name_b = self.name(a), self.name(b)
+        person = self.people[a]
+
+        def result(term, path):
+            return Relation(a, b, "marriage", term, f"{name_a} is {name_b}'s {term}.", path)
+
+        for parent in self.parents[b]:
+            if a in self.spouses[parent]:
+                return result(_gendered(person, "stepfather", "stepmother"), [a, parent, b])
+        for parent in self.parents[a]:
+            if b in self.spouses[parent]:
+                return result(_gendered(person, "stepson", "stepdaughter"), [a, parent, b])
+        for child in self.children[b]:
+            if a in self.spouses[child]:
+                return result(_gendered(person, "son-in-law", "daughter-in-law"), [a, child, b])
+        for child in self.children[a]:
+            if b in self.spouses[child]:
+                return result(_gendered(person, "father-in-law", "mother-in-law"), [a, child, b])
+        # Two wives of one husband (Kunti and Madri), or two husbands of one wife, are not
+        # in-laws of each other.
+        for spouse in self.spouses[a]:
+            if spouse in self.spouses[b]:
+                return result(_gendered(person, "co-husband", "co-wife"), [a, spouse, b])
+        in_law = _gendered(person, "brother-in-law", "sister-in-law")
+        for spouse in self.spouses[b]:
+            if set(self.parents[a]) & set(self.parents[spouse]):
+                return result(in_law, [a, spouse, b])
+        for spouse in self.spouses[a]:
+            if set(self.parents[b]) & set(self.parents[spouse]):
+                return result(in_law, [a, spouse, b])
+            for other in self.spouses[b]:
+                if set(self.parents[spouse]) & set(self.parents[other]):
+                    return result("co-" + in_law, [a, spouse, other, b])
+        return Relation(a, b, None, None, f"No relation between {name_a} and {name_b} is recorded.", [a, b])
+
+    def subgraph_dot(self, relation):
+        """Returns the DOT source of the people on a relation's path, and their links."""
+        people = list(dict.fromkeys(relation.path))
+        if relation.kind == "blood" and relation.term.endswith(("brother", "sister")):
+            # Siblings: show every parent they share, not only the first.
+            people += [p for p in self.parents[relation.a] if p in self.parents[relation.b] and p not in people]
+        lines = ["digraph relation {", "  rankdir=TB;", '  node [shape=box, style="rounded,filled", fillcolor=white];']
+        for pid in people:
+            person = self.people[pid]
+            attributes = [f'label="{_dot_escape(person["name"])}"']
+            color = GROUP_COLORS.get(person.get("group"))
+            if color:
+                attributes.append(f"fillcolor={color}")
+            if pid in (relation.a, relation.b):
+                attributes.append("penwidth=2.5")
+            lines.append(f'  "{pid}" [{", ".join(attributes)}];')
+        shown = set(people)
+        for pid in people:
+            person = self.people[pid]
+            for field, style in (("father", ""), ("mother", ""), ("birth_father", ", style=dashed, label=\" begot\"")):
+                parent = person.get(field)
+                if parent in shown:
+                    lines.append(f'  "{parent}" -> "{pid}" [arrowsize=0.7{style}];')
+            for spouse in self.spouses[pid]:
+                if spouse in shown and pid < spouse:
+                    lines.append(f'  "{pid}" -> "{spouse}" [dir=none, style=dotted, label=" married", constraint=false];')
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def _gendered(person, male, female):
+    return female if person.get("sex") == "f" else male
+
+
+def _generations(count, one, two):
+    """Returns one (count 1), two (count 2) or two with "great-" prefixes (count 3+)."""
+    if count == 1:
+        return one
+    return "great-" * (count - 2) + two
+
+
+def _join(names):
+    names = list(names)
+    return names[0] if len(names) == 1 else ", ".join(names[:-1]) + " and " + names[-1]
+
+
+def _dot_escape(text):
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def load_family(path):
+    """
+    Returns the Family stored in a JSON file, parsed and indexed on first use and again
+    only when the file changes.
+    """
+    return load_json(path, Family)
@@ -0,0 +1,300 @@
+# utils/geo.py
+# This file contains the offline map layer: GeoJSON features bundled with the app,
+# a spatial index for viewport queries, and simplified geometries per zoom level.
+#
+# A layer is a GeoJSON FeatureCollection (see content/dharma_sindhu_saga/
+# chapter_0_syllabus/haryana_sites.geojson) of Points, LineStrings and Polygons (and
+# their Multi- forms). Each feature may carry a "name", a "chapter" and a "detail"
+# property, shown when the learner hovers over it.
+#
+#   layer = load_layer(path)                 # parsed, indexed and simplified once per file version
+#   layer.viewport((lon_min, lat_min, lon_max, lat_max), zoom="District")
+#   site_map(layer, key="haryana_map")       # the widget
+#
+# Nothing is fetched from the network: there are no map tiles, the features are drawn
+# with plain plotly scatter traces on longitude/latitude axes.
+#
+# When a layer is loaded, every line and polygon is simplified once per zoom level
+# with the Douglas-Peucker algorithm (a coarser tolerance for wider views), and every
+# feature's bounding box is put in a uniform grid. A viewport query then looks only at
+# the grid cells the viewport covers and returns the geometries at the viewport's
+# zoom level, so the browser receives only the features it can see, with only the
+# vertices that make a visible difference. tools/benchmark_geo.py measures the
+# queries on 10,000+ features.
+
+import math
+from collections import namedtuple
+
+import streamlit as st
+
+from utils.content import load_json
+from utils.deferred import deferred_import
+
+go = deferred_import("plotly.graph_objects")
+
+# The zoom levels of the map: the width of the viewport in degrees of longitude, and
+# the Douglas-Peucker tolerance (in degrees) of the geometries shown at that width,
+# about a pixel on a 700 pixel wide map.
+ZOOM_LEVELS = {
+    "All of Haryana": (4.0, 0.006),
+    "Region": (1.5, 0.002),
+    "District": (0.5, 0.0007),
+    "Town": (0.15, 0.0),
+}
+# Aim for about this many features per grid cell.
+FEATURES_PER_CELL = 4
+POINT_COLOR = "#c0392b"
+LINE_COLOR = "#2e86c1"
+AREA_COLOR = "rgba(244, 208, 63, 0.25)"
+
+# kind is "point", "line" or "area"; parts is a list of [(lon, lat), ...] sequences;
+# levels maps every zoom level to the simplified parts.
+Feature = namedtuple("Feature", ["id", "kind", "properties", "bbox", "levels"])
+
+class GeoError(ValueError):
+    """Raised for GeoJSON the map layer cannot read."""
+
+
+def douglas_peucker(points, tolerance):
+    """
+    Simplifies a polyline: drops every vertex closer than tolerance to the line
+    through the vertices kept around it. The first and last vertices are always kept.
+
+    Args:
+        points (list): The (x, y) vertices.
+        tolerance (float): The largest distance a dropped vertex may be from the result.
+
+    Returns:
+        list: The kept vertices, in order.
+    """
+    if tolerance <= 0 or len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = points[first], points[last]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        farthest, distance = None, tolerance
+        for i in range(first + 1, last):
+            x, y = points[i]
+            if length == 0:
+                d = math.hypot(x - x1, y - y1)
+            else:
+                d = abs(dy * (x - x1) - dx * (y - y1)) / length
+            if d > distance:
+                farthest, distance = i, d
+        if farthest is not None:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+class GridIndex:
+    """A uniform grid over bounding boxes, for "which boxes meet this box?" queries."""
+
+    def __init__(self, bboxes, cells_per_side=None):
+        self.bboxes = list(bboxes)
+        if not self.bboxes:
+            self.extent, self.cell_w, self.cell_h, self.cells = (0, 0, 0, 0), 1, 1, {}
+            return
+        self.extent = (min(b[0] for b in self.bboxes), min(b[1] for b in self.bboxes),
+                       max(b[2] for b in self.bboxes), max(b[3] for b in self.bboxes))
+        if cells_per_side is None:
+            cells_per_side = max(1, round(math.sqrt(len(self.bboxes) / FEATURES_PER_CELL)))
+        self.cell_w = (self.extent[2] - self.extent[0]) / cells_per_side or 1.0
+        self.cell_h = (self.extent[3] - self.extent[1]) / cells_per_side or 1.0
+        self.cells = {}
+        for i, bbox in enumerate(self.bboxes):
+            for cell in self._cells(bbox):
+                self.cells.setdefault(cell, []).append(i)
+
+    def _cells(self, bbox):
+        x0, y0 = self.extent[0], self.extent[1]
+        for cx in range(math.floor((bbox[0] - x0) / self.cell_w), math.floor((bbox[2] - x0) / self.cell_w) + 1):
+            for cy in range(math.floor((bbox[1] - y0) / self.cell_h), math.floor((bbox[3] - y0) / self.cell_h) + 1):
+                yield cx, cy
+
+    def query(self, bbox):
+        """Returns the indexes of the boxes that intersect bbox, in ascending order."""
+        # Clamp the query to the indexed extent so a huge viewport does not walk empty cells.
+        clamped = (max(bbox[0], self.extent[0]), max(bbox[1], self.extent[1]),
+                   min(bbox[2], self.extent[2]), min(bbox[3], self.extent[3]))
+        if clamped[0] > clamped[2] or clamped[1] > clamped[3]:
+            return []
+        x0, y0 = self.extent[0], self.extent[1]
+        visited = ((math.floor((clamped[2] - x0) / self.cell_w) - math.floor((clamped[0] - x0) / self.cell_w) + 1)
+                   * (math.floor((clamped[3] - y0) / self.cell_h) - math.floor((clamped[1] - y0) / self.cell_h) + 1))
+        if visited > len(self.cells) / 2:
+            # The query covers most of the grid: one pass over the boxes is cheaper
+            # than collecting and deduplicating them cell by cell.
+            return [i for i, b in enumerate(self.bboxes)
+                    if b[0] <= bbox[2] and b[2] >= bbox[0] and b[1] <= bbox[3] and b[3] >= bbox[1]]
+        found = set()
+        for cell in self._cells(clamped):
+            for i in self.cells.get(cell, ()):
+                b = self.bboxes[i]
+                if b[0] <= bbox[2] and b[2] >= bbox[0] and b[1] <= bbox[3] and b[3] >= bbox[1]:
+                    found.add(i)
+        return sorted(found)
+
+
+def _parts(geometry):
+    """Returns (kind, parts) of a GeoJSON geometry."""
+    kind, coordinates = geometry.get("type"), geometry.get("coordinates")
+    if kind == "Point":
+        return "point", [[coordinates]]
+    if kind == "MultiPoint":
+        return "point", [[point] for point in coordinates]
+    if kind == "LineString":
+        return "line", [coordinates]
+    if kind == "MultiLineString":
+        return "line", list(coordinates)
+    if kind == "Polygon":
+        return "area", list(coordinates)
+    if kind == "MultiPolygon":
+        return "area", [ring for polygon in coordinates for ring in polygon]
+    raise GeoError(f"Unsupported geometry type '{kind}'")
+
+
+class GeoLayer:
+    """The features of a GeoJSON FeatureCollection, indexed and simplified per zoom level."""
+
+    def __init__(self, collection):
+        if collection.get("type") != "FeatureCollection":
+            raise GeoError("Expected a GeoJSON FeatureCollection")
+        self.features = []
+        for i, raw in enumerate(collection.get("features", ())):
+            kind, parts = _parts(raw.get("geometry") or {})
+            parts = [[(float(p[0]), float(p[1])) for p in part] for part in parts]
+            xs = [x for part in parts for x, _ in part]
+            ys = [y for part in parts for _, y in part]
+            if not xs:
+                raise GeoError(f"Feature {i} has no coordinates")
+            if kind == "point":
+                levels = {zoom: parts for zoom in ZOOM_LEVELS}
+            else:
+                levels = {zoom: [douglas_peucker(part, tolerance) for part in parts]
+                          for zoom, (_, tolerance) in ZOOM_LEVELS.items()}
+            self.features.append(Feature(raw.get("id", i), kind, raw.get("properties") or {},
+                                         (min(xs), min(ys), max(xs), max(ys)), levels))
+        self.index = GridIndex(feature.bbox for feature in self.features)
+        self.extent = self.index.extent
+
+    def viewport(self, bbox, zoom):
+        """
+        Returns the features that intersect a viewport, simplified for a zoom level.
+
+        Args:
+            bbox (tuple): (lon_min, lat_min, lon_max, lat_max).
+            zoom (str): One of ZOOM_LEVELS.
+
+        Returns:
+            list: (feature, parts) pairs, parts being the feature's geometry at that zoom.
+        """
+        if zoom not in ZOOM_LEVELS:
+            raise GeoError(f"Unknown zoom level '{zoom}'. Expected one of {tuple(ZOOM_LEVELS)}.")
+        return [(self.features[i], self.features[i].levels[zoom]) for i in self.index.query(bbox)]
+
+    def named_points(self):
+        """Returns {name: (lon, lat)} of every point feature with a name, sorted by name."""
+        points = {feature.properties["name"]: feature.levels[next(iter(ZOOM_LEVELS))][0][0]
+                  for feature in self.features if feature.kind == "point" and feature.properties.get("name")}
+        return dict(sorted(points.items()))
+
+
+def load_layer(path):
+    """
+    Returns the GeoLayer stored in a GeoJSON file, parsed and indexed on first use and
+    again only when the file changes.
+    """
+    return load_json(path, GeoLayer)
+
+
+def viewport_bbox(center, zoom):
+    """Returns the (lon_min, lat_min, lon_max, lat_max) of a 4:3 viewport around center."""
+    width = ZOOM_LEVELS[zoom][0]
+    # A degree of longitude is shorter than a degree of latitude away from the equator.
+    height = width * 0.75 * math.cos(math.radians(center[1]))
+    return (center[0] - width / 2, center[1] - height / 2, center[0] + width / 2, center[1] + height / 2)
+
+
+def _hover(properties):
+    text = f"<b>{properties.get('name', '')}</b>"
+    if properties.get("detail"):
+        text += f"<br>{properties['detail']}"
+    if properties.get("chapter"):
+        text += f"<br><i>Chapter {properties['chapter']}</i>"
+    return text
+
+
+def map_figure(found, bbox):
+    """Returns the plotly figure of the (feature, parts) pairs of a viewport."""
+    fig = go.Figure()
+    for kind in ("area", "line"):
+        xs, ys = [], []
+        for feature, parts in found:
+            if feature.kind == kind:
+                for part in parts:
+                    xs += [x for x, _ in part] + [None]
+                    ys += [y for _, y in part] + [None]
+        if xs:
+            fig.add_trace(go.Scatter(
+                x=xs, y=ys, mode="lines", hoverinfo="skip",
+                line={"color": LINE_COLOR if kind == "line" else "#b7950b", "width": 2 if kind == "line" else 1},
+                fill="toself" if kind == "area" else None, fillcolor=AREA_COLOR if kind == "area" else None,
+            ))
+    points = [(feature, parts[0][0]) for feature, parts in found if feature.kind == "point"]
+    if points:
+        fig.add_trace(go.Scatter(
+            x=[p[0] for _, p in points], y=[p[1] for _, p in points],
+            mode="markers+text", marker={"size": 10, "color": POINT_COLOR},
+            text=[feature.properties.get("name", "") for feature, _ in points], textposition="top center",
+            hovertext=[_hover(feature.properties) for feature, _ in points], hoverinfo="text",
+        ))
+    mid_lat = (bbox[1] + bbox[3]) / 2
+    fig.update_layout(
+        height=520, margin={"l": 10, "r": 10, "t": 10, "b": 10}, showlegend=False, dragmode="pan",
+        plot_bgcolor="#fbfcfc",
+        xaxis={"range": [bbox[0], bbox[2]], "showgrid": False, "zeroline": False, "title": None},
+        # Keep the map's proportions: one degree of latitude is 1/cos(latitude) degrees of longitude.
+        yaxis={"range": [bbox[1], bbox[3]], "showgrid": False, "zeroline": False,
+               "scaleanchor": "x", "scaleratio": 1 / math.cos(math.radians(mid_lat))},
+    )
+    return fig
+
+
+@st.fragment
+def site_map(layer, key, default_zoom="All of Haryana"):
+    """
+    Shows a map of a layer's features. Only the widget reruns when the learner moves it.
+
+    Args:
+        layer (GeoLayer): The features.
+        key (str): A unique prefix for the widget keys.
+        default_zoom (str, optional): One of ZOOM_LEVELS. Defaults to "All of Haryana".
+    """
+    whole = "The whole map"
+    points = layer.named_points()
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        zoom = st.select_slider("Zoom", options=list(ZOOM_LEVELS), value=default_zoom, key=f"{key}_zoom")
+    with col2:
+        place = st.selectbox("Center on", [whole] + list(points), key=f"{key}_center")
+    if place == whole:
+        extent = layer.extent
+        center = ((extent[0] + extent[2]) / 2, (extent[1] + extent[3]) / 2)
+    else:
+        center = points[place]
+    bbox = viewport_bbox(center, zoom)
+    # Half a viewport of margin on every side, so a short pan in the browser finds features.
+    margin_x, margin_y = (bbox[2] - bbox[0]) / 2, (bbox[3] - bbox[1]) / 2
+    found = layer.viewport((bbox[0] - margin_x, bbox[1] - margin_y, bbox[2] + margin_x, bbox[3] + margin_y), zoom)
+    st.plotly_chart(map_figure(found, bbox), use_container_width=True,
+                    config={"scrollZoom": True, "displaylogo": False})
+    vertices = sum(len(part) for _, parts in found for part in parts)
+    st.caption(f"{len(found)} of {len(layer.features)} features sent, {vertices} vertices. "
+               f"Drag to pan, scroll to zoom, hover over a site for its story.")
@@ -0,0 +1,86 @@
+# utils/lazy.py
+# This file contains tabs and expanders whose bodies only run while they are open.
+#
+# A plain `st.tabs` or `st.expander` runs the code of every body on every rerun,
+# even the ones the learner cannot see. A chapter with three game tabs pays for
+# all three games' matrices, figures and widgets each time anything changes.
+#
+# The helpers below ask Streamlit to track which tab or expander is open and only
+# call the matching body. Each lazy container runs as its own fragment, so opening
+# a tab reruns just that container rather than the whole chapter.
+#
+# Things to know when writing a lazy body:
+#   - A body is a function that takes no arguments (use functools.partial or a
+#     lambda to pass values in).
+#   - Widgets inside a hidden body are not rendered, so they return to their
+#     defaults when the body is opened again, just like after switching chapters.
+#     Pass the keys of widgets whose value must survive (the answers of a quiz) to
+#     lazy_tabs as `keep`: Streamlit drops the state of a widget that is not drawn,
+#     unless the run stores it in session state itself, which lazy_tabs does for
+#     the widgets of every closed tab.
+#   - On Streamlit versions that cannot track the open tab or expander, every body
+#     runs as before, so the page still works, just without the savings.
+
+import inspect
+
+import streamlit as st
+
+# Open-state tracking (`on_change`) is only available in newer Streamlit releases.
+_TRACKS_TABS = "on_change" in inspect.signature(st.tabs).parameters
+_TRACKS_EXPANDERS = "on_change" in inspect.signature(st.expander).parameters
+
+
+def _is_open(container):
+    """Returns False only when Streamlit reports the container as closed."""
+    return getattr(container, "open", None) is not False
+
+
+@st.fragment
+def lazy_tabs(key, bodies, default=None, keep=None):
+    """
+    Renders a set of tabs and runs only the body of the tab that is open.
+
+    Args:
+        key (str): A unique widget key for the tabs, used to remember the open tab.
+        bodies (dict): Maps each tab label to a no-argument function that renders
+            the tab's contents, in display order.
+        default (str, optional): The label of the tab open at first. Defaults to
+            None, which opens the first tab.
+        keep (dict, optional): Maps a tab label to the keys of widgets in its body
+            whose values are kept while the tab is closed, e.g. the answers of a quiz.
+    """
+    labels = list(bodies)
+    if _TRACKS_TABS:
+        tabs = st.tabs(labels, key=key, default=default, on_change="rerun")
+    else:
+        tabs = st.tabs(labels)
+
+    for tab, (label, body) in zip(tabs, bodies.items()):
+        if _is_open(tab):
+            with tab:
+                body()
+        elif keep:
+            for widget_key in keep.get(label, ()):
+                if widget_key in st.session_state:
+                    st.session_state[widget_key] = st.session_state[widget_key]
+
+
+@st.fragment
+def lazy_expander(key, label, body, expanded=False):
+    """
+    Renders an expander that runs its body only while it is expanded.
+
+    Args:
+        key (str): A unique widget key for the expander, used to remember its state.
+        label (str): The expander's label.
+        body (callable): A no-argument function that renders the expander's contents.
+        expanded (bool, optional): Whether the expander starts open. Defaults to False.
+    """
+    if _TRACKS_EXPANDERS:
+        expander = st.expander(label, expanded=expanded, key=key, on_change="rerun")
+    else:
+        expander = st.expander(label, expanded=expanded)
+
+    if _is_open(expander):
+        with expander:
+            body()
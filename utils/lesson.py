@@ -0,0 +1,93 @@
+# utils/lesson.py
+# This file contains the shared helper that turns the seven parts of a chapter
+# (see LESSON_DESIGN_GUIDE.md, "The Anatomy of a Great Chapter") into independently
+# rerunnable sections.
+#
+# A chapter used to be one long render() function, so moving a single slider re-ran
+# every markdown wall, game and quiz on the page. Each part now lives in its own
+# function decorated with @lesson_part, which runs it as an `st.fragment`: a widget
+# inside the part re-executes only that part.
+#
+# A part whose widgets feed values into *later* parts (the Yantra levers in the
+# determinant chapter, for example) must be declared with `isolated=False`. It then
+# runs inline as before, so its widgets still rerun the whole chapter and the parts
+# that depend on it always receive fresh values as arguments.
+
+import functools
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils import metrics, profiler
+
+LESSON_PARTS = ("Analogy", "Mechanism", "Gallery", "Formalization", "Games", "Horizon", "Pariksha")
+
+# Session-state key holding the duration (in seconds) of the last run of every part.
+PART_TIMINGS_KEY = "lesson_part_timings"
+
+# Whether the part running on this thread is isolated (runs as a fragment).
+_local = threading.local()
+
+
+def lesson_part(name, isolated=True):
+    """
+    Decorator that marks a function as one of the seven parts of a chapter.
+
+    Args:
+        name (str): The part's name, one of LESSON_PARTS.
+        isolated (bool, optional): Run the part as a fragment so its widgets rerun only
+            this part. Set to False for parts whose widgets feed later parts.
+            Defaults to True.
+
+    Returns:
+        callable: The decorated part, called from the chapter's render() function.
+    """
+    if name not in LESSON_PARTS:
+        raise ValueError(f"Unknown lesson part '{name}'. Expected one of {LESSON_PARTS}.")
+
+    def decorator(func):
+        @functools.wraps(func)
+        def timed_part(*args, **kwargs):
+            profiler.part_started(func.__module__, name)
+            start = time.perf_counter()
+            enclosing, _local.isolated = getattr(_local, "isolated", False), isolated
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _local.isolated = enclosing
+                seconds = time.perf_counter() - start
+                timings = st.session_state.setdefault(PART_TIMINGS_KEY, {})
+                timings[f"{func.__module__}:{name}"] = seconds
+                profiler.part_finished(seconds)
+                if in_part_rerun():
+                    metrics.part_rerun(func.__module__, name)
+
+        part = st.fragment(timed_part) if isolated else timed_part
+        part.lesson_part = name
+        part.isolated = isolated
+        return part
+
+    return decorator
+
+
+def in_isolated_part():
+    """Returns True while the body of an isolated part (one that runs as a fragment) is running."""
+    return getattr(_local, "isolated", False)
+
+
+def in_part_rerun():
+    """Returns True when the current script run only re-executes one or more fragments."""
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+def rerun_part():
+    """
+    Reruns only the current lesson part when possible, otherwise the whole app.
+
+    A fragment-scoped rerun is only allowed while a fragment is being rerun on its own,
+    not while it is running as part of a full app run, so this picks the right scope.
+    """
+    st.rerun(scope="fragment" if in_part_rerun() else "app")
@@ -0,0 +1,324 @@
+# utils/metrics.py
+# This file contains the production metrics of the app, in the Prometheus text format.
+#
+# Metrics are collected for the whole server process and are off unless one of
+# these environment variables is set when Streamlit starts:
+#
+#   LESSON_METRICS_PORT=9464         serve them at http://127.0.0.1:9464/metrics
+#   LESSON_METRICS_FILE=metrics.prom rewrite this file (at most every few seconds)
+#                                    for a node-exporter textfile collector
+#
+# They are fed by small hooks: start_run()/finish_run() around the chapter dispatch
+# in app.py, part_rerun() in utils/lesson.py for reruns of a single lesson part,
+# cache_lookup() in the app's own caches (utils/static.py), and wrappers (installed
+# once, like the profiler's) around `st.pyplot`, Streamlit's media storage and the
+# hit/miss paths of `st.cache_data`/`st.cache_resource`:
+#
+#   lesson_reruns_total{saga,chapter}             full reruns of the app
+#   lesson_rerun_seconds{saga}                    histogram of full rerun durations
+#   lesson_part_reruns_total{chapter,part}        reruns of a single lesson part
+#   lesson_active_sessions{saga}                  sessions seen in the last 5 minutes
+#   lesson_figure_render_seconds                  histogram of `st.pyplot` durations
+#   lesson_figure_bytes_total                     image bytes emitted by `st.pyplot`
+#   lesson_cache_requests_total{cache,result}     cache lookups, result "hit" or "miss"
+#   lesson_session_state_bytes                    histogram of pickled session-state sizes
+#
+# When metrics are off the hooks cost one global lookup per call.
+
+import functools
+import http.server
+import os
+import pickle
+import threading
+import time
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+PORT_ENV_VAR = "LESSON_METRICS_PORT"
+FILE_ENV_VAR = "LESSON_METRICS_FILE"
+HOST = "127.0.0.1"
+
+# A session counts as active for this long after its last rerun.
+ACTIVE_SESSION_SECONDS = 300
+# The scrape file is rewritten at most this often.
+FILE_INTERVAL_SECONDS = 5.0
+# Session state is pickled to measure it on every this many reruns of a session.
+SESSION_STATE_SAMPLE_EVERY = 10
+
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Session-state key holding the metrics' per-session bookkeeping.
+METRICS_STATE_KEY = "lesson_metrics_state"
+
+_lock = threading.Lock()
+_installed = False
+_enabled = False
+_file_written = 0.0
+# Whether this thread is inside `st.pyplot`, so the image it stores is counted, and
+# which cached function it is looking up on the miss path.
+_local = threading.local()
+
+
+class Histogram:
+    """A Prometheus histogram: cumulative bucket counts, a sum and a count."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+
+# name -> (type, help, {label tuple: value or Histogram})
+_metrics = {
+    "lesson_reruns_total": ("counter", "Full reruns of the app.", {}),
+    "lesson_rerun_seconds": ("histogram", "Duration of full reruns.", {}),
+    "lesson_part_reruns_total": ("counter", "Reruns of a single lesson part.", {}),
+    "lesson_active_sessions": ("gauge", f"Sessions seen in the last {ACTIVE_SESSION_SECONDS} s.", {}),
+    "lesson_figure_render_seconds": ("histogram", "Duration of st.pyplot calls.", {}),
+    "lesson_figure_bytes_total": ("counter", "Image bytes emitted by st.pyplot.", {}),
+    "lesson_cache_requests_total": ("counter", "Lookups in st.cache_data, st.cache_resource and static blocks.", {}),
+    "lesson_session_state_bytes": ("histogram", "Pickled size of a session's state.", {}),
+}
+_label_names = {
+    "lesson_reruns_total": ("saga", "chapter"),
+    "lesson_rerun_seconds": ("saga",),
+    "lesson_part_reruns_total": ("chapter", "part"),
+    "lesson_active_sessions": ("saga",),
+    "lesson_cache_requests_total": ("cache", "result"),
+}
+# session id -> (saga, time of its last rerun)
+_sessions = {}
+
+
+def _inc(name, labels=(), amount=1):
+    with _lock:
+        values = _metrics[name][2]
+        values[labels] = values.get(labels, 0) + amount
+
+
+def _observe(name, value, labels=(), buckets=DURATION_BUCKETS):
+    with _lock:
+        values = _metrics[name][2]
+        if labels not in values:
+            values[labels] = Histogram(buckets)
+        values[labels].observe(value)
+
+
+def install():
+    """Wraps the measured Streamlit calls and starts the exporter once per process."""
+    global _installed, _enabled
+    with _lock:
+        if _installed:
+            return
+        _installed = True
+        port = os.environ.get(PORT_ENV_VAR)
+        _enabled = bool(port or os.environ.get(FILE_ENV_VAR))
+        if not _enabled:
+            return
+
+    # Like the profiler, wrap both the `st.` shortcut and the DeltaGenerator method.
+    DeltaGenerator.pyplot = _measured_pyplot(DeltaGenerator.pyplot)
+    st.pyplot = _measured_pyplot(st.pyplot)
+    _wrap_media_storage()
+    _wrap_caches()
+    if port:
+        server = http.server.ThreadingHTTPServer((HOST, int(port)), _MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="lesson-metrics", daemon=True).start()
+
+
+def _measured_pyplot(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _local.in_pyplot = True
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.in_pyplot = False
+            _observe("lesson_figure_render_seconds", time.perf_counter() - start)
+    return wrapper
+
+
+def _wrap_media_storage():
+    from streamlit.runtime.media_file_manager import MediaFileManager
+
+    add = MediaFileManager.add
+
+    @functools.wraps(add)
+    def counted_add(self, path_or_data, *args, **kwargs):
+        if getattr(_local, "in_pyplot", False) and isinstance(path_or_data, bytes):
+            _inc("lesson_figure_bytes_total", amount=len(path_or_data))
+        return add(self, path_or_data, *args, **kwargs)
+
+    MediaFileManager.add = counted_add
+
+
+def _wrap_caches():
+    # These are internals of Streamlit's caching; if a release renames them the
+    # cache metrics stay empty instead of breaking the app.
+    try:
+        from streamlit.runtime.caching.cache_utils import CachedFunc
+        hit, miss = CachedFunc._handle_cache_hit, CachedFunc._handle_cache_miss
+    except (ImportError, AttributeError):
+        return
+
+    @functools.wraps(hit)
+    def counted_hit(self, *args, **kwargs):
+        if getattr(_local, "missed", None) is self:
+            # The miss path found the value computed by another thread after all.
+            _local.missed = None
+        _inc("lesson_cache_requests_total", (self._info.display_name, "hit"))
+        return hit(self, *args, **kwargs)
+
+    @functools.wraps(miss)
+    def counted_miss(self, *args, **kwargs):
+        # The miss path looks the value up again under a lock and takes the hit path if
+        # another thread computed it meanwhile: such a lookup counts as a hit only.
+        outer, _local.missed = getattr(_local, "missed", None), self
+        try:
+            return miss(self, *args, **kwargs)
+        finally:
+            if _local.missed is self:
+                _inc("lesson_cache_requests_total", (self._info.display_name, "miss"))
+            _local.missed = outer
+
+    CachedFunc._handle_cache_hit = counted_hit
+    CachedFunc._handle_cache_miss = counted_miss
+
+
+def start_run():
+    """Begins measuring a full rerun. Call it near the top of app.py."""
+    install()
+    if not _enabled:
+        return
+    state = st.session_state.setdefault(METRICS_STATE_KEY, {"run": 0})
+    state["run"] += 1
+    state["started"] = time.perf_counter()
+
+
+def finish_run(saga, chapter):
+    """
+    Ends measuring a full rerun of the given saga and chapter. Call it after the dispatch.
+
+    Args:
+        saga (str): The saga chosen in the sidebar.
+        chapter (str): The chapter that was rendered.
+    """
+    if not _enabled:
+        return
+    state = st.session_state.get(METRICS_STATE_KEY)
+    if state is None:
+        return
+    _inc("lesson_reruns_total", (saga, chapter))
+    _observe("lesson_rerun_seconds", time.perf_counter() - state["started"], (saga,))
+
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        with _lock:
+            _sessions[ctx.session_id] = (saga, time.time())
+    if state["run"] % SESSION_STATE_SAMPLE_EVERY == 1:
+        _observe("lesson_session_state_bytes", _session_state_bytes(), buckets=BYTES_BUCKETS)
+    _maybe_write_file()
+
+
+def part_rerun(chapter, part):
+    """Counts a rerun of a single lesson part (one that did not rerun the whole app)."""
+    if _enabled:
+        _inc("lesson_part_reruns_total", (chapter, part))
+
+
+def cache_lookup(cache, hit):
+    """Counts a lookup in one of the app's own caches (e.g. utils/static.py)."""
+    if _enabled:
+        _inc("lesson_cache_requests_total", (cache, "hit" if hit else "miss"))
+
+
+def _session_state_bytes():
+    """Returns the pickled size of this session's state, skipping values that cannot be pickled."""
+    size = 0
+    for key in list(st.session_state.keys()):
+        try:
+            size += len(pickle.dumps(st.session_state[key], protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            pass
+    return size
+
+
+def render():
+    """Returns all metrics in the Prometheus text exposition format."""
+    now = time.time()
+    with _lock:
+        for session, (saga, seen) in list(_sessions.items()):
+            if now - seen > ACTIVE_SESSION_SECONDS:
+                del _sessions[session]
+        active = _metrics["lesson_active_sessions"][2]
+        active.clear()
+        for saga, _ in _sessions.values():
+            active[(saga,)] = active.get((saga,), 0) + 1
+
+        lines = []
+        for name, (kind, help_text, values) in _metrics.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            label_names = _label_names.get(name, ())
+            for labels, value in sorted(values.items()):
+                pairs = [f'{k}="{_escape(v)}"' for k, v in zip(label_names, labels)]
+                if isinstance(value, Histogram):
+                    bounds = [f"{bound:g}" for bound in value.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, value.counts + [value.count]):
+                        le = f'le="{bound}"'
+                        lines.append(f"{name}_bucket{_labels(pairs + [le])} {count}")
+                    lines.append(f"{name}_sum{_labels(pairs)} {value.sum:.6g}")
+                    lines.append(f"{name}_count{_labels(pairs)} {value.count}")
+                else:
+                    lines.append(f"{name}{_labels(pairs)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(pairs):
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _maybe_write_file():
+    global _file_written
+    path = os.environ.get(FILE_ENV_VAR)
+    if not path or time.monotonic() - _file_written < FILE_INTERVAL_SECONDS:
+        return
+    _file_written = time.monotonic()
+    # Write next to the target and rename, so a scraper never reads half a file.
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as scrape_file:
+        scrape_file.write(render())
+    os.replace(temporary, path)
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes would otherwise flood the Streamlit console.
+        pass
@@ -0,0 +1,171 @@
+# utils/names.py
+# This file contains the name matcher used by the games that ask the learner to type
+# a name ("Who Am I?" in the Mahabharata chapter).
+#
+# Names from Sanskrit reach English in many spellings: Yudhishthira, Yudhisthir,
+# Yudhistira; Bhishma, Bhisma, Bheeshm; Krishna, Krsna, Krushna. Comparing lowercased
+# strings rejects all but one of them. A NameIndex instead matches a guess in three
+# steps, each only if the previous one found nothing:
+#
+#   1. exact: the normalized guess (lowercase, no accents, no titles such as "Guru" or
+#      "King") is one of the names or aliases of the roster ("Partha" is Arjuna);
+#   2. phonetic: the guess has the same phonetic key as a name. The key folds the usual
+#      transliteration variants: aspirates (bh/b, th/t...), sibilants (sh/s), long
+#      vowels (ee/i, aa/a), doubled letters, the final schwa (Arjun/Arjuna) and the
+#      vocalic r (Krishna/Krsna);
+#   3. fuzzy: a phonetic key within a small edit distance, found with a bigram index
+#      that narrows the roster down to the few keys worth comparing.
+#
+#   index = NameIndex([("arjuna", ["Arjuna", "Partha"]), ("karna", ["Karna", "Radheya"])])
+#   index.lookup("Arjun")      # Match(key="arjuna", name="Arjuna", method="phonetic", distance=0)
+#
+# The alias table, the phonetic table and the bigram index are built once; a lookup on
+# a roster of hundreds of names costs well under a millisecond.
+
+import re
+import unicodedata
+from collections import namedtuple
+
+Match = namedtuple("Match", ["key", "name", "method", "distance"])
+
+# Words dropped from names and guesses before they are compared.
+TITLES = {"lord", "king", "queen", "prince", "princess", "guru", "sri", "shri", "shree", "maharaja",
+          "raja", "rani", "sage", "rishi", "maharishi", "the", "ji", "mama"}
+
+# Phonetic rules, applied in order to a normalized name without spaces.
+PHONETIC_RULES = [
+    (re.compile(r"x"), "ks"),
+    (re.compile(r"q"), "k"),
+    (re.compile(r"w"), "v"),
+    (re.compile(r"z"), "j"),
+    (re.compile(r"ee|ie"), "i"),
+    (re.compile(r"oo"), "u"),
+    (re.compile(r"chh|ch|c"), "c"),
+    (re.compile(r"sh|s"), "s"),
+    # Aspirated consonants lose their h: bh -> b, dh -> d, th -> t, ...
+    (re.compile(r"([bdtkgpjc])h"), r"\1"),
+    # A remaining h before a consonant is a visarga (Duhshasana): drop it.
+    (re.compile(r"h(?=[^aeiou]|$)"), ""),
+    # Vocalic r: Krishna, Krushna and Krsna all become krsn.
+    (re.compile(r"r[iu](?=[^aeiouy])"), "r"),
+    (re.compile(r"(.)\1+"), r"\1"),
+    # The final schwa is often dropped in Hindi spellings: Arjun, Duryodhan.
+    (re.compile(r"(?<=.)a$"), ""),
+]
+
+
+def normalize(name):
+    """Returns name in lowercase ASCII letters and single spaces, without titles."""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    words = [word for word in re.findall(r"[a-z]+", text) if word not in TITLES]
+    return " ".join(words)
+
+
+def phonetic_key(name):
+    """Returns the transliteration-insensitive key of a name, e.g. "Yudhishthira" -> "yudistir"."""
+    key = normalize(name).replace(" ", "")
+    for pattern, replacement in PHONETIC_RULES:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+def edit_distance(a, b):
+    """Returns the Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def max_distance(key):
+    """Returns how many edits a guess with this phonetic key may be off by."""
+    # A short key one edit away is usually another name ("kam" and "yam"), not a typo.
+    return 0 if len(key) <= 3 else 1 if len(key) <= 5 else 2
+
+
+def bigrams(key):
+    """Returns the bigrams of a key padded with ^ and $, with their counts."""
+    padded = f"^{key}$"
+    counts = {}
+    for i in range(len(padded) - 1):
+        counts[padded[i:i + 2]] = counts.get(padded[i:i + 2], 0) + 1
+    return counts
+
+
+class BigramIndex:
+    """An index of strings by their bigrams, for "which words are within d edits?" queries."""
+
+    def __init__(self, words=()):
+        self._postings = {}
+        for word in dict.fromkeys(words):
+            for gram, count in bigrams(word).items():
+                self._postings.setdefault(gram, []).append((word, count))
+
+    def search(self, word, limit):
+        """Returns (distance, found word) for every word within limit edits, nearest first."""
+        shared = {}
+        for gram, count in bigrams(word).items():
+            for candidate, candidate_count in self._postings.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + min(count, candidate_count)
+        found = []
+        for candidate, common in shared.items():
+            # The q-gram lemma: every edit destroys at most 2 of the len + 1 padded
+            # bigrams, so a word within limit edits shares at least this many of them.
+            if common >= max(len(word), len(candidate)) + 1 - 2 * limit and abs(len(word) - len(candidate)) <= limit:
+                distance = edit_distance(word, candidate)
+                if distance <= limit:
+                    found.append((distance, candidate))
+        return sorted(found)
+
+
+class NameIndex:
+    """A roster of names and aliases, indexed for forgiving lookups."""
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries (iterable): (key, names) pairs; key identifies the person (e.g. an
+                id) and names lists the display name first, then any aliases.
+        """
+        self.names = {}
+        self._exact = {}
+        self._phonetic = {}
+        for key, names in entries:
+            names = list(names)
+            self.names[key] = names[0]
+            for name in names:
+                normalized = normalize(name)
+                if normalized:
+                    self._exact.setdefault(normalized, key)
+                phonetic = phonetic_key(name)
+                if phonetic:
+                    self._phonetic.setdefault(phonetic, []).append(key)
+        self._grams = BigramIndex(self._phonetic)
+
+    def _match(self, keys, method, distance):
+        # Several people may share a key (two Chitrangadas); the first one added wins.
+        return Match(keys[0], self.names[keys[0]], method, distance)
+
+    def lookup(self, guess):
+        """
+        Returns the Match of the person a guess names, or None if it names nobody.
+        """
+        normalized = normalize(guess)
+        if not normalized:
+            return None
+        key = self._exact.get(normalized)
+        if key is not None:
+            return Match(key, self.names[key], "exact", 0)
+        phonetic = phonetic_key(guess)
+        if phonetic in self._phonetic:
+            return self._match(self._phonetic[phonetic], "phonetic", 0)
+        found = self._grams.search(phonetic, max_distance(phonetic))
+        if not found:
+            return None
+        distance, nearest = found[0]
+        return self._match(self._phonetic[nearest], "fuzzy", distance)
@@ -0,0 +1,33 @@
+# utils/paths.py
+# This file contains the locations and the chapter list that the app, the other utils
+# modules and the tools share.
+#
+# It imports nothing from the project, so any module can import it without pulling in
+# the modules that use it (utils/warmup.py imports utils/search.py, which needs the
+# chapter list too):
+#
+#   from utils.paths import CHAPTER_MODULES, PROJECT_ROOT
+
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTENT_ROOT = os.path.join(PROJECT_ROOT, "content")
+
+# Every chapter module with a render(), in the order of the sidebar.
+CHAPTER_MODULES = (
+    "chapters.chapter_1",
+    "chapters.chapter_2",
+    "chapters.chapter_3",
+    "chapters.chapter_4",
+    "chapters.chapter_5",
+    "chapters.chapter_6",
+    "streamlit_chapters.introduction",
+    "streamlit_chapters.chapter_1",
+    "streamlit_chapters.chapter_2",
+    "streamlit_chapters.chapter_3",
+    "streamlit_chapters.chapter_4",
+    "streamlit_chapters.chapter_5",
+    "dharma_sindhu_saga.chapter_0_syllabus",
+    "dharma_sindhu_saga.chapter_1",
+    "dharma_sindhu_saga.chapter_2",
+)
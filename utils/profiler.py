@@ -0,0 +1,238 @@
+# utils/profiler.py
+# This file contains an opt-in profiler that shows where a rerun spends its time.
+#
+# Turn it on for your own session by opening the app with `?profile=1` in the URL,
+# or for every session by starting Streamlit with the environment variable
+# `LESSON_PROFILE=1`. While it is on:
+#
+#   - every lesson part (see utils/lesson.py) is timed,
+#   - every `st.pyplot`, `st.plotly_chart` and `st.dataframe` call is timed and
+#     attributed to the part that made it (for `st.pyplot` this covers rendering
+#     the figure with Agg and serializing it, the usual hot spot),
+#   - the sidebar shows a collapsible breakdown of the last full rerun, and
+#   - every measurement is appended as one JSON object per line to a trace file
+#     (`lesson_profile.jsonl`, or the path in `LESSON_PROFILE_TRACE`).
+#
+# Every script run gets its own run number, including the fragment-only reruns of
+# a single lesson part or widget; their trace entries have the scope "fragment"
+# instead of "app", and they never count towards a full rerun's breakdown.
+#
+# When profiling is off the wrappers cost one dictionary lookup per call.
+
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_ENV_VAR = "LESSON_PROFILE"
+TRACE_ENV_VAR = "LESSON_PROFILE_TRACE"
+DEFAULT_TRACE_PATH = "lesson_profile.jsonl"
+
+# The Streamlit display calls that are timed individually.
+PROFILED_ELEMENTS = ("pyplot", "plotly_chart", "dataframe")
+
+# Session-state key holding the profiler's per-session bookkeeping.
+PROFILE_STATE_KEY = "lesson_profile_state"
+
+_install_lock = threading.Lock()
+_trace_lock = threading.Lock()
+_installed = False
+# The stack of lesson parts running on this script thread, innermost last.
+_local = threading.local()
+
+
+def _env_enabled():
+    return os.environ.get(PROFILE_ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+
+
+def _state():
+    """Returns this session's profiler state, or None if profiling is off."""
+    try:
+        state = st.session_state.get(PROFILE_STATE_KEY)
+    except Exception:
+        # No session (e.g. a bare `python` import): nothing to profile.
+        return None
+    return state if state and state["enabled"] else None
+
+
+def install():
+    """Wraps the profiled Streamlit calls once per process. Safe to call on every run."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        for name in PROFILED_ELEMENTS:
+            # `st.pyplot` is a method bound to the main container when Streamlit is
+            # imported, so both it and the DeltaGenerator method (used by `col.pyplot`
+            # and inside `with col:` blocks via `st.pyplot`) need wrapping.
+            setattr(DeltaGenerator, name, _timed_call(getattr(DeltaGenerator, name), f"st.{name}"))
+            setattr(st, name, _timed_call(getattr(st, name), f"st.{name}"))
+        _installed = True
+
+
+def _timed_call(func, label):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _state() is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record("element", label, time.perf_counter() - start)
+    return wrapper
+
+
+def start_run():
+    """
+    Begins profiling a full rerun. Call it near the top of app.py.
+
+    Reads the `?profile=` query parameter (which is remembered for the session) and
+    the environment variable to decide whether this session is profiled.
+    """
+    install()
+    state = st.session_state.setdefault(
+        PROFILE_STATE_KEY, {"enabled": False, "session": uuid.uuid4().hex[:8], "run": 0}
+    )
+    param = st.query_params.get(PROFILE_QUERY_PARAM)
+    if param is not None:
+        state["enabled"] = param.lower() in ("1", "true", "yes", "on")
+    elif _env_enabled():
+        state["enabled"] = True
+
+    state["run"] += 1
+    state["records"] = []
+    state["scope"] = "app"
+    state["started"] = time.perf_counter()
+    _local.parts = []
+    _local.marker = _run_marker()
+
+
+def _run_marker():
+    """Returns an object that is the same for the whole script run now executing, and new for the next."""
+    # Streamlit gives every script run (full or fragment-only) a fresh `cursors` dict,
+    # as in utils/recorder.py.
+    return getattr(get_script_run_ctx(), "cursors", None)
+
+
+def _start_fragment_run(state):
+    """Starts a new record set when a fragment-only rerun begins; start_run() only sees full runs."""
+    ctx = get_script_run_ctx()
+    if not (ctx and ctx.fragment_ids_this_run):
+        return
+    marker = _run_marker()
+    if marker is getattr(_local, "marker", None):
+        return
+    _local.marker = marker
+    _local.parts = []
+    state["run"] += 1
+    state["records"] = []
+    state["scope"] = "fragment"
+    state["started"] = time.perf_counter()
+
+
+def finish_run(page=None):
+    """
+    Ends profiling a full rerun: records its total time and draws the sidebar overlay.
+
+    Args:
+        page (str, optional): The name of the page or chapter that was rendered.
+    """
+    state = _state()
+    if state is None:
+        return
+    record("run", page or "app", time.perf_counter() - state["started"])
+    _render_overlay(state)
+
+
+def part_started(chapter, part):
+    """Marks the start of a lesson part so element timings can be attributed to it."""
+    state = _state()
+    if state is not None:
+        _start_fragment_run(state)
+    if not hasattr(_local, "parts"):
+        _local.parts = []
+    _local.parts.append((chapter, part))
+
+
+def part_finished(seconds):
+    """Marks the end of the innermost lesson part and records how long it took."""
+    parts = getattr(_local, "parts", [])
+    if parts:
+        chapter, part = parts[-1]
+        record("part", part, seconds, chapter=chapter)
+        parts.pop()
+
+
+def record(kind, name, seconds, chapter=None):
+    """
+    Stores one measurement for the overlay and appends it to the trace file.
+
+    Args:
+        kind (str): "run", "part", "element" or "import" (see utils/deferred.py).
+        name (str): What was measured, e.g. "Mechanism" or "st.pyplot".
+        seconds (float): How long it took.
+        chapter (str, optional): The chapter module. Defaults to the running part's.
+    """
+    state = _state()
+    if state is None:
+        return
+    _start_fragment_run(state)
+    parts = getattr(_local, "parts", [])
+    if chapter is None and parts:
+        chapter = parts[-1][0]
+    entry = {
+        "ts": round(time.time(), 3),
+        "session": state["session"],
+        "run": state["run"],
+        "scope": state.get("scope", "app"),
+        "kind": kind,
+        "name": name,
+        "chapter": chapter,
+        "part": parts[-1][1] if parts and kind == "element" else None,
+        "ms": round(seconds * 1000, 3),
+    }
+    state["records"].append(entry)
+    _append_trace(entry)
+
+
+def _append_trace(entry):
+    path = os.environ.get(TRACE_ENV_VAR, DEFAULT_TRACE_PATH)
+    line = json.dumps(entry, ensure_ascii=False)
+    with _trace_lock:
+        with open(path, "a", encoding="utf-8") as trace:
+            trace.write(line + "\n")
+
+
+def _render_overlay(state):
+    """Draws the collapsible timing breakdown of the last full rerun in the sidebar."""
+    records = state["records"]
+    total = next((r["ms"] for r in reversed(records) if r["kind"] == "run"), 0.0)
+
+    elements = {}
+    for r in records:
+        if r["kind"] == "element":
+            key = (r["part"] or "-", r["name"])
+            count, ms = elements.get(key, (0, 0.0))
+            elements[key] = (count + 1, ms + r["ms"])
+
+    with st.sidebar.expander(f"⏱️ Rerun profile: {total:.0f} ms", expanded=False):
+        st.caption(f"Session `{state['session']}`, run {state['run']}")
+        lines = ["| Lesson part | ms |", "|---|---:|"]
+        lines += [f"| {r['name']} | {r['ms']:.1f} |" for r in records if r["kind"] == "part"]
+        st.markdown("\n".join(lines))
+        if elements:
+            lines = ["| Part | Call | # | ms |", "|---|---|---:|---:|"]
+            lines += [
+                f"| {part} | `{name}` | {count} | {ms:.1f} |"
+                for (part, name), (count, ms) in sorted(elements.items(), key=lambda item: -item[1][1])
+            ]
+            st.markdown("\n".join(lines))
+        st.caption(f"Trace: `{os.environ.get(TRACE_ENV_VAR, DEFAULT_TRACE_PATH)}`")
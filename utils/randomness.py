@@ -0,0 +1,98 @@
+# utils/randomness.py
+# This file contains the randomness of the games: shuffled answer options, random
+# challenges and targets.
+#
+# Drawing with `random.shuffle` or `np.random` in a chapter gives a new draw on every
+# rerun: the options of a quiz reorder under the learner's cursor each time they click
+# anything, and a session that went wrong cannot be played again. Instead, every
+# session gets one seed, and every game draws from its own stream of that seed, named
+# after the chapter and the game ("chapters.chapter_2/shape_shifter"):
+#
+#   order = shuffled(options, f"{__name__}/gita/{scenario}")     # the same on every rerun
+#   name = choice(names, f"{__name__}/shape_shifter")             # the next challenge
+#   target = generator(f"{__name__}/vector_lander").uniform(-4, 4, 2)
+#
+# shuffled() draws an order once per session and stream and keeps it in session
+# state, so reruns reuse it. choice() and generator() continue the stream's
+# numpy.random.Generator, so "New challenge" buttons get a fresh draw on every click.
+# Streams are independent of each other: one game's draws do not depend on how often
+# another game was played.
+#
+# The seed is random unless the URL sets it (`?seed=1234`). The recorder
+# (utils/recorder.py) writes the seed of a recorded session to the trace, and
+# tools/replay_traces.py opens the app with it, so a replayed session draws exactly
+# what the learner saw.
+
+import hashlib
+import secrets
+
+import numpy as np
+import streamlit as st
+
+SEED_QUERY_PARAM = "seed"
+
+# Session-state keys: the session's seed, its streams, and the orders drawn by shuffled().
+SEED_STATE_KEY = "lesson_random_seed"
+STREAMS_STATE_KEY = "lesson_random_streams"
+ORDERS_STATE_KEY = "lesson_random_orders"
+
+
+def session_seed():
+    """Returns this session's seed: the `?seed=` of the URL, or a random one drawn on first use."""
+    seed = st.session_state.get(SEED_STATE_KEY)
+    if seed is None:
+        param = st.query_params.get(SEED_QUERY_PARAM)
+        seed = int(param) if param is not None and param.isdigit() else secrets.randbits(32)
+        st.session_state[SEED_STATE_KEY] = seed
+    return seed
+
+
+def _seed_sequence(stream):
+    # Python's hash() changes from process to process; the stream name is hashed with
+    # sha256 so that the same seed gives the same draws in every process.
+    digest = hashlib.sha256(stream.encode("utf-8")).digest()
+    spawn_key = tuple(int.from_bytes(digest[i:i + 4], "little") for i in range(0, 16, 4))
+    return np.random.SeedSequence(session_seed(), spawn_key=spawn_key)
+
+
+def generator(stream):
+    """
+    Returns this session's random generator for a stream.
+
+    Args:
+        stream (str): The stream's name, e.g. f"{__name__}/vector_lander".
+
+    Returns:
+        numpy.random.Generator: The same generator on every call in a session, so
+            successive draws continue the stream.
+    """
+    streams = st.session_state.setdefault(STREAMS_STATE_KEY, {})
+    rng = streams.get(stream)
+    if rng is None:
+        rng = streams[stream] = np.random.default_rng(_seed_sequence(stream))
+    return rng
+
+
+def choice(options, stream):
+    """Returns the next random item of options (a list) drawn from a stream."""
+    return options[int(generator(stream).integers(len(options)))]
+
+
+def shuffled(items, stream):
+    """
+    Returns items in a random order that is drawn once per session and stream.
+
+    Args:
+        items (iterable): The items, e.g. the options of a quiz question.
+        stream (str): The stream's name; one per question, e.g.
+            f"{__name__}/gita/{scenario}".
+
+    Returns:
+        list: The items, in the same order on every rerun of the session.
+    """
+    items = list(items)
+    orders = st.session_state.setdefault(ORDERS_STATE_KEY, {})
+    order = orders.get(stream)
+    if order is None or len(order) != len(items):
+        order = orders[stream] = np.random.default_rng(_seed_sequence(stream)).permutation(len(items)).tolist()
+    return [items[i] for i in order]
@@ -0,0 +1,198 @@
+# utils/recorder.py
+# This file contains an opt-in recorder of what learners actually do in the app.
+#
+# Turn it on for your own session by opening the app with `?record=1` in the URL,
+# or for every session by starting Streamlit with the environment variable
+# `LESSON_RECORD=1`. While it is on, every widget change and button click is
+# appended as one compact JSON object per line to a trace file
+# (`lesson_interactions.jsonl`, or the path in `LESSON_RECORD_TRACE`):
+#
+#   {"ts":1760000000.123,"s":"3fa2b1c0","r":7,"w":"slider","k":"c2_sl_ang_i","v":45.0}
+#
+#   ts  when the change reached the app (Unix time, seconds)
+#   s   the session id, r the script run it arrived with (changes submitted together,
+#       e.g. by a form, share a run)
+#   w   the widget type, k its key and l its label (for buttons and widgets without a key)
+#   n   which widget with that label it was, when several share it (from 0)
+#   v   the new value (a button click is recorded with the value true)
+#
+# The first line of a session records its random seed (utils/randomness.py) as
+# {"w":"seed","v":1234}, so a replay draws the same shuffles and challenges.
+#
+# `python tools/replay_traces.py` feeds these traces back into headless app
+# instances to reproduce real workloads. Text typed into text inputs is recorded
+# as-is, so only enable the recorder where learners have agreed to it.
+#
+# When recording is off the wrappers cost one dictionary lookup per widget.
+
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.randomness import session_seed
+
+RECORD_QUERY_PARAM = "record"
+RECORD_ENV_VAR = "LESSON_RECORD"
+TRACE_ENV_VAR = "LESSON_RECORD_TRACE"
+DEFAULT_TRACE_PATH = "lesson_interactions.jsonl"
+
+# Widgets whose value changes are recorded, and buttons whose clicks are.
+RECORDED_WIDGETS = (
+    "slider", "select_slider", "number_input", "selectbox", "radio", "checkbox",
+    "toggle", "text_input", "text_area", "multiselect", "color_picker",
+)
+RECORDED_BUTTONS = ("button", "form_submit_button")
+
+# Session-state key holding the recorder's per-session bookkeeping.
+RECORD_STATE_KEY = "lesson_record_state"
+
+_install_lock = threading.Lock()
+_trace_lock = threading.Lock()
+_installed = False
+# The script run the last widget on this thread belonged to.
+_local = threading.local()
+_MISSING = object()
+
+
+def _env_enabled():
+    return os.environ.get(RECORD_ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+
+
+def _state():
+    """Returns this session's recorder state, or None if recording is off."""
+    try:
+        state = st.session_state.get(RECORD_STATE_KEY)
+    except Exception:
+        # No session (e.g. a bare `python` import): nothing to record.
+        return None
+    return state if state and state["enabled"] else None
+
+
+def install():
+    """Wraps the recorded Streamlit widgets once per process. Safe to call on every run."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        for name in RECORDED_WIDGETS + RECORDED_BUTTONS:
+            # Like in utils/profiler.py, both the `st.` shortcut (bound to the main
+            # container) and the DeltaGenerator method need wrapping.
+            setattr(DeltaGenerator, name, _recorded_widget(getattr(DeltaGenerator, name), name))
+            setattr(st, name, _recorded_widget(getattr(st, name), name))
+        _installed = True
+
+
+def _recorded_widget(func, widget):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        value = func(*args, **kwargs)
+        state = _state()
+        if state is not None:
+            label_args = args[1:] if args and isinstance(args[0], DeltaGenerator) else args
+            label = label_args[0] if label_args else kwargs.get("label")
+            _observe(state, widget, kwargs.get("key"), str(label), value)
+        return value
+    return wrapper
+
+
+def start_run():
+    """
+    Prepares recording for this session. Call it near the top of app.py.
+
+    Reads the `?record=` query parameter (which is remembered for the session) and
+    the environment variable to decide whether this session is recorded.
+    """
+    install()
+    state = st.session_state.setdefault(
+        RECORD_STATE_KEY,
+        {"enabled": False, "session": uuid.uuid4().hex[:8], "run": 0, "values": {}, "drawn": set(), "seeded": False},
+    )
+    param = st.query_params.get(RECORD_QUERY_PARAM)
+    if param is not None:
+        state["enabled"] = param.lower() in ("1", "true", "yes", "on")
+    elif _env_enabled():
+        state["enabled"] = True
+    if state["enabled"] and not state["seeded"]:
+        entry = {"ts": round(time.time(), 3), "s": state["session"], "r": 0, "w": "seed", "v": session_seed()}
+        _append_trace(json.dumps(entry, separators=(",", ":")))
+        state["seeded"] = True
+
+
+def _current_run(state):
+    """Returns the number of the script run (full or fragment-only) now executing."""
+    ctx = get_script_run_ctx()
+    # Streamlit gives every script run a fresh `cursors` dict, so it tells runs apart.
+    # Holding on to it also keeps its id from being reused by the next run's dict.
+    marker = getattr(ctx, "cursors", None)
+    if marker is None or marker is not getattr(_local, "marker", None):
+        _local.marker = marker
+        _local.seen = {}
+        state["run"] += 1
+        if not getattr(ctx, "fragment_ids_this_run", None):
+            # A full run: forget widgets that were not on the page since the last
+            # one. Keys such as "q0" are reused by several chapters, and a widget
+            # that comes back shows its default, which is not a learner's change.
+            state["values"] = {ident: v for ident, v in state["values"].items() if ident in state["drawn"]}
+            state["drawn"] = set()
+    return state["run"]
+
+
+def _observe(state, widget, key, label, value):
+    run = _current_run(state)
+    if key is None:
+        # Widgets without a key are told apart by their label and position.
+        occurrence = _local.seen.get((widget, label), 0)
+        _local.seen[(widget, label)] = occurrence + 1
+        ident = f"{widget}:{label}#{occurrence}"
+    else:
+        ident = str(key)
+
+    state["drawn"].add(ident)
+    value = _jsonable(value)
+    if widget in RECORDED_BUTTONS:
+        if value is not True:
+            return
+    else:
+        previous = state["values"].get(ident, _MISSING)
+        state["values"][ident] = value
+        # A widget that was not on the page before shows its default: nothing to record.
+        if previous is _MISSING or previous == value:
+            return
+
+    entry = {"ts": round(time.time(), 3), "s": state["session"], "r": run, "w": widget}
+    if key is not None:
+        entry["k"] = str(key)
+    if key is None or widget in RECORDED_BUTTONS:
+        entry["l"] = label
+    if key is None and occurrence:
+        entry["n"] = occurrence
+    entry["v"] = value
+    try:
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+    except TypeError:
+        # Values such as dates cannot be replayed from JSON; skip them.
+        return
+    _append_trace(line)
+
+
+def _jsonable(value):
+    """Turns tuples (range sliders) and numpy scalars into plain JSON values."""
+    if isinstance(value, tuple):
+        return [_jsonable(item) for item in value]
+    if hasattr(value, "item") and not isinstance(value, (list, dict, str)):
+        return value.item()
+    return value
+
+
+def _append_trace(line):
+    path = os.environ.get(TRACE_ENV_VAR, DEFAULT_TRACE_PATH)
+    with _trace_lock:
+        with open(path, "a", encoding="utf-8") as trace:
+            trace.write(line + "\n")
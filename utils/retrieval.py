@@ -0,0 +1,266 @@
+# utils/retrieval.py
+# This file contains the vector retrieval behind the free-text questions of the
+# lessons ("Describe your own situation" in the Bhagavad Gita game): the learner types
+# a sentence and gets back the few passages of a corpus that are closest to it.
+#
+# A corpus is a JSON list of passages in the content store, in a file whose name ends
+# in ".corpus.json"; every passage has a "ref" and any number of text fields. The
+# passages are turned into TF-IDF vectors (sublinear term frequency, smoothed inverse
+# document frequency, unit length) with the tokenizer of the full-text search, so a
+# query is scored by cosine similarity: one dot product per passage.
+#
+# The vectors are built once and written to RETRIEVAL_CACHE_DIR as a float32 .npy
+# matrix with one row per term, next to a small JSON file with the vocabulary and a
+# fingerprint of the corpus. Later processes memory-map the matrix instead of
+# rebuilding it, as long as the corpus has not changed, and a query only reads the
+# rows of its own terms. Nothing is sent to any service.
+#
+#   index = get_index(os.path.join(chapter_dir(__name__), "gita_teachings.corpus.json"))
+#   for passage, score in index.search("I am anxious about my exam results", k=3):
+#       st.write(passage["ref"], passage["teaching"])
+#
+# tools/build_retrieval_index.py builds every corpus offline and reports the query
+# latency; a query costs well under a millisecond on corpora of this size.
+
+import glob
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+from utils.paths import CONTENT_ROOT, PROJECT_ROOT
+from utils.search import tokenize
+
+RETRIEVAL_CACHE_DIR = os.environ.get("LESSON_RETRIEVAL_CACHE", os.path.join(PROJECT_ROOT, ".cache", "retrieval"))
+INDEX_VERSION = 1
+CORPUS_SUFFIX = ".corpus.json"
+
+# Fields of a passage that are not indexed.
+UNINDEXED_FIELDS = ("ref",)
+
+_lock = threading.Lock()
+_indexes = {}
+
+logger = logging.getLogger(__name__)
+
+
+def corpus_paths(root=CONTENT_ROOT):
+    """Returns the path of every corpus in the content store, sorted."""
+    return sorted(glob.glob(os.path.join(root, "**", f"*{CORPUS_SUFFIX}"), recursive=True))
+
+
+def index_dir(corpus_path):
+    """Returns the directory the index of a corpus is written to."""
+    relative = os.path.relpath(os.path.abspath(corpus_path), CONTENT_ROOT)
+    name = relative[:-len(CORPUS_SUFFIX)] if relative.endswith(CORPUS_SUFFIX) else relative
+    return os.path.join(RETRIEVAL_CACHE_DIR, name.replace(os.sep, "-").replace("..", "_"))
+
+
+def passage_text(passage):
+    """Returns the indexed text of a passage: every field but the unindexed ones."""
+    parts = []
+    for field, value in passage.items():
+        if field in UNINDEXED_FIELDS:
+            continue
+        parts.extend(value if isinstance(value, list) else [str(value)])
+    return "\n".join(parts)
+
+
+def term_weights(terms):
+    """Returns the sublinear term frequency, 1 + log(count), of every distinct term."""
+    counts = {}
+    for term in terms:
+        counts[term] = counts.get(term, 0) + 1
+    return {term: 1 + math.log(count) for term, count in counts.items()}
+
+
+class VectorIndex:
+    """TF-IDF vectors of the passages of a corpus, searched by cosine similarity."""
+
+    def __init__(self, passages, vocabulary, idf, weights, fingerprint):
+        """
+        Args:
+            passages (list): The passages of the corpus, in index order.
+            vocabulary (dict): Term -> its row in weights.
+            idf (numpy.ndarray): The inverse document frequency of every row.
+            weights (numpy.ndarray): Terms x passages; column j is the unit-length
+                vector of passage j. May be a read-only memory map.
+            fingerprint (str): The hash of the corpus the index was built from.
+        """
+        self.passages = passages
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.weights = weights
+        self.fingerprint = fingerprint
+
+    def __len__(self):
+        return len(self.passages)
+
+    def query_vector(self, text):
+        """Returns (rows, weights) of the unit-length query vector; terms the corpus lacks are dropped."""
+        rows = []
+        values = []
+        for term, weight in term_weights(tokenize(text)).items():
+            row = self.vocabulary.get(term)
+            if row is not None:
+                rows.append(row)
+                values.append(weight * self.idf[row])
+        values = np.asarray(values, dtype=np.float32)
+        norm = float(np.linalg.norm(values))
+        return np.asarray(rows, dtype=np.intp), values / norm if norm else values
+
+    def search(self, text, k=3, min_score=0.0):
+        """
+        Returns the k passages closest to a text.
+
+        Args:
+            text (str): The query, in plain words.
+            k (int, optional): The number of passages. Defaults to 3.
+            min_score (float, optional): Leave out passages scored at or below this.
+
+        Returns:
+            list: (passage, cosine similarity) pairs, best first. Empty if no term of
+                the query is in the corpus.
+        """
+        rows, values = self.query_vector(text)
+        if not len(rows):
+            return []
+        # Reads only the query's rows of the (memory-mapped) matrix.
+        scores = values @ self.weights[rows]
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.passages[j], float(scores[j])) for j in best if scores[j] > min_score]
+
+
+def fingerprint(data):
+    """Returns the hash an index stores of its corpus, from the corpus bytes."""
+    digest = hashlib.sha256(f"v{INDEX_VERSION}".encode("utf-8"))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def read_corpus(path):
+    """Returns (passages, fingerprint) of the corpus at path."""
+    with open(path, "rb") as source:
+        data = source.read()
+    return json.loads(data), fingerprint(data)
+
+
+def build_index(passages, corpus_fingerprint=""):
+    """
+    Builds the TF-IDF vectors of a list of passages.
+
+    Returns:
+        VectorIndex: The index, held in memory.
+    """
+    documents = [term_weights(tokenize(passage_text(passage))) for passage in passages]
+    frequencies = {}
+    for document in documents:
+        for term in document:
+            frequencies[term] = frequencies.get(term, 0) + 1
+    vocabulary = {term: row for row, term in enumerate(sorted(frequencies))}
+    count = len(documents)
+    idf = np.array([math.log((1 + count) / (1 + frequencies[term])) + 1 for term in vocabulary], dtype=np.float32)
+    weights = np.zeros((len(vocabulary), count), dtype=np.float32)
+    for column, document in enumerate(documents):
+        for term, weight in document.items():
+            row = vocabulary[term]
+            weights[row, column] = weight * idf[row]
+    norms = np.linalg.norm(weights, axis=0)
+    weights /= np.where(norms > 0, norms, 1)
+    return VectorIndex(passages, vocabulary, idf, weights, corpus_fingerprint)
+
+
+def save_index(index, directory):
+    """Writes an index to directory (atomically, file by file) and returns its size in bytes."""
+    os.makedirs(directory, exist_ok=True)
+    # The weights file is named after the corpus fingerprint, so a reader never pairs
+    # the metadata of one version of the corpus with the weights of another.
+    weights_name = f"weights-{index.fingerprint[:16]}.npy"
+    weights_path = os.path.join(directory, weights_name)
+    with open(f"{weights_path}.tmp", "wb") as target:
+        np.save(target, np.ascontiguousarray(index.weights))
+    os.replace(f"{weights_path}.tmp", weights_path)
+    meta_path = os.path.join(directory, "meta.json")
+    meta = {"version": INDEX_VERSION, "fingerprint": index.fingerprint, "weights": weights_name,
+            "vocabulary": index.vocabulary, "idf": index.idf.tolist()}
+    with open(f"{meta_path}.tmp", "w", encoding="utf-8") as target:
+        json.dump(meta, target, ensure_ascii=False, separators=(",", ":"))
+    os.replace(f"{meta_path}.tmp", meta_path)
+    for name in os.listdir(directory):
+        if name.startswith("weights-") and name != weights_name:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+    return os.path.getsize(weights_path) + os.path.getsize(meta_path)
+
+
+def load_index(passages, corpus_fingerprint, directory):
+    """Returns the index stored in directory, memory-mapped, or None if it is missing or out of date."""
+    try:
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as source:
+            meta = json.load(source)
+        if meta.get("version") != INDEX_VERSION or meta.get("fingerprint") != corpus_fingerprint:
+            return None
+        weights = np.load(os.path.join(directory, meta["weights"]), mmap_mode="r")
+    except (OSError, ValueError, KeyError):
+        return None
+    if weights.shape != (len(meta["vocabulary"]), len(passages)):
+        return None
+    return VectorIndex(passages, meta["vocabulary"], np.asarray(meta["idf"], dtype=np.float32), weights,
+                       corpus_fingerprint)
+
+
+def get_index(corpus_path):
+    """
+    Returns the index of a corpus: loaded from disk when it is up to date, otherwise
+    built and written there. Later calls return the same index until the corpus changes.
+    """
+    path = os.path.abspath(corpus_path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _indexes.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with _lock:
+        cached = _indexes.get(path)
+        if cached is None or cached[0] != stamp:
+            passages, corpus_fingerprint = read_corpus(path)
+            directory = index_dir(path)
+            index = load_index(passages, corpus_fingerprint, directory)
+            if index is None:
+                start = time.perf_counter()
+                index = build_index(passages, corpus_fingerprint)
+                try:
+                    size = save_index(index, directory)
+                    logger.info("Built the retrieval index of %s in %.2f s (%d KB)", os.path.basename(path),
+                                time.perf_counter() - start, size // 1024)
+                except OSError as error:
+                    # A read-only checkout still gets retrieval from the in-memory index.
+                    logger.warning("Could not write the retrieval index to %s: %s", directory, error)
+            cached = (stamp, index)
+            _indexes[path] = cached
+    return cached[1]
+
+
+def build_all():
+    """
+    Loads the index of every corpus in the content store, building the out-of-date ones.
+
+    Returns:
+        list: (corpus path, error message) for every corpus that could not be read.
+    """
+    failures = []
+    for path in corpus_paths():
+        try:
+            get_index(path)
+        except (OSError, ValueError) as error:
+            failures.append((path, str(error)))
+    return failures
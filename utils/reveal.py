@@ -0,0 +1,109 @@
+# utils/reveal.py
+# This file contains the "staged reveal": content that appears in steps, a moment
+# apart, for dramatic pacing ("Calculating..." ... "Done!" ... balloons).
+#
+# Lessons used to pace these moments with `time.sleep`, which holds the server
+# thread for the whole pause and delays every element below it. A staged reveal
+# instead draws its stages in a small timer fragment (`st.fragment(run_every=...)`)
+# that reruns on its own until the last stage is due: each tick draws the stages
+# that are due by then, and the rest of the page, including the lesson part around
+# the reveal, does not rerun. After the last stage the timer is stopped. Nothing
+# waits on the script thread in between.
+#
+# Usage:
+#   if st.button("Decrypt"):
+#       start_reveal("c6_decrypt")
+#   staged_reveal("c6_decrypt", [
+#       (0.0, lambda: st.success("Applying the matrix...")),
+#       (1.0, show_message),
+#   ])
+#
+# Once the last stage has been shown, the reveal stays on the page until the next
+# rerun, exactly like content drawn under an `if st.button(...)` block.
+
+import time
+
+import streamlit as st
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import ThreadState
+
+
+def _state_key(key):
+    return f"{key}_reveal_state"
+
+
+def start_reveal(key):
+    """
+    Starts (or restarts) the staged reveal called `key` from its first stage.
+
+    Safe to use as a widget callback, e.g. `on_change=start_reveal, args=(key,)`.
+    """
+    st.session_state[_state_key(key)] = {"started": time.monotonic(), "finished": False}
+
+
+def cancel_reveal(key):
+    """Stops the staged reveal called `key` and hides its stages."""
+    st.session_state.pop(_state_key(key), None)
+
+
+def staged_reveal(key, stages):
+    """
+    Renders the stages of a reveal that are due and schedules the next one.
+
+    Args:
+        key (str): A unique name for this reveal, the same one passed to start_reveal().
+        stages (list): (delay, render) pairs in display order. `delay` is how many
+            seconds after start_reveal() the stage appears, and `render` is a function
+            with no arguments that draws it.
+
+    Returns:
+        bool: True if every stage was due and has been drawn by this call, False
+            otherwise (including when the later stages are left to the timer, and
+            when the reveal has not been started).
+    """
+    state_key = _state_key(key)
+    state = st.session_state.get(state_key)
+    if state is None:
+        return False
+    if state["finished"]:
+        # The last stage was shown on the previous run; this rerun clears it.
+        del st.session_state[state_key]
+        return False
+
+    elapsed = time.monotonic() - state["started"]
+    pending = [delay for delay, _ in stages if delay > elapsed]
+    if not pending:
+        for _, render in stages:
+            render()
+        state["finished"] = True
+        return True
+
+    # The timer ticks at the shortest wait between two pending stages, so every stage
+    # appears on the first tick after it is due.
+    interval = min(later - earlier for earlier, later in zip([elapsed] + pending, pending))
+    st.fragment(_reveal, run_every=interval)(state_key, stages)
+    return False
+
+
+def _reveal(state_key, stages):
+    """Timer fragment body: draws the stages of a reveal that are due, and stops the timer after the last."""
+    state = st.session_state.get(state_key)
+    if state is not None:
+        elapsed = time.monotonic() - state["started"]
+        for delay, render in stages:
+            if delay > elapsed:
+                return
+            render()
+        state["finished"] = True
+    _stop_timer()
+
+
+def _stop_timer():
+    """Cancels the `run_every` timer of the fragment that is running."""
+    ctx = get_script_run_ctx()
+    fragment_id = ThreadState.get().fragment_id
+    if ctx is not None and fragment_id:
+        msg = ForwardMsg()
+        msg.stop_auto_rerun.fragment_ids.append(fragment_id)
+        ctx.enqueue(msg)
@@ -0,0 +1,421 @@
+# utils/search.py
+# This file contains the full-text search over all three sagas.
+#
+# The searchable unit is a *section* of a chapter: a heading (`st.title`, `st.header`,
+# `st.subheader` or a markdown heading inside a prose block) and all the text a
+# chapter shows under it: the prose blocks of the content store (utils/content.py)
+# and the constant strings given to `st.markdown`, `st.info`, `st.caption`... The
+# sections are read from the chapter sources and the content files; no chapter is
+# imported or rendered to build the index.
+#
+# The index is an inverted index (term -> the sections it appears in, with its count)
+# ranked with BM25. It is built once, written to INDEX_PATH, and loaded from there by
+# later processes as long as the chapters and their content have not changed (the
+# index stores a fingerprint of both). A query only reads the postings of its own
+# terms, so it never scans the lesson text. tools/build_search_index.py rebuilds the
+# index and reports how long indexing took and how large the index is.
+#
+# A result links to `?chapter=<module>#<heading anchor>`. app.py opens such links
+# with open_deep_link() and select_linked_chapter(), and Streamlit scrolls to the
+# heading whose anchor is in the URL.
+
+import ast
+import hashlib
+import heapq
+import importlib.util
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+import urllib.parse
+
+import streamlit as st
+
+from utils.content import get_block, iter_blocks
+from utils.paths import CHAPTER_MODULES, PROJECT_ROOT
+
+INDEX_PATH = os.environ.get("LESSON_SEARCH_INDEX", os.path.join(PROJECT_ROOT, "search_index.json"))
+INDEX_VERSION = 1
+
+# The saga (the sidebar's "Choose your Saga" option) of every chapter package.
+SAGAS = {
+    "chapters": "Eigen-Verse Explorer",
+    "streamlit_chapters": "The Streamlit Saga",
+    "dharma_sindhu_saga": "The Dharma-Kshetra Saga",
+}
+
+CHAPTER_QUERY_PARAM = "chapter"
+# Session-state key of the sidebar's saga radio, and of the deep link already opened.
+SAGA_KEY = "learning_path"
+LINK_STATE_KEY = "search_opened_link"
+
+# Calls that start a section, and calls whose constant text belongs to the current one.
+HEADING_CALLS = ("title", "header", "subheader")
+TEXT_CALLS = ("markdown", "write", "caption", "info", "success", "warning", "error", "text")
+
+# BM25 parameters (the usual defaults), and how much more a heading term counts.
+K1 = 1.2
+B = 0.75
+HEADING_WEIGHT = 3
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from has have how i if in into is it its "
+    "let me my not of on or our so than that the their them then there these they this to "
+    "us was we were what when where which who why will with you your".split()
+)
+MARKDOWN_HEADING = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+LATEX_COMMAND = re.compile(r"\\[A-Za-z]+")
+HTML_TAG = re.compile(r"<[^>]+>")
+URL = re.compile(r"https?://\S+")
+WORD = re.compile(r"\w+")
+
+_lock = threading.Lock()
+_index = None
+
+logger = logging.getLogger(__name__)
+
+
+def tokenize(text):
+    """Splits text into lowercase, lightly stemmed search terms, without stopwords."""
+    text = URL.sub(" ", HTML_TAG.sub(" ", LATEX_COMMAND.sub(" ", text))).lower()
+    terms = []
+    for word in WORD.findall(text.replace("_", " ")):
+        if len(word) < 2 or word in STOPWORDS:
+            continue
+        terms.append(_stem(word))
+    return terms
+
+
+def _stem(word):
+    """Folds plurals onto their singular ("determinants" -> "determinant")."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("ses", "xes", "zes", "ches", "shes")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def heading_anchor(text):
+    """
+    Returns the anchor Streamlit gives a heading with this text.
+
+    Streamlit slugifies the rendered heading: it transliterates to ASCII, splits
+    camelCase, lowercases, drops the apostrophe of "'s" and "'t", and joins the remaining
+    runs of letters and digits with "-".
+    """
+    text = re.sub(r"[*_`~]", " ", text).replace("&", " and ")
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = re.sub(r"([a-z\d])([A-Z])", r"\1 \2", text).lower()
+    text = re.sub(r"([a-z\d])['\u2019]([ts])(?![a-z\d])", r"\1\2", text)
+    return "-".join(re.findall(r"[a-z0-9]+", text))
+
+
+def _constant_text(node):
+    """Returns the first argument of a call if it is a constant string, else None."""
+    if node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+        return node.args[0].value
+    return None
+
+
+def _call_name(node):
+    """Returns "title" for st.title(...) / col.title(...), "prose" for prose(...), else None."""
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    return None
+
+
+def chapter_sections(module):
+    """
+    Reads the sections of one chapter from its source and its content files.
+
+    Args:
+        module (str): The chapter module, e.g. "chapters.chapter_1".
+
+    Returns:
+        tuple: (chapter title, list of sections), where a section is a dict with the
+            keys "anchor", "title", "text" (heading text excluded) and "blocks" (the
+            ids of the content blocks it shows).
+    """
+    path = importlib.util.find_spec(module).origin
+    with open(path, encoding="utf-8") as source:
+        tree = ast.parse(source.read(), filename=path)
+
+    functions = [node for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    chapter_title = None
+    for function in sorted(functions, key=lambda node: node.name != "render"):
+        for node in sorted((n for n in ast.walk(function) if isinstance(n, ast.Call)),
+                           key=lambda n: (n.lineno, n.col_offset)):
+            if _call_name(node) in ("title", "header") and _constant_text(node):
+                chapter_title = _constant_text(node).strip()
+                break
+        if chapter_title:
+            break
+    chapter_title = chapter_title or module
+
+    sections = {}
+
+    def section(title, anchor=None):
+        anchor = heading_anchor(title) if anchor is None else anchor
+        title = " ".join(title.replace("**", "").split())
+        return sections.setdefault(anchor, {"anchor": anchor, "title": title, "text": [], "blocks": []})
+
+    top = section(chapter_title)
+    for function in functions:
+        # Every function starts at the top of the chapter until it draws a heading of its own.
+        current = top
+        for node in sorted((n for n in ast.walk(function) if isinstance(n, ast.Call)),
+                           key=lambda n: (n.lineno, n.col_offset)):
+            name = _call_name(node)
+            text = _constant_text(node)
+            if name in HEADING_CALLS and text and text.strip():
+                anchor = next((kw.value.value for kw in node.keywords if kw.arg == "anchor"
+                               and isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str)), None)
+                current = section(text.strip(), anchor)
+            elif name in TEXT_CALLS and text:
+                current = _add_text(section, current, text)
+            elif name == "prose" and len(node.args) >= 2 and all(
+                    isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in node.args[:2]):
+                block = get_block(module, node.args[0].value, node.args[1].value)
+                current = _add_text(section, current, block.text)
+                current["blocks"].append(block.id)
+    return chapter_title, [s for s in sections.values() if s["text"] or s is not top] or [top]
+
+
+def _add_text(section, current, text):
+    """Adds text to the current section, starting new sections at its markdown headings."""
+    lines = []
+    for line in text.splitlines():
+        match = MARKDOWN_HEADING.match(line.strip())
+        if match:
+            if lines:
+                current["text"].append("\n".join(lines))
+                lines = []
+            current = section(match.group(1))
+        else:
+            lines.append(line)
+    if lines:
+        current["text"].append("\n".join(lines))
+    return current
+
+
+def fingerprint(modules=CHAPTER_MODULES):
+    """Returns a hash of the chapter sources and their content blocks; it changes with either."""
+    digest = hashlib.sha256(f"v{INDEX_VERSION}".encode("utf-8"))
+    for module in modules:
+        with open(importlib.util.find_spec(module).origin, "rb") as source:
+            digest.update(source.read())
+    for block in iter_blocks(modules):
+        digest.update(f"{block.id}:{block.hash}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_index(modules=CHAPTER_MODULES):
+    """
+    Builds the inverted index of every section of the given chapters.
+
+    Returns:
+        dict: The index, ready for search() and for writing to disk as JSON.
+    """
+    start = time.perf_counter()
+    chapters = {}
+    documents = []
+    postings = {}
+    for module in modules:
+        chapter_title, sections = chapter_sections(module)
+        chapters[module] = chapter_title
+        for section in sections:
+            counts = {}
+            for term in tokenize(section["title"]):
+                counts[term] = counts.get(term, 0) + HEADING_WEIGHT
+            for term in tokenize("\n".join(section["text"])):
+                counts[term] = counts.get(term, 0) + 1
+            doc = len(documents)
+            documents.append([module, section["anchor"], section["title"], sum(counts.values()), section["blocks"]])
+            for term, count in counts.items():
+                postings.setdefault(term, []).append([doc, count])
+    return {
+        "version": INDEX_VERSION,
+        "fingerprint": fingerprint(modules),
+        "chapters": chapters,
+        "documents": documents,
+        "average_length": sum(doc[3] for doc in documents) / max(len(documents), 1),
+        "postings": postings,
+        "build_seconds": time.perf_counter() - start,
+    }
+
+
+def save_index(index, path=INDEX_PATH):
+    """Writes the index to disk (atomically, so a reader never sees half a file) and returns its size in bytes."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as target:
+        json.dump(index, target, ensure_ascii=False, separators=(",", ":"))
+    os.replace(temporary, path)
+    return os.path.getsize(path)
+
+
+def load_index(path=INDEX_PATH):
+    """Returns the index stored at path, or None if it is missing, unreadable or out of date."""
+    try:
+        with open(path, encoding="utf-8") as source:
+            index = json.load(source)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION or index.get("fingerprint") != fingerprint():
+        return None
+    return index
+
+
+def get_index():
+    """
+    Returns the search index of this process: loaded from disk when it is up to date,
+    otherwise built and written there. Later calls return the same index.
+    """
+    global _index
+    if _index is not None:
+        return _index
+    with _lock:
+        if _index is None:
+            index = load_index()
+            if index is None:
+                index = build_index()
+                try:
+                    size = save_index(index)
+                    logger.info("Built the search index in %.2f s (%d KB)", index["build_seconds"], size // 1024)
+                except OSError as error:
+                    # A read-only checkout still gets search; it rebuilds in every process.
+                    logger.warning("Could not write the search index to %s: %s", INDEX_PATH, error)
+            _prepare(index)
+            _index = index
+    return _index
+
+
+def _prepare(index):
+    """Adds the inverse document frequency of every term, computed once per process."""
+    count = len(index["documents"])
+    index["idf"] = {
+        term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+        for term, postings in index["postings"].items()
+    }
+
+
+def search(query, limit=8, index=None):
+    """
+    Ranks the sections of all chapters for a query with BM25.
+
+    Args:
+        query (str): Free text, e.g. "session state".
+        limit (int, optional): The most results to return. Defaults to 8.
+        index (dict, optional): The index to search. Defaults to get_index().
+
+    Returns:
+        list: One dict per result, best first, with the keys "chapter" (module),
+            "chapter_title", "title" (section heading), "anchor", "url", "score" and
+            "blocks".
+    """
+    index = index or get_index()
+    if "idf" not in index:
+        _prepare(index)
+    documents = index["documents"]
+    average_length = index["average_length"]
+    scores = {}
+    for term in set(tokenize(query)):
+        idf = index["idf"].get(term)
+        if idf is None:
+            continue
+        for doc, count in index["postings"][term]:
+            length = documents[doc][3]
+            weight = count * (K1 + 1) / (count + K1 * (1 - B + B * length / average_length))
+            scores[doc] = scores.get(doc, 0.0) + idf * weight
+
+    results = []
+    for doc, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1]):
+        module, anchor, title, _, blocks = documents[doc]
+        results.append({
+            "chapter": module,
+            "chapter_title": index["chapters"][module],
+            "title": title,
+            "anchor": anchor,
+            "url": deep_link(module, anchor),
+            "score": score,
+            "blocks": blocks,
+        })
+    return results
+
+
+def snippet(result, query, width=160):
+    """Returns a short excerpt of a result's prose around the first query term, or ""."""
+    terms = set(tokenize(query))
+    for block_id in result["blocks"]:
+        text = get_block(*block_id.split("/")).text
+        plain = " ".join(HTML_TAG.sub(" ", text).replace("*", "").replace("$", "").split())
+        for match in WORD.finditer(plain.lower()):
+            if _stem(match.group()) in terms:
+                start = max(plain.rfind(". ", 0, match.start()) + 2, match.start() - width // 2, 0)
+                excerpt = plain[start:start + width]
+                return ("…" if start else "") + excerpt + ("…" if start + width < len(plain) else "")
+    return ""
+
+
+def deep_link(module, anchor=None):
+    """Returns the app URL (relative) that opens a chapter, scrolled to a heading."""
+    url = f"?{urllib.parse.urlencode({CHAPTER_QUERY_PARAM: module})}"
+    return f"{url}#{anchor}" if anchor else url
+
+
+def open_deep_link():
+    """
+    Selects the saga of a `?chapter=` deep link. Call it before drawing the saga radio
+    (which must use key=SAGA_KEY). A link is only applied once per session, so the
+    learner can navigate away from it.
+
+    Returns:
+        str: The linked chapter module, or None.
+    """
+    module = st.query_params.get(CHAPTER_QUERY_PARAM)
+    if not module or module not in CHAPTER_MODULES or st.session_state.get(LINK_STATE_KEY) == module:
+        return None
+    st.session_state[LINK_STATE_KEY] = module
+    st.session_state[SAGA_KEY] = SAGAS[module.split(".")[0]]
+    return module
+
+
+def select_linked_chapter(module, chapters, key):
+    """
+    Selects the linked chapter in a saga's chapter radio. Call it before drawing the radio.
+
+    Args:
+        module (str): What open_deep_link() returned.
+        chapters (dict): The saga's chapter name -> render function.
+        key (str): The key of the saga's chapter radio.
+    """
+    if module is None:
+        return
+    for name, render in chapters.items():
+        if render is not None and render.__module__ == module:
+            st.session_state[key] = name
+            return
+
+
+def search_box():
+    """Draws the sidebar search field and the links to its results."""
+    query = st.sidebar.text_input("🔎 Search the library", placeholder="determinant, Karma, session state...")
+    if not query.strip():
+        return
+    results = search(query)
+    if not results:
+        st.sidebar.caption("Nothing found. Try another word.")
+        return
+    for result in results:
+        title = result["title"]
+        if title != result["chapter_title"]:
+            title = f"{result['chapter_title']} › {title}"
+        excerpt = snippet(result, query)
+        st.sidebar.markdown(f"[{title}]({result['url']})" + (f"  \n{excerpt}" if excerpt else ""))
@@ -0,0 +1,136 @@
+# utils/static.py
+# This file contains "static blocks": figures and data that never depend on what a
+# learner does, built once per server process and shared by every session.
+#
+# Without them a figure like the Treasure Map in chapter 1 is drawn and encoded as
+# a PNG again on every rerun of every learner. Mark the function that builds it:
+#
+#   @static_figure
+#   def treasure_map():
+#       fig, ax = plt.subplots()
+#       ...
+#       return fig
+#
+#   with col2:
+#       treasure_map()     # shows the figure, built on the first call only
+#
+#   @static_data
+#   def sales_report():
+#       return pd.DataFrame({...})
+#
+#   st.dataframe(sales_report())
+#
+# Results are cached per function, keyed by a hash of the arguments and of the
+# source file of the chapter that defines the function. When the chapter's source
+# changes (an edit during development, or a deploy) the next call rebuilds the
+# block and the results of the old version are dropped, so there is nothing to
+# invalidate by hand.
+#
+# Things to know when writing a static block:
+#   - It must not read widgets or `st.session_state`, and it must not draw anything
+#     itself: the result is shared by all learners.
+#   - A @static_data result is one shared object. Never modify it in place (build
+#     a copy, or style a DataFrame with `.style`, which leaves it untouched).
+#   - Arguments must have a stable `repr()` (numbers, strings, tuples...).
+
+import functools
+import hashlib
+import io
+import os
+import sys
+import threading
+
+import streamlit as st
+
+from utils import metrics
+
+_lock = threading.Lock()
+# (module, function) -> {"version": source hash, "results": {argument hash: result}}
+_blocks = {}
+# (module, function) -> lock held while that block is being built
+_build_locks = {}
+# source path -> (modification time, size, source hash)
+_versions = {}
+
+
+def _code_version(module_name):
+    """Returns a hash of the source file of a module, recomputed when the file changes."""
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if path is None:
+        return ""
+    stat = os.stat(path)
+    cached = _versions.get(path)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        with open(path, "rb") as source:
+            cached = (stat.st_mtime_ns, stat.st_size, hashlib.sha256(source.read()).hexdigest())
+        _versions[path] = cached
+    return cached[2]
+
+
+def _cached(func, args, kwargs):
+    """Returns the result of func(*args, **kwargs), building it only once per code version."""
+    block = (func.__module__, func.__qualname__)
+    version = _code_version(func.__module__)
+    key = hashlib.sha256(repr((args, sorted(kwargs.items()))).encode("utf-8")).hexdigest()
+    name = f"{block[0]}.{block[1]}"
+
+    entry = _blocks.get(block)
+    if entry is not None and entry["version"] == version and key in entry["results"]:
+        metrics.cache_lookup(name, hit=True)
+        return entry["results"][key]
+
+    with _lock:
+        build_lock = _build_locks.setdefault(block, threading.Lock())
+    # Sessions asking for the same block wait for one build instead of each building it.
+    with build_lock:
+        entry = _blocks.get(block)
+        if entry is None or entry["version"] != version:
+            entry = {"version": version, "results": {}}
+            _blocks[block] = entry
+        hit = key in entry["results"]
+        if not hit:
+            entry["results"][key] = func(*args, **kwargs)
+    metrics.cache_lookup(name, hit=hit)
+    return entry["results"][key]
+
+
+def static_data(func):
+    """
+    Decorator for a function that builds data no learner can change (tables, arrays...).
+
+    The result is built once per process and code version and shared by all sessions;
+    never modify it in place.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return _cached(func, args, kwargs)
+    wrapper.clear = lambda: _blocks.pop((func.__module__, func.__qualname__), None)
+    return wrapper
+
+
+def static_figure(func):
+    """
+    Decorator for a function that builds and returns a Matplotlib figure no learner can change.
+
+    Calling the decorated function shows the figure, like `st.pyplot(fig)` would. The
+    figure is rendered to PNG once per process and code version and then closed; every
+    later call only sends the stored image.
+    """
+    def render_png(*args, **kwargs):
+        import matplotlib.pyplot as plt
+
+        fig = func(*args, **kwargs)
+        buffer = io.BytesIO()
+        # The same settings `st.pyplot` uses, so the figure looks the same.
+        fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+        plt.close(fig)
+        return buffer.getvalue()
+
+    render_png.__module__ = func.__module__
+    render_png.__qualname__ = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        st.image(_cached(render_png, args, kwargs), use_container_width=True)
+    wrapper.clear = lambda: _blocks.pop((func.__module__, func.__qualname__), None)
+    return wrapper
@@ -0,0 +1,267 @@
+# utils/timeline.py
+# This file contains the timeline engine behind the history chapters: a store of eras
+# and events, indexed by an interval tree, and a zoomable timeline widget.
+#
+# A timeline is a JSON list of entries (see content/dharma_sindhu_saga/
+# chapter_0_syllabus/haryana_timeline.json). Each entry has a "title", a "start" year
+# (negative years are BCE), and optionally an "end" year (null means "to the present";
+# missing means a single year), a "kind" ("era" or "event"), a "weight" from 1 to 3
+# (how important it is, which decides what is shown when zoomed out), the syllabus
+# "chapter" that covers it, and a "detail" sentence.
+#
+#   timeline = load_timeline(path)                  # parsed and indexed once per file version
+#   timeline.overlapping(-600, -300)                # every entry that touches 600-300 BCE
+#   timeline_explorer(timeline, key="haryana")      # the widget
+#
+# Entries are stored in a centered interval tree, so a range query costs O(log n + k)
+# for k results instead of a scan over every entry. The widget asks only for the
+# entries in the visible window (plus one window on each side, so panning and zooming
+# with the mouse stay smooth in the browser) and draws at most MAX_EVENTS events,
+# picking the most important ones, so a window spanning millennia stays as light as
+# one spanning a decade however many events the timeline holds.
+
+import datetime
+import heapq
+from collections import namedtuple
+
+import streamlit as st
+
+from utils.content import load_json
+from utils.deferred import deferred_import
+
+go = deferred_import("plotly.graph_objects")
+
+Entry = namedtuple("Entry", ["start", "end", "title", "kind", "weight", "chapter", "detail"])
+
+# The zoom levels of the widget: a label and the span of the visible window, in years.
+ZOOM_LEVELS = {
+    "Millennia": 6000,
+    "Centuries": 1500,
+    "Generations": 300,
+    "Decades": 60,
+    "Years": 12,
+}
+# The most events drawn at once; eras are always drawn.
+MAX_EVENTS = 60
+WEIGHT_SIZES = {1: 8, 2: 12, 3: 17}
+ERA_COLORS = ("#f4d03f", "#85c1e9", "#f5b7b1", "#a9dfbf", "#d7bde2", "#fad7a0")
+EVENT_COLOR = "#884ea0"
+
+
+class TimelineError(ValueError):
+    """Raised for an invalid timeline file."""
+
+
+def _chronological(entry):
+    return entry.start, entry.end
+
+
+def format_year(year):
+    """Returns a year for display, e.g. "2600 BCE" or "1526 CE"."""
+    return f"{-year} BCE" if year < 0 else f"{year} CE"
+
+
+class IntervalTree:
+    """
+    A static centered interval tree over items with `start` and `end` attributes
+    (inclusive years).
+    """
+
+    def __init__(self, items):
+        self._root = self._build(list(items))
+
+    def _build(self, items):
+        if not items:
+            return None
+        points = sorted(p for item in items for p in (item.start, item.end))
+        center = points[len(points) // 2]
+        left = [item for item in items if item.end < center]
+        right = [item for item in items if item.start > center]
+        here = [item for item in items if item.start <= center <= item.end]
+        return (
+            center,
+            sorted(here, key=lambda item: item.start),
+            sorted(here, key=lambda item: item.end, reverse=True),
+            self._build(left),
+            self._build(right),
+        )
+
+    def overlapping(self, low, high):
+        """Returns every item whose [start, end] overlaps [low, high], in no particular order."""
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, by_start, by_end, left, right = node
+            if center < low:
+                # Every item here starts before low; it overlaps if it ends after it.
+                for item in by_end:
+                    if item.end < low:
+                        break
+                    found.append(item)
+                stack.append(right)
+            elif center > high:
+                for item in by_start:
+                    if item.start > high:
+                        break
+                    found.append(item)
+                stack.append(left)
+            else:
+                found.extend(by_start)
+                stack.append(left)
+                stack.append(right)
+        return found
+
+
+class Timeline:
+    """Eras and events, indexed for range queries."""
+
+    def __init__(self, entries):
+        present = datetime.date.today().year
+        self.entries = []
+        for raw in entries:
+            try:
+                start = int(raw["start"])
+                end = present if raw.get("end", start) is None else int(raw.get("end", start))
+                entry = Entry(start, end, raw["title"], raw.get("kind", "event"), int(raw.get("weight", 1)),
+                              raw.get("chapter"), raw.get("detail", ""))
+            except (KeyError, TypeError, ValueError) as error:
+                raise TimelineError(f"Invalid timeline entry {raw!r}: {error}") from None
+            if entry.end < entry.start:
+                raise TimelineError(f"'{entry.title}' ends before it starts")
+            self.entries.append(entry)
+        if not self.entries:
+            raise TimelineError("The timeline is empty")
+        self.first = min(entry.start for entry in self.entries)
+        self.last = max(entry.end for entry in self.entries)
+        self._tree = IntervalTree(self.entries)
+        self.lanes = self._assign_lanes([entry for entry in self.entries if entry.kind == "era"])
+
+    @staticmethod
+    def _assign_lanes(eras):
+        """Gives every era the lowest lane free at its start, so overlapping eras stack."""
+        lanes, lane_ends = {}, []
+        for era in sorted(eras, key=_chronological):
+            lane = next((i for i, end in enumerate(lane_ends) if end < era.start), len(lane_ends))
+            if lane == len(lane_ends):
+                lane_ends.append(era.end)
+            else:
+                lane_ends[lane] = era.end
+            lanes[era] = lane
+        return lanes
+
+    def overlapping(self, low, high):
+        """Returns the entries that overlap the years [low, high], in chronological order."""
+        return sorted(self._tree.overlapping(low, high), key=_chronological)
+
+    def window(self, low, high, max_events=MAX_EVENTS):
+        """
+        Returns what to draw for the years [low, high].
+
+        Returns:
+            tuple: (eras, events), each in chronological order. events holds at most
+                max_events entries: the most important ones, earlier ones first on a tie.
+        """
+        found = self._tree.overlapping(low, high)
+        eras = [entry for entry in found if entry.kind == "era"]
+        events = heapq.nlargest(max_events, (entry for entry in found if entry.kind != "era"),
+                                key=lambda entry: (entry.weight, -entry.start))
+        return sorted(eras, key=_chronological), sorted(events, key=_chronological)
+
+
+def load_timeline(path):
+    """
+    Returns the Timeline stored in a JSON file, parsed and indexed on first use and
+    again only when the file changes.
+    """
+    return load_json(path, Timeline)
+
+
+def _ticks(low, high):
+    """Returns (values, labels) of about six round years between low and high."""
+    span = max(high - low, 1)
+    step = next(s for s in (1, 2, 5, 10, 20, 25, 50, 100, 200, 250, 500, 1000, 2000, 5000, 10000)
+                if span / s <= 8)
+    first = -(-low // step) * step
+    values = list(range(first, high + 1, step))
+    return values, [format_year(value) for value in values]
+
+
+def _hover(entry):
+    years = format_year(entry.start) if entry.start == entry.end else \
+        f"{format_year(entry.start)} – {format_year(entry.end)}"
+    chapter = f"<br><i>Chapter {entry.chapter}</i>" if entry.chapter else ""
+    return f"<b>{entry.title}</b><br>{years}<br>{entry.detail}{chapter}"
+
+
+def timeline_figure(timeline, low, high):
+    """Returns the plotly figure of the years [low, high], with one window of margin on each side."""
+    span = high - low
+    eras, events = timeline.window(low - span, high + span)
+    lanes = max((timeline.lanes[era] for era in eras), default=-1) + 1
+
+    fig = go.Figure()
+    if eras:
+        fig.add_trace(go.Bar(
+            base=[era.start for era in eras],
+            x=[max(era.end - era.start, 1) for era in eras],
+            y=[timeline.lanes[era] for era in eras],
+            orientation="h",
+            marker_color=[ERA_COLORS[timeline.lanes[era] % len(ERA_COLORS)] for era in eras],
+            text=[era.title for era in eras],
+            textposition="inside",
+            insidetextanchor="start",
+            hovertext=[_hover(era) for era in eras],
+            hoverinfo="text",
+            name="Eras",
+        ))
+    if events:
+        fig.add_trace(go.Scatter(
+            x=[(event.start + event.end) / 2 for event in events],
+            # Stagger the events over three rows below the eras so close ones stay apart.
+            y=[-1 - (i % 3) * 0.6 for i in range(len(events))],
+            mode="markers+text",
+            marker={"size": [WEIGHT_SIZES.get(event.weight, 8) for event in events], "color": EVENT_COLOR},
+            text=[event.title if event.weight >= 3 else "" for event in events],
+            textposition="top center",
+            hovertext=[_hover(event) for event in events],
+            hoverinfo="text",
+            name="Events",
+        ))
+    tick_values, tick_labels = _ticks(low - span, high + span)
+    fig.update_layout(
+        height=260 + 28 * lanes,
+        margin={"l": 10, "r": 10, "t": 10, "b": 30},
+        showlegend=False,
+        bargap=0.25,
+        dragmode="pan",
+        xaxis={"range": [low, high], "tickvals": tick_values, "ticktext": tick_labels, "showgrid": True},
+        yaxis={"visible": False, "range": [-2.8, lanes + 0.2], "fixedrange": True},
+    )
+    return fig
+
+
+@st.fragment
+def timeline_explorer(timeline, key, default_zoom="Millennia"):
+    """
+    Shows a zoomable timeline. Only the widget reruns when the learner moves it.
+
+    Args:
+        timeline (Timeline): The eras and events.
+        key (str): A unique prefix for the widget keys.
+        default_zoom (str, optional): One of ZOOM_LEVELS. Defaults to "Millennia".
+    """
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        zoom = st.select_slider("Zoom", options=list(ZOOM_LEVELS), value=default_zoom, key=f"{key}_zoom")
+    span = ZOOM_LEVELS[zoom]
+    with col2:
+        center = st.slider("Center of the view (negative years are BCE)", timeline.first, timeline.last,
+                           value=(timeline.first + timeline.last) // 2, key=f"{key}_center")
+    low, high = center - span // 2, center + span // 2
+    st.caption(f"Showing {format_year(low)} – {format_year(high)}. Drag to pan, scroll to zoom, "
+               f"hover for details.")
+    st.plotly_chart(timeline_figure(timeline, low, high), use_container_width=True,
+                    config={"scrollZoom": True, "displaylogo": False})
@@ -0,0 +1,155 @@
+# utils/warmup.py
+# This file contains the cold-start warmup of the server process.
+#
+# Without it the first learner after a deploy or restart pays for importing
+# matplotlib (which also builds or loads its font cache), pandas, plotly and the
+# chapter modules, and for the first Agg render, which loads fonts and glyphs.
+# warm_up() does all of this up front:
+#
+#   1. imports the heavy dependencies and every chapter module,
+#   2. loads the matplotlib font cache and draws one figure with text on the Agg
+#      backend, and
+#   3. loads the search index (utils/search.py), building it if it is out of date,
+#   4. loads the retrieval index of every passage corpus (utils/retrieval.py), building
+#      the ones that are out of date,
+#   5. stores the remote images of the chapters locally (utils/assets.py), and
+#   6. renders every chapter once, headless and with its default widget values, so
+#      anything a chapter keeps in `st.cache_data`/`st.cache_resource` is computed
+#      and every Graphviz diagram is laid out (utils/diagrams.py).
+#
+# serve.py calls it before starting the Streamlit server, so all of this is done
+# before the server accepts its first connection.
+
+import importlib
+import io
+import logging
+import sys
+import threading
+import time
+
+from utils.paths import CHAPTER_MODULES, PROJECT_ROOT
+
+# Dependencies worth importing before the first session needs them.
+HEAVY_MODULES = (
+    "numpy",
+    "pandas",
+    "matplotlib.pyplot",
+    "matplotlib.backends.backend_agg",
+    "plotly.graph_objects",
+)
+
+CHAPTER_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+import {module} as chapter
+chapter.render()
+"""
+
+_lock = threading.Lock()
+_done = False
+
+logger = logging.getLogger(__name__)
+
+
+def import_heavy_modules():
+    """Imports the heavy dependencies and the chapter modules."""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    for name in HEAVY_MODULES + CHAPTER_MODULES:
+        importlib.import_module(name)
+
+
+def prime_matplotlib():
+    """Loads the font cache and draws a figure with text once on the Agg backend."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+
+    matplotlib.use("Agg")
+    font_manager.findfont(font_manager.FontProperties(family=matplotlib.rcParams["font.family"]))
+    fig, ax = plt.subplots(figsize=(4, 3))
+    ax.plot([0, 1], [0, 1], label="warmup")
+    ax.quiver(0, 0, 1, 1, angles="xy", scale_units="xy", scale=1)
+    ax.set_title("Warmup")
+    ax.legend()
+    fig.savefig(io.BytesIO(), format="png")
+    plt.close(fig)
+
+
+def load_search_index():
+    """Loads the search index, or builds and writes it when the chapters changed."""
+    from utils import search
+
+    search.get_index()
+
+
+def load_retrieval_indexes():
+    """Loads the retrieval index of every corpus, building and writing the ones whose corpus changed."""
+    from utils import retrieval
+
+    return retrieval.build_all()
+
+
+def store_assets():
+    """Fetches and stores every remote image the chapters show that is not stored yet."""
+    from utils import assets
+
+    return assets.build_all()
+
+
+def render_chapters():
+    """
+    Renders every chapter once with its default widget values, headless.
+
+    Returns:
+        list: (module, error message) for every chapter that raised.
+    """
+    from streamlit import config
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+
+    # Streamlit logs a warning with a stack trace for every unlabeled widget on
+    # every run; keep them out of the server log, as tools/benchmark_chapters.py does.
+    config.get_config_options()
+    set_log_level("error")
+    failures = []
+    try:
+        for module in CHAPTER_MODULES:
+            at = AppTest.from_string(CHAPTER_SCRIPT.format(root=PROJECT_ROOT, module=module), default_timeout=120)
+            at.run()
+            if at.exception:
+                failures.append((module, at.exception[0].message))
+    finally:
+        set_log_level(config.get_option("logger.level"))
+    return failures
+
+
+def warm_up(render=True):
+    """
+    Runs the warmup steps once per process. Later calls return immediately.
+
+    Args:
+        render (bool, optional): Also render every chapter once. Defaults to True.
+
+    Returns:
+        list: (step, seconds) for every step that ran, empty on later calls.
+    """
+    global _done
+    with _lock:
+        if _done:
+            return []
+        steps = [("imports", import_heavy_modules), ("matplotlib", prime_matplotlib), ("search", load_search_index),
+                 ("retrieval", load_retrieval_indexes), ("assets", store_assets)]
+        if render:
+            steps.append(("chapters", render_chapters))
+        timings = []
+        for name, step in steps:
+            start = time.perf_counter()
+            result = step()
+            timings.append((name, time.perf_counter() - start))
+            for module, message in result or ():
+                # A broken chapter should not keep the server from starting; it
+                # fails the same way for the learner who opens it.
+                logger.warning("Warmup: %s raised: %s", module, message)
+        _done = True
+        return timings